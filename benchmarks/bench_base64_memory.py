@@ -0,0 +1,130 @@
+"""
+Benchmark of the peak memory of DBFS uploads, building request bodies through
+str copies versus straight into buffers.
+
+Every measurement runs in a fresh process against the stand-in DBFS server of
+bench_dbfs_upload and reports the peak RSS of that process (and its growth
+over the RSS after imports):
+- upload: upload_large_file of the whole file in 1 MB blocks
+- put: put_file of a single large payload, where every copy is the size of the payload
+
+The legacy mode builds bodies as before: base64 to bytes, decode to str,
+embed the str in a dict and serialize the dict. The buffer mode encodes the
+payload piece by piece into a preallocated bytearray (base64_json_body).
+
+Usage:
+    python -m benchmarks.bench_base64_memory [--size-mb N] [--put-mb N] [--latency-ms N]
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import logging
+import multiprocessing
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+# Measure the body building, not the client-side rate limit. The rate limiter is
+# built when src.core.ratelimit is imported, so this has to be set before any src import.
+os.environ["RATE_LIMIT_ENABLED"] = "False"
+
+from benchmarks.bench_dbfs_upload import serve  # noqa: E402
+from src.api import dbfs  # noqa: E402
+from src.core.config import settings  # noqa: E402
+from src.core.serialization import dumps_bytes  # noqa: E402
+
+
+def legacy_body(fields: dict, key: str, payload: bytes) -> bytes:
+    """Build a request body the previous way, through a base64 str embedded in a dict."""
+    return dumps_bytes({**fields, key: base64.b64encode(payload).decode("utf-8")})
+
+
+def peak_rss_mb() -> float:
+    """Get the peak RSS of this process in MB (ru_maxrss is in KB on Linux, bytes on macOS)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+
+def measure(args: argparse.Namespace) -> None:
+    """Run one upload in this process and print its peak RSS as JSON."""
+    logging.disable(logging.INFO)
+    settings.DATABRICKS_HOST = args.host
+    if args.body == "legacy":
+        dbfs.base64_json_body = legacy_body
+
+    if args.operation == "put":
+        with open(args.file, "rb") as f:
+            payload = f.read()
+        baseline = peak_rss_mb()
+        started = time.monotonic()
+        asyncio.run(dbfs.put_file("/bench/put.bin", payload))
+    else:
+        baseline = peak_rss_mb()
+        started = time.monotonic()
+        asyncio.run(dbfs.upload_large_file("/bench/upload.bin", args.file))
+
+    print(json.dumps({"baseline": baseline, "peak": peak_rss_mb(), "seconds": time.monotonic() - started}))
+
+
+def write_file(path: str, size_mb: int) -> None:
+    """Write a file of random bytes."""
+    with open(path, "wb") as f:
+        for _ in range(size_mb):
+            f.write(os.urandom(1024 * 1024))
+
+
+def run(operation: str, body: str, path: str, host: str) -> dict:
+    """Measure one operation and body mode in a fresh process."""
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_base64_memory", "--measure", operation,
+         "--body", body, "--file", path, "--host", host],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=int, default=1024, help="Size of the file uploaded in blocks")
+    parser.add_argument("--put-mb", type=int, default=128, help="Size of the payload sent in one put")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Latency of the stand-in server per request")
+    parser.add_argument("--measure", dest="operation", choices=["upload", "put"], help=argparse.SUPPRESS)
+    parser.add_argument("--body", choices=["legacy", "buffer"], help=argparse.SUPPRESS)
+    parser.add_argument("--file", help=argparse.SUPPRESS)
+    parser.add_argument("--host", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.operation:
+        measure(args)
+        return
+
+    port_queue: multiprocessing.Queue = multiprocessing.Queue()
+    server = multiprocessing.Process(target=serve, args=(port_queue, args.latency_ms / 1000), daemon=True)
+    server.start()
+    try:
+        host = f"http://127.0.0.1:{port_queue.get(timeout=10)}"
+        with tempfile.TemporaryDirectory() as directory:
+            files = {"upload": (os.path.join(directory, "upload.bin"), args.size_mb),
+                     "put": (os.path.join(directory, "put.bin"), args.put_mb)}
+            for path, size_mb in files.values():
+                write_file(path, size_mb)
+
+            for operation, (path, size_mb) in files.items():
+                print(f"{operation} of {size_mb} MB")
+                for body in ("legacy", "buffer"):
+                    result = run(operation, body, path, host)
+                    print(
+                        f"  {body:<8} peak RSS {result['peak']:8.1f} MB"
+                        f"  (+{result['peak'] - result['baseline']:7.1f} MB)  {result['seconds']:7.2f} s"
+                    )
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Benchmark of DBFS uploads against a local stand-in DBFS server.
+
+The stand-in server (run in a separate process) implements dbfs/put,
+dbfs/create, dbfs/add-block and dbfs/close, decoding every block, with a configurable
+per-request latency to emulate the round trip to the control plane.
+
+Compares:
+- sequential: read, encode and send one block at a time (the previous upload loop)
+- pipelined: upload_large_file, where reading and encoding overlap the network
+- multi-file: upload_files, several files through concurrent upload handles
+
+Usage:
+    python -m benchmarks.bench_dbfs_upload [--size-mb N] [--files N] [--latency-ms N]
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# The stand-in server is local: measure the pipeline, not the client-side rate
+# limit. The rate limiter is built when src.core.ratelimit is imported, so this
+# has to be set before any src import.
+os.environ["RATE_LIMIT_ENABLED"] = "False"
+
+from src.api import dbfs  # noqa: E402
+from src.core.config import settings  # noqa: E402
+from src.core.utils import make_api_request  # noqa: E402
+
+
+def serve(port_queue: multiprocessing.Queue, latency: float) -> None:
+    """Run the stand-in DBFS server until the process is terminated."""
+    handles = {}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def log_message(self, *args) -> None:
+            pass
+
+        def do_POST(self) -> None:
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])) or b"{}")
+            time.sleep(latency)
+            endpoint = self.path.rsplit("/", 1)[-1]
+            with lock:
+                if endpoint == "create":
+                    handle = len(handles) + 1
+                    handles[handle] = 0
+                    response = {"handle": handle}
+                elif endpoint == "add-block":
+                    handles[body["handle"]] += len(base64.b64decode(body["data"]))
+                    response = {}
+                elif endpoint == "put":
+                    handles[body["path"]] = len(base64.b64decode(body["contents"]))
+                    response = {}
+                elif endpoint == "close":
+                    response = {}
+                else:
+                    self.send_error(404)
+                    return
+            payload = json.dumps(response).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    port_queue.put(server.server_address[1])
+    server.serve_forever()
+
+
+async def upload_sequential(dbfs_path: str, local_file_path: str) -> None:
+    """The previous upload loop: read, encode and send one block at a time."""
+    handle = (await make_api_request("POST", "/api/2.0/dbfs/create", data={"path": dbfs_path, "overwrite": True}))["handle"]
+    with open(local_file_path, "rb") as f:
+        while True:
+            chunk = f.read(dbfs.DBFS_BLOCK_SIZE)
+            if not chunk:
+                break
+            chunk_base64 = base64.b64encode(chunk).decode("utf-8")
+            await make_api_request("POST", "/api/2.0/dbfs/add-block", data={"handle": handle, "data": chunk_base64})
+    await make_api_request("POST", "/api/2.0/dbfs/close", data={"handle": handle})
+
+
+def report(label: str, total_bytes: int, seconds: float, baseline: float) -> None:
+    print(f"  {label:<28} {seconds:8.2f} s  {total_bytes / 1024 / 1024 / seconds:8.1f} MB/s  {baseline / seconds:6.1f}x")
+
+
+async def run(args: argparse.Namespace, directory: str) -> None:
+    size = args.size_mb * 1024 * 1024
+    paths = []
+    for i in range(args.files):
+        path = os.path.join(directory, f"file_{i}.bin")
+        with open(path, "wb") as f:
+            f.write(os.urandom(size))
+        paths.append(path)
+
+    print(f"{args.files} files of {args.size_mb} MB, {args.latency_ms} ms per request")
+
+    started = time.monotonic()
+    for i, path in enumerate(paths):
+        await upload_sequential(f"/bench/sequential_{i}.bin", path)
+    baseline = time.monotonic() - started
+    report("sequential", size * args.files, baseline, baseline)
+
+    started = time.monotonic()
+    for i, path in enumerate(paths):
+        await dbfs.upload_large_file(f"/bench/pipelined_{i}.bin", path)
+    report("pipelined", size * args.files, time.monotonic() - started, baseline)
+
+    started = time.monotonic()
+    result = await dbfs.upload_files(
+        [(path, f"/bench/multi_{i}.bin") for i, path in enumerate(paths)], concurrency=args.concurrency
+    )
+    assert not result["failed"], result
+    report(f"multi-file ({args.concurrency} handles)", size * args.files, time.monotonic() - started, baseline)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=int, default=32, help="Size of each file in MB")
+    parser.add_argument("--files", type=int, default=4, help="Number of files")
+    parser.add_argument("--latency-ms", type=float, default=20, help="Latency of the stand-in server per request")
+    parser.add_argument("--concurrency", type=int, default=4, help="Concurrent upload handles for the multi-file run")
+    args = parser.parse_args()
+
+    port_queue: multiprocessing.Queue = multiprocessing.Queue()
+    server = multiprocessing.Process(target=serve, args=(port_queue, args.latency_ms / 1000), daemon=True)
+    server.start()
+    try:
+        settings.DATABRICKS_HOST = f"http://127.0.0.1:{port_queue.get(timeout=10)}"
+        with tempfile.TemporaryDirectory() as directory:
+            asyncio.run(run(args, directory))
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Benchmark of the JSON paths used to turn Databricks API responses into tool output.
+
+Compares, on realistic payloads:
+- stdlib: json.loads of the response body followed by json.dumps of the result
+- serialization: loads/dumps through src.core.serialization (orjson when installed)
+- raw: passing the response body through as RawJSON without parsing it
+
+Usage:
+    python -m benchmarks.bench_json [--repeat N]
+"""
+
+import argparse
+import json
+import random
+import string
+import timeit
+
+from src.core import serialization
+from src.core.serialization import RawJSON
+
+
+def _word(rng: random.Random, length: int = 12) -> str:
+    return "".join(rng.choices(string.ascii_lowercase, k=length))
+
+
+def clusters_payload(rng: random.Random, count: int = 300) -> dict:
+    """Build a clusters/list response with the fields Databricks returns."""
+    return {
+        "clusters": [
+            {
+                "cluster_id": f"{rng.randint(1000, 9999)}-{rng.randint(100000, 999999)}-{_word(rng, 8)}",
+                "cluster_name": f"cluster-{_word(rng)}",
+                "spark_version": "15.4.x-scala2.12",
+                "node_type_id": rng.choice(["Standard_DS3_v2", "i3.xlarge", "n2-highmem-4"]),
+                "driver_node_type_id": "Standard_DS3_v2",
+                "num_workers": rng.randint(0, 32),
+                "autotermination_minutes": rng.choice([30, 60, 120]),
+                "state": rng.choice(["RUNNING", "TERMINATED", "PENDING"]),
+                "state_message": "",
+                "start_time": rng.randint(1_600_000_000_000, 1_700_000_000_000),
+                "terminated_time": rng.randint(1_600_000_000_000, 1_700_000_000_000),
+                "spark_conf": {f"spark.{_word(rng, 6)}.{_word(rng, 6)}": _word(rng) for _ in range(5)},
+                "custom_tags": {_word(rng, 6): _word(rng) for _ in range(4)},
+                "default_tags": {"Vendor": "Databricks", "Creator": f"{_word(rng)}@example.com"},
+                "creator_user_name": f"{_word(rng)}@example.com",
+                "cluster_source": "UI",
+            }
+            for _ in range(count)
+        ]
+    }
+
+
+def jobs_payload(rng: random.Random, count: int = 2000) -> dict:
+    """Build a jobs/list response with task definitions expanded."""
+    return {
+        "jobs": [
+            {
+                "job_id": rng.randint(1, 10**15),
+                "creator_user_name": f"{_word(rng)}@example.com",
+                "created_time": rng.randint(1_600_000_000_000, 1_700_000_000_000),
+                "settings": {
+                    "name": f"job-{_word(rng)}",
+                    "max_concurrent_runs": 1,
+                    "timeout_seconds": 0,
+                    "format": "MULTI_TASK",
+                    "tags": {_word(rng, 6): _word(rng) for _ in range(3)},
+                    "schedule": {
+                        "quartz_cron_expression": "0 0 * * * ?",
+                        "timezone_id": "UTC",
+                        "pause_status": rng.choice(["PAUSED", "UNPAUSED"]),
+                    },
+                    "tasks": [
+                        {
+                            "task_key": _word(rng),
+                            "notebook_task": {"notebook_path": f"/Repos/{_word(rng)}/{_word(rng)}"},
+                            "existing_cluster_id": f"{rng.randint(1000, 9999)}-{_word(rng, 8)}",
+                        }
+                        for _ in range(rng.randint(1, 4))
+                    ],
+                },
+            }
+            for _ in range(count)
+        ],
+        "has_more": False,
+    }
+
+
+def sql_payload(rng: random.Random, rows: int = 50000, columns: int = 10) -> dict:
+    """Build a JSON_ARRAY statement result, where every value is a string."""
+    return {
+        "statement_id": "01ef-benchmark",
+        "status": {"state": "SUCCEEDED"},
+        "manifest": {
+            "format": "JSON_ARRAY",
+            "schema": {
+                "column_count": columns,
+                "columns": [{"name": f"col_{i}", "type_name": "STRING", "position": i} for i in range(columns)],
+            },
+            "total_row_count": rows,
+        },
+        "result": {
+            "chunk_index": 0,
+            "row_offset": 0,
+            "row_count": rows,
+            "data_array": [
+                [str(rng.random()) if i % 2 else _word(rng, 8) for i in range(columns)]
+                for _ in range(rows)
+            ],
+        },
+    }
+
+
+def bench(name: str, body: bytes, repeat: int) -> None:
+    """Time the three paths on one response body and print the results."""
+
+    def stdlib_path() -> str:
+        return json.dumps(json.loads(body))
+
+    def serialization_path() -> str:
+        return serialization.dumps(serialization.loads(body))
+
+    def raw_path() -> str:
+        return serialization.dumps(RawJSON(body))
+
+    results = {
+        "stdlib": min(timeit.repeat(stdlib_path, number=1, repeat=repeat)),
+        f"serialization ({serialization.BACKEND})": min(timeit.repeat(serialization_path, number=1, repeat=repeat)),
+        "raw passthrough": min(timeit.repeat(raw_path, number=1, repeat=repeat)),
+    }
+    baseline = results["stdlib"]
+    print(f"{name} ({len(body) / 1024 / 1024:.1f} MB)")
+    for label, seconds in results.items():
+        print(f"  {label:<28} {seconds * 1000:9.2f} ms  {baseline / seconds:6.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions per measurement (best is reported)")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    payloads = {
+        "clusters/list": clusters_payload(rng),
+        "jobs/list": jobs_payload(rng),
+        "sql/statements": sql_payload(rng),
+    }
+    print(f"JSON backend: {serialization.BACKEND}")
+    for name, payload in payloads.items():
+        bench(name, json.dumps(payload).encode("utf-8"), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Benchmark of decoding SQL result chunks in JSON_ARRAY versus ARROW_STREAM format.
+
+Builds the same wide numeric table in both formats and compares, per format:
+- payload size of one result chunk
+- decode time of the chunk into the shape returned to the client
+- memory allocated while decoding: the Python heap peak (tracemalloc) plus the
+  Arrow buffers held by the result (Arrow reads IPC buffers zero-copy, so a
+  decoded ARROW_STREAM chunk mostly references the payload itself)
+
+Usage:
+    python -m benchmarks.bench_sql_formats [--rows N] [--columns N] [--repeat N]
+"""
+
+import argparse
+import json
+import random
+import sys
+import timeit
+import tracemalloc
+
+from src.api import sql
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+except ImportError:
+    pa = None
+
+
+def json_chunk(rng: random.Random, rows: int, columns: int) -> bytes:
+    """Build a JSON_ARRAY result chunk, where every value is a string as Databricks returns it."""
+    data = [
+        [str(rng.randint(0, 10**9)) if i % 2 else repr(rng.random()) for i in range(columns)]
+        for _ in range(rows)
+    ]
+    return json.dumps(data).encode("utf-8")
+
+
+def arrow_chunk(rng: random.Random, rows: int, columns: int) -> bytes:
+    """Build an ARROW_STREAM result chunk with the same columns as json_chunk."""
+    arrays = {
+        f"col_{i}": pa.array(
+            [rng.randint(0, 10**9) for _ in range(rows)] if i % 2 else [rng.random() for _ in range(rows)],
+            pa.int64() if i % 2 else pa.float64(),
+        )
+        for i in range(columns)
+    }
+    table = pa.table(arrays)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table, max_chunksize=16384)
+    return sink.getvalue().to_pybytes()
+
+
+def arrow_to_columns(body: bytes) -> dict:
+    """Decode an ARROW_STREAM chunk into the compact column lists returned by execute_sql."""
+    table = sql._decode_chunk("ARROW_STREAM", body)
+    return {
+        name: sql._jsonable_column(column.combine_chunks())
+        for name, column in zip(table.column_names, table.columns)
+    }
+
+
+def peak_memory(fn) -> int:
+    """Run fn once and return the memory it allocated, in bytes."""
+    arrow_before = pa.total_allocated_bytes()
+    tracemalloc.start()
+    try:
+        result = fn()
+        arrow_held = pa.total_allocated_bytes() - arrow_before
+        del result
+        return tracemalloc.get_traced_memory()[1] + arrow_held
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000, help="Rows in the result chunk")
+    parser.add_argument("--columns", type=int, default=40, help="Numeric columns in the result chunk")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions per measurement (best is reported)")
+    args = parser.parse_args()
+
+    if pa is None:
+        sys.exit("pyarrow is required for this benchmark: pip install pyarrow")
+
+    rng = random.Random(42)
+    payloads = {
+        "JSON_ARRAY": json_chunk(rng, args.rows, args.columns),
+        "ARROW_STREAM": arrow_chunk(rng, args.rows, args.columns),
+    }
+    decoders = {
+        "JSON_ARRAY": lambda: sql._decode_chunk("JSON_ARRAY", payloads["JSON_ARRAY"]),
+        "ARROW_STREAM": lambda: sql._decode_chunk("ARROW_STREAM", payloads["ARROW_STREAM"]),
+        "ARROW_STREAM -> columns": lambda: arrow_to_columns(payloads["ARROW_STREAM"]),
+    }
+
+    print(f"{args.rows} rows x {args.columns} numeric columns")
+    baseline = None
+    for label, decode in decoders.items():
+        payload = payloads[label.split(" ")[0]]
+        seconds = min(timeit.repeat(decode, number=1, repeat=args.repeat))
+        peak = peak_memory(decode)
+        baseline = baseline or seconds
+        print(
+            f"  {label:<24} {len(payload) / 1024 / 1024:8.1f} MB payload"
+            f"  {seconds * 1000:9.2f} ms  {baseline / seconds:6.1f}x"
+            f"  {peak / 1024 / 1024:8.1f} MB allocated"
+        )
+
+
+if __name__ == "__main__":
+    main()
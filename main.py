@@ -1,9 +1,12 @@
 from fastmcp import FastMCP
-from src.api import clusters, dbfs, jobs, notebooks, sql
+from src.api import clusters, dbfs, dbfs_sync, dbfs_walk, job_index, jobs, metadata, notebooks, sql, statements
 from typing import Any, Dict, List, Optional
 from mcp.types import TextContent
+from src.core import serialization
+from src.core.cache import get_cache_stats
 from src.core.config import settings
-import json
+from src.core.ratelimit import get_rate_limit_stats
+from src.core.utils import resolve_local_path
 import logging
 
 logger = logging.getLogger(__name__)
@@ -22,11 +25,11 @@ async def list_clusters() -> List[TextContent]:
     """List all Databricks clusters"""
     logger.info(f"Listing clusters")
     try:
-        result = await clusters.list_clusters()
-        return [{"text": json.dumps(result)}]
+        result = await clusters.list_clusters(raw=True)
+        return [{"text": serialization.dumps(result)}]
     except Exception as e:
         logger.error(f"Error listing clusters: {str(e)}")
-        return [{"text": json.dumps({"error": str(e)})}]
+        return [{"text": serialization.dumps({"error": str(e)})}]
 
 @mcp.tool()
 async def create_cluster(cluster_name: str, spark_version: str, node_type_id: str, num_workers: int, autotermination_minutes: int) -> List[TextContent]:
@@ -34,10 +37,10 @@ async def create_cluster(cluster_name: str, spark_version: str, node_type_id: st
     logger.info(f"Creating cluster with params: {params}")
     try:
         result = await clusters.create_cluster(params)
-        return [{"text": json.dumps(result)}]
+        return [{"text": serialization.dumps(result)}]
     except Exception as e:
         logger.error(f"Error creating cluster: {str(e)}")
-        return [{"text": json.dumps({"error": str(e)})}]
+        return [{"text": serialization.dumps({"error": str(e)})}]
 
 @mcp.tool()
 async def terminate_cluster(cluster_id: str) -> List[TextContent]:
@@ -45,21 +48,21 @@ async def terminate_cluster(cluster_id: str) -> List[TextContent]:
     logger.info(f"Terminating cluster with params: {cluster_id}")
     try:
         result = await clusters.terminate_cluster(cluster_id)
-        return [{"text": json.dumps(result)}]
+        return [{"text": serialization.dumps(result)}]
     except Exception as e:
         logger.error(f"Error terminating cluster: {str(e)}")
-        return [{"text": json.dumps({"error": str(e)})}]
+        return [{"text": serialization.dumps({"error": str(e)})}]
 
 @mcp.tool()
 async def get_cluster(cluster_id: str) -> List[TextContent]:
     """Get information about a specific Databricks cluster with parameter: cluster_id (string, required)"""
     logger.info(f"Getting cluster info with params: {cluster_id}")
     try:
-        result = await clusters.get_cluster(cluster_id)
-        return [{"text": json.dumps(result)}]
+        result = await clusters.get_cluster(cluster_id, raw=True)
+        return [{"text": serialization.dumps(result)}]
     except Exception as e:
         logger.error(f"Error getting cluster info: {str(e)}")
-        return [{"text": json.dumps({"error": str(e)})}]
+        return [{"text": serialization.dumps({"error": str(e)})}]
 
 @mcp.tool()
 async def start_cluster(cluster_id: str) -> List[TextContent]:
@@ -67,66 +70,88 @@ async def start_cluster(cluster_id: str) -> List[TextContent]:
     logger.info(f"Starting cluster with params: {cluster_id}")
     try:
         result = await clusters.start_cluster(cluster_id)
-        return [{"text": json.dumps(result)}]
+        return [{"text": serialization.dumps(result)}]
     except Exception as e:
         logger.error(f"Error starting cluster: {str(e)}")
-        return [{"text": json.dumps({"error": str(e)})}]
+        return [{"text": serialization.dumps({"error": str(e)})}]
         
 # Job management tools
 @mcp.tool()
-async def list_jobs() -> List[TextContent]:
-    """List all Databricks jobs"""
-    logger.info(f"Listing jobs")
+async def list_jobs(limit: Optional[int] = 100, name_filter: Optional[str] = None, cursor: Optional[str] = None) -> List[TextContent]:
+    """List Databricks jobs with parameters: limit (integer, optional, maximum number of jobs to return, default 100), name_filter (string, optional, case-insensitive substring of the job name), cursor (string, optional, next_cursor returned by a previous call to continue listing)"""
+    logger.info(f"Listing jobs with params: limit={limit}, name_filter={name_filter}, cursor={cursor}")
     try:
-        result = await jobs.list_jobs()
-        return [{"text": json.dumps(result)}]
+        result = await jobs.list_jobs(limit=limit, name_filter=name_filter, cursor=cursor)
+        return [{"text": serialization.dumps(result)}]
     except Exception as e:
         logger.error(f"Error listing jobs: {str(e)}")
-        return [{"text": json.dumps({"error": str(e)})}]
+        return [{"text": serialization.dumps({"error": str(e)})}]
         
 @mcp.tool()
-async def run_job(job_id: str, job_parameters: Optional[Dict[str, Any]] = None) -> List[TextContent]:
-    """Run a Databricks job with parameters: job_id (string, required), job_parameters (dictionary, optional, job-level parameters)"""
+async def search_jobs(name: Optional[str] = None, tag: Optional[str] = None, creator: Optional[str] = None, schedule_state: Optional[str] = None, limit: Optional[int] = 50) -> List[TextContent]:
+    """Search Databricks jobs from an in-memory index with parameters: name (string, optional, case-insensitive substring of the job name), tag (string, optional, tag key or key:value), creator (string, optional, creator user name), schedule_state (string, optional, one of: UNPAUSED, PAUSED, NONE), limit (integer, optional, default 50)"""
+    logger.info(f"Searching jobs with params: name={name}, tag={tag}, creator={creator}, schedule_state={schedule_state}")
+    try:
+        result = await job_index.search_jobs(name, tag, creator, schedule_state, limit)
+        return [{"text": serialization.dumps(result)}]
+    except Exception as e:
+        logger.error(f"Error searching jobs: {str(e)}")
+        return [{"text": serialization.dumps({"error": str(e)})}]
+        
+@mcp.tool()
+async def run_job(job_id: str, job_parameters: Optional[Dict[str, Any]] = None, idempotency_token: Optional[str] = None) -> List[TextContent]:
+    """Run a Databricks job with parameters: job_id (string, required), job_parameters (dictionary, optional, job-level parameters), idempotency_token (string, optional, guarantees the run is triggered at most once and lets the request be retried safely)"""
     logger.info(f"Running job with params: job_id={job_id}")
     try:
-        result = await jobs.run_job(job_id, job_parameters)
-        return [{"text": json.dumps(result)}]
+        result = await jobs.run_job(job_id, job_parameters, idempotency_token)
+        return [{"text": serialization.dumps(result)}]
     except Exception as e:
         logger.error(f"Error running job: {str(e)}")
-        return [{"text": json.dumps({"error": str(e)})}]
+        return [{"text": serialization.dumps({"error": str(e)})}]
         
 @mcp.tool()
 async def get_job(job_id: str) -> List[TextContent]:
     """Get information about a specific Databricks job with parameter: job_id (string, required)"""
     logger.info(f"Getting job info with params: {job_id}")
     try:
-        result = await jobs.get_job(job_id)
-        return [{"text": json.dumps(result)}]
+        result = await jobs.get_job(job_id, raw=True)
+        return [{"text": serialization.dumps(result)}]
     except Exception as e:
         logger.error(f"Error getting job info: {str(e)}")
-        return [{"text": json.dumps({"error": str(e)})}]
+        return [{"text": serialization.dumps({"error": str(e)})}]
         
 @mcp.tool()
 async def get_run(run_id: str, include_history: Optional[bool] = False) -> List[TextContent]:
     """Get information about a specific job run with parameters: run_id (string, required), include_history (boolean, optional)"""
     logger.info(f"Getting run info with params: run_id={run_id}, include_history={include_history}")
     try:
-        result = await jobs.get_run(run_id, include_history)
-        return [{"text": json.dumps(result)}]
+        result = await jobs.get_run(run_id, include_history, raw=True)
+        return [{"text": serialization.dumps(result)}]
     except Exception as e:
         logger.error(f"Error getting run info: {str(e)}")
-        return [{"text": json.dumps({"error": str(e)})}]        
+        return [{"text": serialization.dumps({"error": str(e)})}]        
+
+@mcp.tool()
+async def wait_for_run(run_id: str, timeout_seconds: Optional[int] = 600) -> List[TextContent]:
+    """Wait for a job run to finish with parameters: run_id (string, required), timeout_seconds (integer, optional, default 600)"""
+    logger.info(f"Waiting for run with params: run_id={run_id}, timeout_seconds={timeout_seconds}")
+    try:
+        result = await jobs.wait_for_run(run_id, timeout_seconds or 600)
+        return [{"text": serialization.dumps(result)}]
+    except Exception as e:
+        logger.error(f"Error waiting for run: {str(e)}")
+        return [{"text": serialization.dumps({"error": str(e)})}]
 
 @mcp.tool()
 async def get_run_output(run_id: str) -> List[TextContent]:
     """Get the output and metadata of a single task run with parameter: run_id (string, required)"""
     logger.info(f"Getting run output with params: run_id={run_id}")
     try:
-        result = await jobs.get_run_output(run_id)
-        return [{"text": json.dumps(result)}]
+        result = await jobs.get_run_output(run_id, raw=True)
+        return [{"text": serialization.dumps(result)}]
     except Exception as e:
         logger.error(f"Error getting run output: {str(e)}")
-        return [{"text": json.dumps({"error": str(e)})}]
+        return [{"text": serialization.dumps({"error": str(e)})}]
         
 @mcp.tool()
 async def repair_run(
@@ -155,10 +180,10 @@ async def repair_run(
             pipeline_params,
             performance_target
         )
-        return [{"text": json.dumps(result)}]
+        return [{"text": serialization.dumps(result)}]
     except Exception as e:
         logger.error(f"Error repairing run: {str(e)}")
-        return [{"text": json.dumps({"error": str(e)})}]
+        return [{"text": serialization.dumps({"error": str(e)})}]
         
 # Notebook management tools
 @mcp.tool()
@@ -166,11 +191,11 @@ async def list_notebooks(path: str) -> List[TextContent]:
     """List notebooks in a workspace directory with parameter: path (string, required)"""
     logger.info(f"Listing notebooks with params: {path}")
     try:
-        result = await notebooks.list_notebooks(path)
-        return [{"text": json.dumps(result)}]
+        result = await notebooks.list_notebooks(path, raw=True)
+        return [{"text": serialization.dumps(result)}]
     except Exception as e:
         logger.error(f"Error listing notebooks: {str(e)}")
-        return [{"text": json.dumps({"error": str(e)})}]
+        return [{"text": serialization.dumps({"error": str(e)})}]
         
 @mcp.tool()
 async def export_notebook(path: str, format: Optional[str] = "SOURCE") -> List[TextContent]:
@@ -185,10 +210,10 @@ async def export_notebook(path: str, format: Optional[str] = "SOURCE") -> List[T
             summary = f"{content[:1000]}... [content truncated, total length: {len(content)} characters]"
             result["content"] = summary
                 
-        return [{"text": json.dumps(result)}]
+        return [{"text": serialization.dumps(result)}]
     except Exception as e:
         logger.error(f"Error exporting notebook: {str(e)}")
-        return [{"text": json.dumps({"error": str(e)})}]
+        return [{"text": serialization.dumps({"error": str(e)})}]
         
 # DBFS tools
 @mcp.tool()
@@ -196,30 +221,200 @@ async def list_files(dbfs_path: str) -> List[TextContent]:
     """List files and directories in a DBFS path with parameter: dbfs_path (string, required)"""
     logger.info(f"Listing files with params: {dbfs_path}")
     try:
-        result = await dbfs.list_files(dbfs_path)
-        return [{"text": json.dumps(result)}]
+        result = await dbfs.list_files(dbfs_path, raw=True)
+        return [{"text": serialization.dumps(result)}]
     except Exception as e:
         logger.error(f"Error listing files: {str(e)}")
-        return [{"text": json.dumps({"error": str(e)})}]
+        return [{"text": serialization.dumps({"error": str(e)})}]
+
+@mcp.tool()
+async def download_file(dbfs_path: str, local_path: str, overwrite: Optional[bool] = False) -> List[TextContent]:
+    """Download a DBFS file to the local file system of the server, reading ranges in parallel, with parameters: dbfs_path (string, required), local_path (string, required, relative to or inside LOCAL_FILE_ROOT), overwrite (boolean, optional, default false)"""
+    logger.info(f"Downloading file with params: dbfs_path={dbfs_path}, local_path={local_path}")
+    try:
+        result = await dbfs.download_file(dbfs_path, resolve_local_path(local_path), bool(overwrite))
+        return [{"text": serialization.dumps(result)}]
+    except Exception as e:
+        logger.error(f"Error downloading file: {str(e)}")
+        return [{"text": serialization.dumps({"error": str(e)})}]
+
+@mcp.tool()
+async def walk_dbfs(dbfs_path: str, max_depth: Optional[int] = None, pattern: Optional[str] = None, exclude: Optional[List[str]] = None, entry_type: Optional[str] = None, max_results: Optional[int] = 1000) -> List[TextContent]:
+    """List a DBFS directory tree recursively, listing directories in parallel, with parameters: dbfs_path (string, required), max_depth (integer, optional, deepest level to list where the children of dbfs_path are at depth 1, default unlimited), pattern (string, optional, glob pattern matched against entry names, or full paths if it contains a slash), exclude (list of strings, optional, glob patterns of entries and subtrees to skip), entry_type (string, optional, file or dir), max_results (integer, optional, default 1000)"""
+    logger.info(f"Walking DBFS with params: dbfs_path={dbfs_path}, max_depth={max_depth}, pattern={pattern}")
+    try:
+        result = await dbfs_walk.walk(dbfs_path, max_depth, pattern, exclude, entry_type, max_results or 1000)
+        return [{"text": serialization.dumps(result)}]
+    except Exception as e:
+        logger.error(f"Error walking DBFS: {str(e)}")
+        return [{"text": serialization.dumps({"error": str(e)})}]
+
+@mcp.tool()
+async def du_dbfs(dbfs_path: str, max_depth: Optional[int] = None, exclude: Optional[List[str]] = None, top: Optional[int] = 20) -> List[TextContent]:
+    """Get the total size and file count of a DBFS directory tree and its largest subdirectories, with parameters: dbfs_path (string, required), max_depth (integer, optional, deepest level to count, default unlimited), exclude (list of strings, optional, glob patterns of entries and subtrees to skip), top (integer, optional, number of largest children to report, default 20)"""
+    logger.info(f"Measuring DBFS disk usage with params: dbfs_path={dbfs_path}, max_depth={max_depth}")
+    try:
+        result = await dbfs_walk.disk_usage(dbfs_path, max_depth, exclude, top or 20)
+        return [{"text": serialization.dumps(result)}]
+    except Exception as e:
+        logger.error(f"Error measuring DBFS disk usage: {str(e)}")
+        return [{"text": serialization.dumps({"error": str(e)})}]
+
+@mcp.tool()
+async def find_dbfs(dbfs_path: str, pattern: str, max_depth: Optional[int] = None, exclude: Optional[List[str]] = None, entry_type: Optional[str] = None, max_results: Optional[int] = 100) -> List[TextContent]:
+    """Find files and directories matching a glob pattern in a DBFS directory tree, returning at most max_results matches (truncated is set if more exist), with parameters: dbfs_path (string, required), pattern (string, required, glob pattern matched against entry names such as _SUCCESS or *.parquet, or full paths if it contains a slash), max_depth (integer, optional, default unlimited), exclude (list of strings, optional, glob patterns of entries and subtrees to skip), entry_type (string, optional, file or dir), max_results (integer, optional, default 100)"""
+    logger.info(f"Finding in DBFS with params: dbfs_path={dbfs_path}, pattern={pattern}")
+    try:
+        result = await dbfs_walk.find(dbfs_path, pattern, max_depth, exclude, entry_type, max_results or 100)
+        return [{"text": serialization.dumps(result)}]
+    except Exception as e:
+        logger.error(f"Error finding in DBFS: {str(e)}")
+        return [{"text": serialization.dumps({"error": str(e)})}]
+
+@mcp.tool()
+async def sync_to_dbfs(local_path: str, dbfs_path: str, delete: Optional[bool] = False, dry_run: Optional[bool] = False, checksum: Optional[bool] = False, exclude: Optional[List[str]] = None) -> List[TextContent]:
+    """Synchronize a local directory of the server to a DBFS directory, uploading only new and changed files in parallel, with parameters: local_path (string, required, relative to or inside LOCAL_FILE_ROOT), dbfs_path (string, required), delete (boolean, optional, delete DBFS files and directories that do not exist locally, default false), dry_run (boolean, optional, report the plan without changing anything, default false), checksum (boolean, optional, compare files by content hash kept in a manifest on DBFS instead of modification time, default false), exclude (list of strings, optional, glob patterns of files and directories to leave out)"""
+    logger.info(f"Synchronizing to DBFS with params: local_path={local_path}, dbfs_path={dbfs_path}, delete={delete}, dry_run={dry_run}")
+    try:
+        result = await dbfs_sync.sync_to_dbfs(resolve_local_path(local_path), dbfs_path, bool(delete), bool(dry_run), bool(checksum), exclude)
+        return [{"text": serialization.dumps(result)}]
+    except Exception as e:
+        logger.error(f"Error synchronizing to DBFS: {str(e)}")
+        return [{"text": serialization.dumps({"error": str(e)})}]
         
 # SQL tools
 @mcp.tool()
-async def execute_sql(statement: str, warehouse_id: str, catalog: Optional[str] = None, schema: Optional[str] = None) -> List[TextContent]:
-    """Execute a SQL statement with parameters: statement (string, required), warehouse_id (string, required), catalog (string, optional), schema (string, optional)"""
+async def execute_sql(statement: str, warehouse_id: str, catalog: Optional[str] = None, schema: Optional[str] = None, disposition: Optional[str] = "INLINE", row_limit: Optional[int] = 10000, format: Optional[str] = "JSON_ARRAY", output: Optional[str] = "columns", cursor: Optional[str] = None, page_size: Optional[int] = None, use_cache: Optional[bool] = None) -> List[TextContent]:
+    """Execute a SQL statement with parameters: statement (string, required), warehouse_id (string, required), catalog (string, optional), schema (string, optional), disposition (string, optional, INLINE for results up to 25 MB or EXTERNAL_LINKS to download large results in parallel chunks, default INLINE), row_limit (integer, optional, maximum number of rows to return, default 10000), format (string, optional, JSON_ARRAY or ARROW_STREAM for compact columnar results, which implies EXTERNAL_LINKS, default JSON_ARRAY), output (string, optional, columns or csv, how ARROW_STREAM results are returned, default columns), cursor (string, optional, next_cursor of a previous INLINE result page to read the next page without re-executing the statement), page_size (integer, optional, rows per INLINE result page, default 1000), use_cache (boolean, optional, reuse the cached result of an identical read-only statement, flagged with cache_hit, default from SQL_RESULT_CACHE_ENABLED)"""
     logger.info(f"Executing SQL with params: {statement}")
     try:
+        page_size = page_size or settings.SQL_PAGE_ROWS
+        if cursor:
+            result = await sql.read_result_page(cursor=cursor, page_size=page_size)
+            return [{"text": serialization.dumps(result)}]
+        
+        format = format or "JSON_ARRAY"
+        disposition = "EXTERNAL_LINKS" if format == "ARROW_STREAM" else disposition or "INLINE"
         result = await sql.execute_statement(
             statement=statement,
             warehouse_id=warehouse_id,
             catalog=catalog,
-            schema=schema
+            schema=schema,
+            row_limit=row_limit or 10000,
+            disposition=disposition,
+            format=format,
+            use_cache=use_cache,
         )
-        return [{"text": json.dumps(result)}]
+        if disposition == "EXTERNAL_LINKS" and result.get("status", {}).get("state") == "SUCCEEDED":
+            if format == "ARROW_STREAM":
+                result = await sql.collect_arrow_result(result, row_limit, output or "columns")
+            else:
+                result = await sql.collect_external_link_result(result, row_limit)
+        elif result.get("status", {}).get("state") == "SUCCEEDED":
+            result = await sql.read_result_page(result, page_size=page_size)
+        return [{"text": serialization.dumps(result)}]
     except Exception as e:
         logger.error(f"Error executing SQL: {str(e)}")
-        return [{"text": json.dumps({"error": str(e)})}]
+        return [{"text": serialization.dumps({"error": str(e)})}]
 
 
+@mcp.tool()
+async def submit_sql(statement: str, warehouse_id: str, catalog: Optional[str] = None, schema: Optional[str] = None, disposition: Optional[str] = "INLINE", row_limit: Optional[int] = 10000, format: Optional[str] = "JSON_ARRAY") -> List[TextContent]:
+    """Submit a SQL statement without waiting for it to finish, with parameters: statement (string, required), warehouse_id (string, required), catalog (string, optional), schema (string, optional), disposition (string, optional, INLINE or EXTERNAL_LINKS, default INLINE), row_limit (integer, optional, default 10000), format (string, optional, JSON_ARRAY or ARROW_STREAM, which implies EXTERNAL_LINKS, default JSON_ARRAY). Use poll_sql, fetch_sql_results and cancel_sql with the returned statement_id"""
+    logger.info(f"Submitting SQL with params: {statement}")
+    try:
+        format = format or "JSON_ARRAY"
+        result = await statements.submit(
+            statement=statement,
+            warehouse_id=warehouse_id,
+            catalog=catalog,
+            schema=schema,
+            row_limit=row_limit or 10000,
+            disposition="EXTERNAL_LINKS" if format == "ARROW_STREAM" else disposition or "INLINE",
+            format=format,
+        )
+        return [{"text": serialization.dumps(result)}]
+    except Exception as e:
+        logger.error(f"Error submitting SQL: {str(e)}")
+        return [{"text": serialization.dumps({"error": str(e)})}]
+
+@mcp.tool()
+async def poll_sql(statement_id: Optional[str] = None) -> List[TextContent]:
+    """Get the state of a submitted SQL statement with parameters: statement_id (string, optional, lists all submitted statements if not set)"""
+    logger.info(f"Polling SQL statement: {statement_id}")
+    try:
+        result = await statements.poll(statement_id)
+        return [{"text": serialization.dumps(result)}]
+    except Exception as e:
+        logger.error(f"Error polling SQL statement: {str(e)}")
+        return [{"text": serialization.dumps({"error": str(e)})}]
+
+@mcp.tool()
+async def fetch_sql_results(statement_id: str, cursor: Optional[str] = None, page_size: Optional[int] = None, max_rows: Optional[int] = 10000, output: Optional[str] = "columns") -> List[TextContent]:
+    """Fetch the results of a finished SQL statement with parameters: statement_id (string, required), cursor (string, optional, next_cursor of a previous page), page_size (integer, optional, rows per INLINE result page, default 1000), max_rows (integer, optional, maximum rows of an EXTERNAL_LINKS result, default 10000), output (string, optional, columns or csv for ARROW_STREAM results, default columns)"""
+    logger.info(f"Fetching results of SQL statement: {statement_id}")
+    try:
+        result = await statements.fetch_results(statement_id, cursor, page_size, max_rows, output or "columns")
+        return [{"text": serialization.dumps(result)}]
+    except Exception as e:
+        logger.error(f"Error fetching SQL results: {str(e)}")
+        return [{"text": serialization.dumps({"error": str(e)})}]
+
+@mcp.tool()
+async def cancel_sql(statement_id: str) -> List[TextContent]:
+    """Cancel a running SQL statement with parameters: statement_id (string, required)"""
+    logger.info(f"Cancelling SQL statement: {statement_id}")
+    try:
+        result = await statements.cancel(statement_id)
+        return [{"text": serialization.dumps(result)}]
+    except Exception as e:
+        logger.error(f"Error cancelling SQL statement: {str(e)}")
+        return [{"text": serialization.dumps({"error": str(e)})}]
+
+@mcp.tool()
+async def list_tables(catalog: str, schema: Optional[str] = None, name_filter: Optional[str] = None, limit: Optional[int] = 200) -> List[TextContent]:
+    """List Unity Catalog tables from an in-memory metadata index with parameters: catalog (string, required), schema (string, optional, all schemas of the catalog if not set), name_filter (string, optional, case-insensitive substring of the table name), limit (integer, optional, default 200)"""
+    logger.info(f"Listing tables with params: catalog={catalog}, schema={schema}, name_filter={name_filter}")
+    try:
+        result = await metadata.list_tables(catalog, schema, name_filter, limit or 200)
+        return [{"text": serialization.dumps(result)}]
+    except Exception as e:
+        logger.error(f"Error listing tables: {str(e)}")
+        return [{"text": serialization.dumps({"error": str(e)})}]
+
+@mcp.tool()
+async def describe_table(full_name: str) -> List[TextContent]:
+    """Describe a Unity Catalog table and its columns from an in-memory metadata index with parameters: full_name (string, required, catalog.schema.table)"""
+    logger.info(f"Describing table with params: full_name={full_name}")
+    try:
+        result = await metadata.describe_table(full_name)
+        return [{"text": serialization.dumps(result)}]
+    except Exception as e:
+        logger.error(f"Error describing table: {str(e)}")
+        return [{"text": serialization.dumps({"error": str(e)})}]
+
+@mcp.tool()
+async def search_columns(query: str, catalog: Optional[str] = None, schema: Optional[str] = None, limit: Optional[int] = 100) -> List[TextContent]:
+    """Search Unity Catalog columns by name from an in-memory metadata index with parameters: query (string, required, case-insensitive substring of the column name), catalog (string, optional, all catalogs if not set), schema (string, optional), limit (integer, optional, default 100)"""
+    logger.info(f"Searching columns with params: query={query}, catalog={catalog}, schema={schema}")
+    try:
+        result = await metadata.search_columns(query, catalog, schema, limit or 100)
+        return [{"text": serialization.dumps(result)}]
+    except Exception as e:
+        logger.error(f"Error searching columns: {str(e)}")
+        return [{"text": serialization.dumps({"error": str(e)})}]
+
+@mcp.tool()
+async def server_stats() -> List[TextContent]:
+    """Get the metrics of the server's response cache (hit rate, size, disk tier) and client-side rate limiter (time spent waiting per API family), without parameters"""
+    logger.info("Getting server stats")
+    try:
+        result = {"cache": get_cache_stats(), "rate_limit": get_rate_limit_stats()}
+        return [{"text": serialization.dumps(result)}]
+    except Exception as e:
+        logger.error(f"Error getting server stats: {str(e)}")
+        return [{"text": serialization.dumps({"error": str(e)})}]
+
 # // ---- END TOOLS ---- //
 
 
@@ -3,8 +3,9 @@ API for managing Databricks clusters.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
+from src.core.serialization import RawJSON
 from src.core.utils import DatabricksAPIError, make_api_request
 
 # Configure logging
@@ -25,7 +26,7 @@ async def create_cluster(cluster_config: Dict[str, Any]) -> Dict[str, Any]:
         DatabricksAPIError: If the API request fails
     """
     logger.info("Creating new cluster")
-    return make_api_request("POST", "/api/2.0/clusters/create", data=cluster_config)
+    return await make_api_request("POST", "/api/2.0/clusters/create", data=cluster_config)
 
 
 async def terminate_cluster(cluster_id: str) -> Dict[str, Any]:
@@ -42,13 +43,16 @@ async def terminate_cluster(cluster_id: str) -> Dict[str, Any]:
         DatabricksAPIError: If the API request fails
     """
     logger.info(f"Terminating cluster: {cluster_id}")
-    return make_api_request("POST", "/api/2.0/clusters/delete", data={"cluster_id": cluster_id})
+    return await make_api_request("POST", "/api/2.0/clusters/delete", data={"cluster_id": cluster_id})
 
 
-async def list_clusters() -> Dict[str, Any]:
+async def list_clusters(raw: bool = False) -> Union[Dict[str, Any], RawJSON]:
     """
     List all Databricks clusters.
     
+    Args:
+        raw: Return the unparsed response body as RawJSON instead of a dictionary
+        
     Returns:
         Response containing a list of clusters
         
@@ -56,15 +60,16 @@ async def list_clusters() -> Dict[str, Any]:
         DatabricksAPIError: If the API request fails
     """
     logger.info("Listing all clusters")
-    return make_api_request("GET", "/api/2.0/clusters/list")
+    return await make_api_request("GET", "/api/2.0/clusters/list", raw=raw)
 
 
-async def get_cluster(cluster_id: str) -> Dict[str, Any]:
+async def get_cluster(cluster_id: str, raw: bool = False) -> Union[Dict[str, Any], RawJSON]:
     """
     Get information about a specific cluster.
     
     Args:
         cluster_id: ID of the cluster
+        raw: Return the unparsed response body as RawJSON instead of a dictionary
         
     Returns:
         Response containing cluster information
@@ -73,7 +78,7 @@ async def get_cluster(cluster_id: str) -> Dict[str, Any]:
         DatabricksAPIError: If the API request fails
     """
     logger.info(f"Getting information for cluster: {cluster_id}")
-    return make_api_request("GET", "/api/2.0/clusters/get", params={"cluster_id": cluster_id})
+    return await make_api_request("GET", "/api/2.0/clusters/get", params={"cluster_id": cluster_id}, raw=raw)
 
 
 async def start_cluster(cluster_id: str) -> Dict[str, Any]:
@@ -90,7 +95,7 @@ async def start_cluster(cluster_id: str) -> Dict[str, Any]:
         DatabricksAPIError: If the API request fails
     """
     logger.info(f"Starting cluster: {cluster_id}")
-    return make_api_request("POST", "/api/2.0/clusters/start", data={"cluster_id": cluster_id})
+    return await make_api_request("POST", "/api/2.0/clusters/start", data={"cluster_id": cluster_id})
 
 
 async def resize_cluster(cluster_id: str, num_workers: int) -> Dict[str, Any]:
@@ -108,7 +113,7 @@ async def resize_cluster(cluster_id: str, num_workers: int) -> Dict[str, Any]:
         DatabricksAPIError: If the API request fails
     """
     logger.info(f"Resizing cluster {cluster_id} to {num_workers} workers")
-    return make_api_request(
+    return await make_api_request(
         "POST", 
         "/api/2.0/clusters/resize", 
         data={"cluster_id": cluster_id, "num_workers": num_workers}
@@ -129,4 +134,4 @@ async def restart_cluster(cluster_id: str) -> Dict[str, Any]:
         DatabricksAPIError: If the API request fails
     """
     logger.info(f"Restarting cluster: {cluster_id}")
-    return make_api_request("POST", "/api/2.0/clusters/restart", data={"cluster_id": cluster_id}) 
\ No newline at end of file
+    return await make_api_request("POST", "/api/2.0/clusters/restart", data={"cluster_id": cluster_id}) 
\ No newline at end of file
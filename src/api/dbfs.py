@@ -2,16 +2,24 @@
 API for managing Databricks File System (DBFS).
 """
 
-import base64
+import asyncio
+import hashlib
 import logging
 import os
-from typing import Any, Dict, List, Optional, BinaryIO
+import threading
+import time
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, Union, BinaryIO
 
-from src.core.utils import DatabricksAPIError, make_api_request
+from src.core.config import settings
+from src.core.serialization import RawJSON, base64_json_body, dumps_bytes, loads, loads_base64_field
+from src.core.utils import DatabricksAPIError, make_api_request, stream_api_request
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Maximum amount of data per dbfs/add-block call allowed by the API
+DBFS_BLOCK_SIZE = 1024 * 1024
+
 
 async def put_file(
     dbfs_path: str,
@@ -34,37 +42,322 @@ async def put_file(
     """
     logger.info(f"Uploading file to DBFS path: {dbfs_path}")
     
-    # Convert bytes to base64
-    content_base64 = base64.b64encode(file_content).decode("utf-8")
+    # Encode the content straight into the request body
+    body = base64_json_body({"path": dbfs_path, "overwrite": overwrite}, "contents", file_content)
+    
+    return await make_api_request("POST", "/api/2.0/dbfs/put", body=body)
+
+
+async def _read_blocks(local_file_path: str, block_size: int, offset: int, queue: asyncio.Queue) -> None:
+    """Reader stage: read the file block by block from an offset, in a worker thread."""
+    with open(local_file_path, "rb") as f:
+        f.seek(offset)
+        while True:
+            block = await asyncio.to_thread(f.read, block_size)
+            await queue.put(block)
+            if not block:
+                return
+
+
+def _encode_block(handle: int, block: bytes, hashed: bool) -> Tuple[int, bytearray, Optional[str]]:
+    """Build the add-block request body of a block, and hash the block if asked to."""
+    digest = hashlib.sha256(block).hexdigest() if hashed else None
+    return len(block), base64_json_body({"handle": handle}, "data", block), digest
+
+
+async def _encode_blocks(raw_queue: asyncio.Queue, encoded_queue: asyncio.Queue, handle: int, hashed: bool) -> None:
+    """Encoder stage: build the add-block request bodies of the blocks read, in a worker thread."""
+    while True:
+        block = await raw_queue.get()
+        if not block:
+            await encoded_queue.put(None)
+            return
+        await encoded_queue.put(await asyncio.to_thread(_encode_block, handle, block, hashed))
+
+
+async def _iter_encoded_blocks(
+    local_file_path: str,
+    block_size: int,
+    handle: int,
+    offset: int = 0,
+    hashed: bool = False,
+) -> AsyncIterator[Tuple[int, bytearray, Optional[str]]]:
+    """
+    Read and encode a file ahead of the sender, through bounded queues.
+    
+    Reading, encoding and sending overlap, while at most DBFS_UPLOAD_QUEUE_BLOCKS
+    blocks wait in each queue.
+    
+    Yields:
+        Tuples of the raw block size, the add-block request body and the SHA-256 of
+        the block (None unless hashed is set), in file order from the offset
+    """
+    raw_queue: asyncio.Queue = asyncio.Queue(settings.DBFS_UPLOAD_QUEUE_BLOCKS)
+    encoded_queue: asyncio.Queue = asyncio.Queue(settings.DBFS_UPLOAD_QUEUE_BLOCKS)
+    stages = [
+        asyncio.ensure_future(_read_blocks(local_file_path, block_size, offset, raw_queue)),
+        asyncio.ensure_future(_encode_blocks(raw_queue, encoded_queue, handle, hashed)),
+    ]
+    try:
+        while True:
+            get = asyncio.ensure_future(encoded_queue.get())
+            try:
+                # Keep watching the stages until the next block arrives, so that a
+                # stage failing after another one has finished is still surfaced
+                while not get.done():
+                    done, _ = await asyncio.wait([get, *stages], return_when=asyncio.FIRST_COMPLETED)
+                    failed = next(
+                        (stage for stage in done if stage is not get and stage.exception() is not None), None
+                    )
+                    if failed is not None:
+                        raise failed.exception()
+                    stages = [stage for stage in stages if not stage.done()]
+            except BaseException:
+                get.cancel()
+                raise
+            item = get.result()
+            if item is None:
+                return
+            yield item
+    finally:
+        for stage in stages:
+            stage.cancel()
+
+
+class UploadCheckpoint:
+    """
+    Local, append-only record of the progress of a resumable upload.
+    
+    The first line describes the upload: DBFS and local path, local size,
+    block size and upload handle. Every block the API has
+    acknowledged is appended with its offset and SHA-256, and flushed to disk
+    before the next block is sent.
+    """
+    
+    def __init__(self, path: str, header: Dict[str, Any], hashes: Optional[List[str]] = None):
+        self.path = path
+        self.header = header
+        self.hashes = hashes or []
+        self._file: Optional[BinaryIO] = None
+    
+    @classmethod
+    def load(cls, path: str) -> Optional["UploadCheckpoint"]:
+        """Read a checkpoint, ignoring a last line torn by a crash; None if there is no valid checkpoint."""
+        try:
+            with open(path, "rb") as f:
+                lines = f.read().splitlines()
+            header = loads(lines[0])
+        except (OSError, IndexError, ValueError):
+            return None
+        checkpoint = cls(path, header)
+        for line in lines[1:]:
+            try:
+                record = loads(line)
+            except ValueError:
+                break
+            if record.get("offset") != checkpoint.offset:
+                break
+            checkpoint.hashes.append(record["sha256"])
+        return checkpoint
+    
+    @property
+    def handle(self) -> int:
+        return self.header["handle"]
+    
+    @property
+    def offset(self) -> int:
+        """Bytes acknowledged so far; blocks are acknowledged in file order."""
+        return min(len(self.hashes) * self.header["block_size"], self.header["size"])
+    
+    def matches(self, identity: Dict[str, Any]) -> bool:
+        """Whether the checkpoint belongs to the same upload of the same local file."""
+        return all(self.header.get(key) == value for key, value in identity.items())
+    
+    def start(self) -> None:
+        """Write the checkpoint afresh, with the header only."""
+        self.close()
+        self.hashes = []
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._file = open(self.path, "wb")
+        self._write(self.header)
+    
+    def acknowledge(self, digest: str) -> None:
+        """Record the next block as acknowledged."""
+        if self._file is None:
+            self._file = open(self.path, "ab")
+        self._write({"offset": self.offset, "sha256": digest})
+        self.hashes.append(digest)
     
-    return make_api_request(
+    def _write(self, record: Dict[str, Any]) -> None:
+        self._file.write(dumps_bytes(record) + b"\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+    
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
+    def remove(self) -> None:
+        """Delete the checkpoint once the upload is complete."""
+        self.close()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def _default_checkpoint_path(dbfs_path: str, local_file_path: str) -> Optional[str]:
+    """Get the checkpoint file of an upload in DBFS_CHECKPOINT_DIR, or None if checkpoints are disabled."""
+    if not settings.DBFS_CHECKPOINT_DIR:
+        return None
+    key = hashlib.sha256(f"{os.path.abspath(local_file_path)}\0{dbfs_path}".encode("utf-8")).hexdigest()[:32]
+    return os.path.join(settings.DBFS_CHECKPOINT_DIR, f"{key}.jsonl")
+
+
+def _verified_blocks(local_file_path: str, block_size: int, hashes: List[str]) -> int:
+    """Count the leading blocks of a local file whose content still matches the recorded hashes."""
+    with open(local_file_path, "rb") as f:
+        for count, expected in enumerate(hashes):
+            if hashlib.sha256(f.read(block_size)).hexdigest() != expected:
+                return count
+    return len(hashes)
+
+
+def _handle_rejected(e: DatabricksAPIError) -> bool:
+    """Whether the API rejected an upload handle, e.g. because it expired."""
+    return e.status_code in (400, 404)
+
+
+async def _create_handle(dbfs_path: str, overwrite: bool) -> int:
+    """Open an upload handle."""
+    response = await make_api_request(
         "POST",
-        "/api/2.0/dbfs/put",
+        "/api/2.0/dbfs/create",
         data={
             "path": dbfs_path,
-            "contents": content_base64,
             "overwrite": overwrite,
         },
     )
+    return response.get("handle")
+
+
+async def _is_partial_upload(dbfs_path: str, checkpoint: UploadCheckpoint) -> bool:
+    """
+    Whether the file at a DBFS path is the partial upload a checkpoint describes.
+    
+    Its size has to lie between the acknowledged bytes and one more block, whose
+    acknowledgement may have been lost; a file of any other size was written by
+    someone else since.
+    """
+    try:
+        size = (await get_status(dbfs_path, use_cache=False)).get("file_size")
+    except DatabricksAPIError as e:
+        if e.status_code == 404 or "RESOURCE_DOES_NOT_EXIST" in str(e):
+            return False
+        raise
+    block_size = checkpoint.header["block_size"]
+    if size is not None and checkpoint.offset <= size <= checkpoint.offset + block_size:
+        return True
+    logger.warning(f"{dbfs_path} is not the partial upload recorded in {checkpoint.path}, not overwriting it")
+    return False
+
+
+async def _close_handle(handle: int) -> None:
+    """Close an upload handle, which completes the file."""
+    await make_api_request("POST", "/api/2.0/dbfs/close", data={"handle": handle})
+
+
+async def _append_blocks(
+    dbfs_path: str,
+    local_file_path: str,
+    handle: int,
+    block_size: int,
+    offset: int,
+    total_bytes: int,
+    progress: Optional[Callable[[int, int], None]],
+    checkpoint: Optional[UploadCheckpoint] = None,
+) -> Tuple[int, int]:
+    """
+    Append the blocks of a local file from an offset to an upload handle.
+    
+    Returns:
+        Tuple of the bytes and blocks sent
+    """
+    uploaded = offset
+    block_count = 0
+    next_report = 0.1
+    blocks = _iter_encoded_blocks(local_file_path, block_size, handle, offset, hashed=checkpoint is not None)
+    try:
+        async for size, body, digest in blocks:
+            # Add to handle
+            await make_api_request("POST", "/api/2.0/dbfs/add-block", body=body)
+            if checkpoint is not None:
+                # Written and synced off the event loop, before the next block is sent
+                await asyncio.to_thread(checkpoint.acknowledge, digest)
+            
+            uploaded += size
+            block_count += 1
+            logger.debug(f"Uploaded block {block_count} of {dbfs_path}")
+            if progress is not None:
+                progress(uploaded, total_bytes)
+            if total_bytes and uploaded / total_bytes >= next_report:
+                logger.info(f"Uploaded {uploaded}/{total_bytes} bytes to {dbfs_path}")
+                next_report = int(uploaded / total_bytes * 10 + 1) / 10
+    finally:
+        await blocks.aclose()
+    return uploaded - offset, block_count
+
+
+def _upload_stats(dbfs_path: str, sent: int, block_count: int, resumed_from: int, started: float) -> Dict[str, Any]:
+    """Summarize an upload for the caller."""
+    seconds = time.monotonic() - started
+    return {
+        "path": dbfs_path,
+        "bytes": sent,
+        "blocks": block_count,
+        "resumed_from": resumed_from,
+        "seconds": round(seconds, 3),
+        "throughput_mb_per_second": round(sent / 1024 / 1024 / seconds, 2) if seconds else None,
+    }
 
 
 async def upload_large_file(
     dbfs_path: str,
     local_file_path: str,
     overwrite: bool = True,
-    buffer_size: int = 1024 * 1024,  # 1MB chunks
+    buffer_size: int = DBFS_BLOCK_SIZE,
+    progress: Optional[Callable[[int, int], None]] = None,
+    checkpoint_path: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
-    Upload a large file to DBFS in chunks.
+    Upload a large file to DBFS in blocks.
+    
+    The file is read and base64-encoded in worker threads ahead of the sender,
+    so disk I/O, encoding and network transfer overlap. Each block is encoded
+    straight into its request body buffer. Blocks are appended to the upload
+    handle in order.
+    
+    With a checkpoint file (checkpoint_path, or one per upload in
+    DBFS_CHECKPOINT_DIR), the upload is resumable: every acknowledged block is
+    recorded, a failed upload keeps its handle open, and uploading the same
+    file again continues after the last acknowledged block. If the handle has
+    expired, or the file size on DBFS does not match after resuming, the file
+    is re-created and streamed from the start instead. Without overwrite, the
+    file left by the earlier attempt is only replaced if its size shows it is
+    that partial upload.
     
     Args:
         dbfs_path: The path where the file should be stored in DBFS
         local_file_path: Local path to the file to upload
         overwrite: Whether to overwrite an existing file
-        buffer_size: Size of chunks to upload
+        buffer_size: Size of the blocks to upload (at most the 1 MB allowed by the API)
+        progress: Optional callback receiving the bytes uploaded so far and the file size
+        checkpoint_path: Optional local file recording the progress of the upload
         
     Returns:
-        Empty response on success
+        Response containing the uploaded path, bytes sent, block count, the offset the
+        upload resumed from, duration and throughput
         
     Raises:
         DatabricksAPIError: If the API request fails
@@ -75,62 +368,177 @@ async def upload_large_file(
     if not os.path.exists(local_file_path):
         raise FileNotFoundError(f"Local file not found: {local_file_path}")
     
-    # Create a handle for the upload
-    create_response = make_api_request(
-        "POST",
-        "/api/2.0/dbfs/create",
-        data={
-            "path": dbfs_path,
-            "overwrite": overwrite,
-        },
-    )
+    block_size = max(1, min(buffer_size, DBFS_BLOCK_SIZE))
+    total_bytes = os.path.getsize(local_file_path)
+    started = time.monotonic()
     
-    handle = create_response.get("handle")
+    checkpoint_path = checkpoint_path or _default_checkpoint_path(dbfs_path, local_file_path)
+    if checkpoint_path is not None:
+        return await _upload_resumable(
+            dbfs_path, local_file_path, overwrite, block_size, progress, checkpoint_path, started
+        )
+    
+    # Create a handle for the upload
+    handle = await _create_handle(dbfs_path, overwrite)
     
     try:
-        with open(local_file_path, "rb") as f:
-            chunk_index = 0
-            while True:
-                chunk = f.read(buffer_size)
-                if not chunk:
-                    break
-                    
-                # Convert chunk to base64
-                chunk_base64 = base64.b64encode(chunk).decode("utf-8")
-                
-                # Add to handle
-                make_api_request(
-                    "POST",
-                    "/api/2.0/dbfs/add-block",
-                    data={
-                        "handle": handle,
-                        "data": chunk_base64,
-                    },
-                )
-                
-                chunk_index += 1
-                logger.debug(f"Uploaded chunk {chunk_index}")
+        sent, block_count = await _append_blocks(
+            dbfs_path, local_file_path, handle, block_size, 0, total_bytes, progress
+        )
         
         # Close the handle
-        return make_api_request(
-            "POST",
-            "/api/2.0/dbfs/close",
-            data={"handle": handle},
-        )
+        await _close_handle(handle)
         
     except Exception as e:
         # Attempt to abort the upload on error
         try:
-            make_api_request(
-                "POST",
-                "/api/2.0/dbfs/close",
-                data={"handle": handle},
-            )
+            await _close_handle(handle)
         except Exception:
             pass
         
         logger.error(f"Error uploading file: {str(e)}")
         raise
+    
+    return _upload_stats(dbfs_path, sent, block_count, 0, started)
+
+
+async def _upload_resumable(
+    dbfs_path: str,
+    local_file_path: str,
+    overwrite: bool,
+    block_size: int,
+    progress: Optional[Callable[[int, int], None]],
+    checkpoint_path: str,
+    started: float,
+) -> Dict[str, Any]:
+    """Upload a file to DBFS through a checkpoint, resuming a previous attempt when possible."""
+    total_bytes = os.path.getsize(local_file_path)
+    # The uploaded prefix is verified against the block hashes, so the modification time is not compared
+    identity = {
+        "dbfs_path": dbfs_path,
+        "local_path": os.path.abspath(local_file_path),
+        "size": total_bytes,
+        "block_size": block_size,
+    }
+    
+    previous = await asyncio.to_thread(UploadCheckpoint.load, checkpoint_path)
+    if previous is not None and previous.matches(identity):
+        verified = await asyncio.to_thread(_verified_blocks, local_file_path, block_size, previous.hashes)
+        if verified == len(previous.hashes):
+            resumed_from = previous.offset
+            logger.info(f"Resuming upload of {dbfs_path} at byte {resumed_from} of {total_bytes}")
+            try:
+                sent, block_count = await _append_blocks(
+                    dbfs_path, local_file_path, previous.handle, block_size,
+                    resumed_from, total_bytes, progress, previous,
+                )
+                await _close_handle(previous.handle)
+                # A block whose acknowledgement was lost may have been appended twice
+                if (await get_status(dbfs_path, use_cache=False)).get("file_size") == total_bytes:
+                    await asyncio.to_thread(previous.remove)
+                    return _upload_stats(dbfs_path, sent, block_count, resumed_from, started)
+                logger.warning(f"Size of {dbfs_path} does not match after resuming, re-creating it")
+            except DatabricksAPIError as e:
+                if not _handle_rejected(e):
+                    previous.close()
+                    logger.error(f"Error uploading file, resumable from {checkpoint_path}: {str(e)}")
+                    raise
+                logger.warning(f"Upload handle of {dbfs_path} is no longer valid, re-creating the file: {str(e)}")
+            except Exception:
+                previous.close()
+                raise
+        else:
+            logger.warning(f"{local_file_path} changed since the last attempt, re-creating {dbfs_path}")
+        previous.close()
+    
+    # Re-create the file and stream it from the start; a partial file left by a previous attempt is ours to replace
+    if not overwrite and previous is not None and previous.header.get("dbfs_path") == dbfs_path:
+        overwrite = await _is_partial_upload(dbfs_path, previous)
+    handle = await _create_handle(dbfs_path, overwrite)
+    checkpoint = UploadCheckpoint(checkpoint_path, {**identity, "handle": handle})
+    await asyncio.to_thread(checkpoint.start)
+    try:
+        sent, block_count = await _append_blocks(
+            dbfs_path, local_file_path, handle, block_size, 0, total_bytes, progress, checkpoint
+        )
+        await _close_handle(handle)
+    except Exception as e:
+        # Keep the handle open and the checkpoint, so the next attempt continues from here
+        checkpoint.close()
+        logger.error(f"Error uploading file, resumable from {checkpoint_path}: {str(e)}")
+        raise
+    await asyncio.to_thread(checkpoint.remove)
+    return _upload_stats(dbfs_path, sent, block_count, 0, started)
+
+
+def _read_file(local_file_path: str) -> bytes:
+    """Read a whole local file."""
+    with open(local_file_path, "rb") as f:
+        return f.read()
+
+
+async def upload_files(
+    uploads: List[Tuple[str, str]],
+    overwrite: bool = True,
+    concurrency: Optional[int] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Upload several files to DBFS concurrently, each through its own upload handle.
+    
+    Files of up to one block are sent in a single dbfs/put call.
+    
+    Args:
+        uploads: Pairs of local file path and DBFS destination path
+        overwrite: Whether to overwrite existing files
+        concurrency: Maximum number of files uploaded at once (default DBFS_UPLOAD_CONCURRENCY)
+        progress: Optional callback receiving the bytes uploaded so far and the total size of all files
+        
+    Returns:
+        Response containing the result of every upload (or its error) and the overall throughput
+    """
+    logger.info(f"Uploading {len(uploads)} files to DBFS")
+    semaphore = asyncio.Semaphore(concurrency or settings.DBFS_UPLOAD_CONCURRENCY)
+    total_bytes = sum(os.path.getsize(local) for local, _ in uploads if os.path.exists(local))
+    uploaded_by_file: Dict[int, int] = {}
+    started = time.monotonic()
+    
+    async def upload(index: int, local_file_path: str, dbfs_path: str) -> Dict[str, Any]:
+        def report(uploaded: int, _: int) -> None:
+            uploaded_by_file[index] = uploaded
+            if progress is not None:
+                progress(sum(uploaded_by_file.values()), total_bytes)
+        
+        async with semaphore:
+            try:
+                size = os.path.getsize(local_file_path)
+                if size > DBFS_BLOCK_SIZE:
+                    return await upload_large_file(dbfs_path, local_file_path, overwrite, progress=report)
+                
+                # Small files fit in a single put, instead of create, add-block and close
+                file_started = time.monotonic()
+                content = await asyncio.to_thread(_read_file, local_file_path)
+                await put_file(dbfs_path, content, overwrite)
+                report(size, size)
+                return {
+                    "path": dbfs_path,
+                    "bytes": size,
+                    "blocks": 1,
+                    "seconds": round(time.monotonic() - file_started, 3),
+                }
+            except Exception as e:
+                return {"path": dbfs_path, "local_path": local_file_path, "error": str(e)}
+    
+    results = await asyncio.gather(*(upload(i, local, remote) for i, (local, remote) in enumerate(uploads)))
+    seconds = time.monotonic() - started
+    uploaded = sum(result.get("bytes", 0) for result in results)
+    return {
+        "files": results,
+        "failed": sum(1 for result in results if "error" in result),
+        "bytes": uploaded,
+        "seconds": round(seconds, 3),
+        "throughput_mb_per_second": round(uploaded / 1024 / 1024 / seconds, 2) if seconds else None,
+    }
 
 
 async def get_file(
@@ -147,14 +555,14 @@ async def get_file(
         length: Number of bytes to read
         
     Returns:
-        Response containing the file content
+        Response containing bytes_read and the file content as decoded_data
         
     Raises:
         DatabricksAPIError: If the API request fails
     """
     logger.info(f"Reading file from DBFS path: {dbfs_path}")
     
-    response = make_api_request(
+    response = await make_api_request(
         "GET",
         "/api/2.0/dbfs/read",
         params={
@@ -162,24 +570,157 @@ async def get_file(
             "offset": offset,
             "length": length,
         },
+        raw=True,
     )
     
-    # Decode base64 content
-    if "data" in response:
-        try:
-            response["decoded_data"] = base64.b64decode(response["data"])
-        except Exception as e:
-            logger.warning(f"Failed to decode file content: {str(e)}")
-            
-    return response
+    # Decode the base64 content straight from the response body
+    try:
+        result, decoded = loads_base64_field(response.data, "data")
+    except ValueError as e:
+        logger.warning(f"Failed to decode file content: {str(e)}")
+        return response.parse()
+    if decoded is not None:
+        result["decoded_data"] = decoded
+    return result
+
+
+# Serializes seek-and-write on platforms without os.pwrite (Windows)
+_seek_write_lock = threading.Lock()
+
 
+def _write_at(fd: int, data: memoryview, offset: int) -> int:
+    """Write data at an offset of an open file, without moving a shared file position."""
+    if hasattr(os, "pwrite"):
+        return os.pwrite(fd, data, offset)
+    with _seek_write_lock:
+        os.lseek(fd, offset, os.SEEK_SET)
+        return os.write(fd, data)
 
-async def list_files(dbfs_path: str) -> Dict[str, Any]:
+
+def _write_range(fd: int, offset: int, document: bytes) -> int:
+    """Decode the base64 data of a dbfs/read response and write it at its offset of an open file."""
+    _, data = loads_base64_field(document, "data")
+    decoded = memoryview(data or b"")
+    written = 0
+    while written < len(decoded):
+        written += _write_at(fd, decoded[written:], offset + written)
+    return len(decoded)
+
+
+async def download_file(
+    dbfs_path: str,
+    local_file_path: str,
+    overwrite: bool = True,
+    concurrency: Optional[int] = None,
+    range_size: int = DBFS_BLOCK_SIZE,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Download a file from DBFS to a local file, reading ranges in parallel.
+    
+    The local file is preallocated to the size reported by get-status and every
+    range is decoded and written at its offset in a worker thread. At most
+    `concurrency` ranges are in flight, so memory stays bounded regardless of
+    the file size. The file is written under a temporary name and moved into
+    place once complete.
+    
+    Args:
+        dbfs_path: The path of the file in DBFS
+        local_file_path: Local path to write the file to
+        overwrite: Whether to overwrite an existing local file
+        concurrency: Maximum number of ranges read at once (default DBFS_DOWNLOAD_CONCURRENCY)
+        range_size: Size of the ranges to read (at most the 1 MB allowed by the API)
+        progress: Optional callback receiving the bytes downloaded so far and the file size
+        
+    Returns:
+        Response containing the downloaded path, size, duration and throughput
+        
+    Raises:
+        DatabricksAPIError: If the API request fails or the file changes during the download
+        FileExistsError: If the local file exists and overwrite is not set
+        IsADirectoryError: If the DBFS path is a directory
+    """
+    logger.info(f"Downloading DBFS path {dbfs_path} to {local_file_path}")
+    
+    if os.path.exists(local_file_path) and not overwrite:
+        raise FileExistsError(f"Local file already exists: {local_file_path}")
+    
+    # Not from the cache: a stale size would silently truncate the download
+    status = await get_status(dbfs_path, use_cache=False)
+    if status.get("is_dir"):
+        raise IsADirectoryError(f"DBFS path is a directory: {dbfs_path}")
+    total_bytes = status.get("file_size", 0)
+    range_size = max(1, min(range_size, DBFS_BLOCK_SIZE))
+    concurrency = max(1, concurrency or settings.DBFS_DOWNLOAD_CONCURRENCY)
+    started = time.monotonic()
+    
+    async def fetch_range(offset: int) -> int:
+        length = min(range_size, total_bytes - offset)
+        response = await make_api_request(
+            "GET",
+            "/api/2.0/dbfs/read",
+            params={"path": dbfs_path, "offset": offset, "length": length},
+            raw=True,
+        )
+        # Shielded, so cancelling the range does not orphan a write still running in its thread
+        write = asyncio.ensure_future(asyncio.to_thread(_write_range, fd, offset, response.data))
+        writes.add(write)
+        written = await asyncio.shield(write)
+        if written != length:
+            raise DatabricksAPIError(
+                f"Short read of {dbfs_path} at offset {offset}: expected {length} bytes, got {written}"
+            )
+        return written
+    
+    temp_path = f"{local_file_path}.part"
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    downloaded = 0
+    pending: set = set()
+    writes: set = set()
+    try:
+        os.ftruncate(fd, total_bytes)
+        for offset in range(0, total_bytes, range_size):
+            pending.add(asyncio.ensure_future(fetch_range(offset)))
+            if len(pending) < concurrency:
+                continue
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                downloaded += task.result()
+            if progress is not None:
+                progress(downloaded, total_bytes)
+        for task in asyncio.as_completed(pending):
+            downloaded += await task
+            if progress is not None:
+                progress(downloaded, total_bytes)
+        pending = set()
+    except BaseException:
+        for task in pending:
+            task.cancel()
+        # Wait for every writer thread before the descriptor is closed and its number can be reused
+        await asyncio.gather(*pending, return_exceptions=True)
+        await asyncio.gather(*writes, return_exceptions=True)
+        os.close(fd)
+        os.remove(temp_path)
+        raise
+    os.close(fd)
+    os.replace(temp_path, local_file_path)
+    
+    seconds = time.monotonic() - started
+    return {
+        "path": local_file_path,
+        "bytes": downloaded,
+        "seconds": round(seconds, 3),
+        "throughput_mb_per_second": round(downloaded / 1024 / 1024 / seconds, 2) if seconds else None,
+    }
+
+
+async def list_files(dbfs_path: str, raw: bool = False) -> Union[Dict[str, Any], RawJSON]:
     """
     List files and directories in a DBFS path.
     
     Args:
         dbfs_path: The path to list
+        raw: Return the unparsed response body as RawJSON instead of a dictionary
         
     Returns:
         Response containing the directory listing
@@ -188,7 +729,25 @@ async def list_files(dbfs_path: str) -> Dict[str, Any]:
         DatabricksAPIError: If the API request fails
     """
     logger.info(f"Listing files in DBFS path: {dbfs_path}")
-    return make_api_request("GET", "/api/2.0/dbfs/list", params={"path": dbfs_path})
+    return await make_api_request("GET", "/api/2.0/dbfs/list", params={"path": dbfs_path}, raw=raw)
+
+
+async def iter_files(dbfs_path: str) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream the files and directories in a DBFS path as the listing is received.
+    
+    Args:
+        dbfs_path: The path to list
+        
+    Yields:
+        File information entries (path, is_dir, file_size, modification_time)
+        
+    Raises:
+        DatabricksAPIError: If the API request fails
+    """
+    logger.debug(f"Streaming files in DBFS path: {dbfs_path}")
+    async for item in stream_api_request("GET", "/api/2.0/dbfs/list", "files.item", params={"path": dbfs_path}):
+        yield item
 
 
 async def delete_file(
@@ -209,7 +768,7 @@ async def delete_file(
         DatabricksAPIError: If the API request fails
     """
     logger.info(f"Deleting DBFS path: {dbfs_path}")
-    return make_api_request(
+    return await make_api_request(
         "POST",
         "/api/2.0/dbfs/delete",
         data={
@@ -219,12 +778,14 @@ async def delete_file(
     )
 
 
-async def get_status(dbfs_path: str) -> Dict[str, Any]:
+async def get_status(dbfs_path: str, use_cache: bool = True) -> Dict[str, Any]:
     """
     Get the status of a file or directory.
     
     Args:
         dbfs_path: The path to check
+        use_cache: Whether the status may come from the response cache, which can be
+            a few seconds old
         
     Returns:
         Response containing file status
@@ -233,7 +794,7 @@ async def get_status(dbfs_path: str) -> Dict[str, Any]:
         DatabricksAPIError: If the API request fails
     """
     logger.info(f"Getting status of DBFS path: {dbfs_path}")
-    return make_api_request("GET", "/api/2.0/dbfs/get-status", params={"path": dbfs_path})
+    return await make_api_request("GET", "/api/2.0/dbfs/get-status", params={"path": dbfs_path}, use_cache=use_cache)
 
 
 async def create_directory(dbfs_path: str) -> Dict[str, Any]:
@@ -250,4 +811,4 @@ async def create_directory(dbfs_path: str) -> Dict[str, Any]:
         DatabricksAPIError: If the API request fails
     """
     logger.info(f"Creating DBFS directory: {dbfs_path}")
-    return make_api_request("POST", "/api/2.0/dbfs/mkdirs", data={"path": dbfs_path}) 
\ No newline at end of file
+    return await make_api_request("POST", "/api/2.0/dbfs/mkdirs", data={"path": dbfs_path}) 
\ No newline at end of file
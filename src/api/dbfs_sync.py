@@ -0,0 +1,342 @@
+"""
+Incremental, rsync-style synchronization of a local directory to DBFS.
+
+The local tree is compared against a recursive DBFS listing, and only new or
+changed files are uploaded, in parallel. Files are compared by size and
+modification time, or, with checksums enabled, by size and a SHA-256 content
+hash recorded in a manifest file next to the synced files on DBFS. Remote
+files without a local counterpart can be deleted, and a dry run reports the
+plan without changing anything.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import posixpath
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from src.api import dbfs
+from src.api.dbfs_walk import DbfsWalker, matches
+from src.core.config import settings
+from src.core.serialization import dumps_bytes, loads
+from src.core.utils import DatabricksAPIError
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Name of the content hash manifest written to the root of a synced DBFS directory
+MANIFEST_NAME = ".dbfs-sync-manifest.json"
+
+# Maximum number of paths listed per category in a sync report
+REPORT_PATH_LIMIT = 100
+
+
+def _is_not_found(e: DatabricksAPIError) -> bool:
+    """Whether an API error means that the DBFS path does not exist."""
+    return e.status_code == 404 or "RESOURCE_DOES_NOT_EXIST" in str(e)
+
+
+def _scan_local(
+    local_path: str,
+    dbfs_path: str,
+    exclude: List[str],
+) -> Tuple[Dict[str, Dict[str, Any]], Set[str], Dict[str, str]]:
+    """
+    Scan a local tree into its files (by relative path) and directories, skipping excluded entries.
+
+    Files that cannot be read, such as broken symbolic links, are returned separately with their error.
+    """
+    files: Dict[str, Dict[str, Any]] = {}
+    directories: Set[str] = set()
+    unreadable: Dict[str, str] = {}
+    root = os.path.realpath(local_path)
+    for directory, subdirectories, filenames in os.walk(local_path):
+        relative_directory = os.path.relpath(directory, local_path).replace(os.sep, "/")
+        relative_directory = "" if relative_directory == "." else relative_directory
+
+        def target(name: str) -> Tuple[str, str]:
+            relative = posixpath.join(relative_directory, name)
+            return relative, posixpath.join(dbfs_path, relative)
+
+        kept = []
+        for name in subdirectories:
+            relative, dbfs_target = target(name)
+            if not exclude or not matches({"path": dbfs_target}, exclude):
+                kept.append(name)
+                directories.add(relative)
+        # Prune excluded directories from the walk
+        subdirectories[:] = kept
+
+        for name in filenames:
+            relative, dbfs_target = target(name)
+            if exclude and matches({"path": dbfs_target}, exclude):
+                continue
+            path = os.path.join(directory, name)
+            if os.path.islink(path) and os.path.commonpath([root, os.path.realpath(path)]) != root:
+                # Symbolic links leading out of the synced tree are not followed
+                continue
+            try:
+                stat = os.stat(path)
+            except OSError as e:
+                # A broken symbolic link, or a file removed during the scan
+                logger.warning(f"Skipping {path}: {str(e)}")
+                unreadable[relative] = str(e)
+                continue
+            files[relative] = {"local_path": path, "size": stat.st_size, "mtime_ms": int(stat.st_mtime * 1000)}
+    return files, directories, unreadable
+
+
+async def _scan_remote(
+    dbfs_path: str,
+    exclude: List[str],
+    concurrency: Optional[int],
+) -> Tuple[Dict[str, Dict[str, Any]], Set[str]]:
+    """List a DBFS tree into its files (by relative path) and directories; a missing root is empty."""
+    files: Dict[str, Dict[str, Any]] = {}
+    directories: Set[str] = set()
+    prefix = dbfs_path.rstrip("/") + "/"
+    walker = DbfsWalker(dbfs_path, exclude=exclude, concurrency=concurrency)
+    try:
+        async for entry in walker.entries():
+            if not entry["path"].startswith(prefix):
+                continue
+            relative = entry["path"][len(prefix):]
+            if entry.get("is_dir"):
+                directories.add(relative)
+            else:
+                files[relative] = entry
+    except DatabricksAPIError as e:
+        if not _is_not_found(e):
+            raise
+    if walker.errors:
+        raise DatabricksAPIError(f"Failed to list {len(walker.errors)} DBFS directories: {walker.errors[:5]}")
+    return files, directories
+
+
+def _sha256(local_path: str) -> str:
+    """Hash the content of a local file."""
+    digest = hashlib.sha256()
+    with open(local_path, "rb") as f:
+        for block in iter(lambda: f.read(dbfs.DBFS_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+async def _read_manifest(dbfs_path: str) -> Dict[str, Dict[str, Any]]:
+    """Read the content hash manifest of a synced DBFS directory, or an empty one if there is none."""
+    with tempfile.TemporaryDirectory() as directory:
+        local_path = os.path.join(directory, MANIFEST_NAME)
+        try:
+            await dbfs.download_file(posixpath.join(dbfs_path, MANIFEST_NAME), local_path)
+        except DatabricksAPIError as e:
+            if _is_not_found(e):
+                return {}
+            raise
+        with open(local_path, "rb") as f:
+            return loads(f.read()).get("files", {})
+
+
+async def _write_manifest(dbfs_path: str, manifest: Dict[str, Dict[str, Any]]) -> None:
+    """Write the content hash manifest of a synced DBFS directory."""
+    with tempfile.TemporaryDirectory() as directory:
+        local_path = os.path.join(directory, MANIFEST_NAME)
+        with open(local_path, "wb") as f:
+            f.write(dumps_bytes({"files": manifest}))
+        result = await dbfs.upload_files([(local_path, posixpath.join(dbfs_path, MANIFEST_NAME))])
+        if result["failed"]:
+            raise DatabricksAPIError(f"Failed to write the sync manifest: {result['files'][0]['error']}")
+
+
+def _change_reason(
+    local: Dict[str, Any],
+    remote: Optional[Dict[str, Any]],
+    manifest_entry: Optional[Dict[str, Any]],
+    checksum: bool,
+) -> Optional[str]:
+    """Why a local file has to be uploaded, or None if the remote copy is up to date."""
+    if remote is None:
+        return "new"
+    if local["size"] != remote.get("file_size"):
+        return "size"
+    if checksum:
+        if manifest_entry is None or manifest_entry.get("sha256") != local["sha256"]:
+            return "checksum"
+        return None
+    # DBFS records when a file was written: a local file modified since then is newer
+    if local["mtime_ms"] > remote.get("modification_time", 0):
+        return "mtime"
+    return None
+
+
+def _parents(relative: str) -> List[str]:
+    """Get the ancestor directories of a relative path."""
+    parts = relative.split("/")[:-1]
+    return ["/".join(parts[:i]) for i in range(1, len(parts) + 1)]
+
+
+def _outermost(paths: Set[str]) -> List[str]:
+    """Drop the paths that lie below another path of the set."""
+    return sorted(
+        path for path in paths
+        if not any(parent in paths for parent in _parents(path))
+    )
+
+
+async def sync_to_dbfs(
+    local_path: str,
+    dbfs_path: str,
+    delete: bool = False,
+    dry_run: bool = False,
+    checksum: bool = False,
+    exclude: Optional[List[str]] = None,
+    concurrency: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Synchronize a local directory to a DBFS directory, uploading only new and changed files.
+
+    Args:
+        local_path: Local directory to synchronize from
+        dbfs_path: DBFS directory to synchronize to
+        delete: Whether to delete DBFS files and directories that do not exist locally
+        dry_run: Report what would be uploaded and deleted without changing anything
+        checksum: Compare files by SHA-256 content hash (kept in a manifest on DBFS) instead of modification time
+        exclude: Optional glob patterns of files and directories to leave out on both sides
+        concurrency: Maximum number of files uploaded or deleted at once (default DBFS_UPLOAD_CONCURRENCY)
+
+    Returns:
+        Report of the files uploaded (with the reason) and deleted, the unchanged file count,
+        failures, and the time and throughput of every phase
+
+    Raises:
+        DatabricksAPIError: If listing the DBFS directory fails
+        NotADirectoryError: If the local path is not a directory
+    """
+    logger.info(f"Synchronizing {local_path} to DBFS path {dbfs_path} (dry_run={dry_run}, delete={delete})")
+
+    if not os.path.isdir(local_path):
+        raise NotADirectoryError(f"Local directory not found: {local_path}")
+
+    dbfs_path = dbfs_path[len("dbfs:"):] if dbfs_path.startswith("dbfs:") else dbfs_path
+    dbfs_path = dbfs_path.rstrip("/") or "/"
+    exclude = [*(exclude or []), MANIFEST_NAME]
+    concurrency = max(1, concurrency or settings.DBFS_UPLOAD_CONCURRENCY)
+    started = time.monotonic()
+
+    # Scan both sides at once
+    (local_files, local_directories, unreadable), (remote_files, remote_directories) = await asyncio.gather(
+        asyncio.to_thread(_scan_local, local_path, dbfs_path, exclude),
+        _scan_remote(dbfs_path, exclude, None),
+    )
+
+    manifest: Dict[str, Dict[str, Any]] = {}
+    if checksum:
+        # Every local file is hashed: the hashes are compared with the manifest and make up the new one
+        manifest = await _read_manifest(dbfs_path)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def hash_file(local: Dict[str, Any]) -> None:
+            async with semaphore:
+                local["sha256"] = await asyncio.to_thread(_sha256, local["local_path"])
+
+        await asyncio.gather(*(hash_file(local) for local in local_files.values()))
+    scanned = time.monotonic()
+
+    uploads: List[Tuple[str, Dict[str, Any], str]] = []
+    for relative, local in sorted(local_files.items()):
+        reason = _change_reason(local, remote_files.get(relative), manifest.get(relative), checksum)
+        if reason is not None:
+            uploads.append((relative, local, reason))
+
+    extraneous_directories = remote_directories - local_directories
+    # Remote copies of unreadable local files are kept
+    deletions = _outermost(extraneous_directories) + sorted(
+        relative for relative in remote_files
+        if relative not in local_files and relative not in unreadable
+        and not any(parent in extraneous_directories for parent in _parents(relative))
+    )
+
+    reasons: Dict[str, int] = {}
+    for _, _, reason in uploads:
+        reasons[reason] = reasons.get(reason, 0) + 1
+    upload_bytes = sum(local["size"] for _, local, _ in uploads)
+    report: Dict[str, Any] = {
+        "local_path": local_path,
+        "dbfs_path": dbfs_path,
+        "dry_run": dry_run,
+        "local_files": len(local_files),
+        "remote_files": len(remote_files),
+        "unchanged": len(local_files) - len(uploads),
+        "upload": {
+            "count": len(uploads),
+            "bytes": upload_bytes,
+            "reasons": reasons,
+            "paths": [relative for relative, _, _ in uploads[:REPORT_PATH_LIMIT]],
+        },
+        "delete": {
+            "count": len(deletions) if delete else 0,
+            "paths": deletions[:REPORT_PATH_LIMIT] if delete else [],
+        },
+        "extraneous": len(deletions),
+        "failed": [
+            {"path": os.path.join(local_path, relative), "error": error} for relative, error in sorted(unreadable.items())
+        ],
+    }
+
+    if not dry_run:
+        if uploads:
+            result = await dbfs.upload_files(
+                [(local["local_path"], posixpath.join(dbfs_path, relative)) for relative, local, _ in uploads],
+                overwrite=True,
+                concurrency=concurrency,
+            )
+            report["failed"].extend(
+                {"path": item["path"], "error": item["error"]} for item in result["files"] if "error" in item
+            )
+        uploaded = time.monotonic()
+
+        if delete and deletions:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def delete_path(relative: str) -> None:
+                path = posixpath.join(dbfs_path, relative)
+                async with semaphore:
+                    try:
+                        await dbfs.delete_file(path, recursive=relative in extraneous_directories)
+                    except Exception as e:
+                        report["failed"].append({"path": path, "error": str(e)})
+
+            await asyncio.gather(*(delete_path(relative) for relative in deletions))
+
+        if checksum:
+            # Files that failed to upload are left out, so they are compared as changed next time
+            failed_paths = {item["path"] for item in report["failed"]}
+            await _write_manifest(dbfs_path, {
+                relative: {"size": local["size"], "sha256": local["sha256"]}
+                for relative, local in local_files.items()
+                if posixpath.join(dbfs_path, relative) not in failed_paths
+            })
+    else:
+        uploaded = scanned
+
+    finished = time.monotonic()
+    transfer_seconds = uploaded - scanned
+    failed_paths = {item["path"] for item in report["failed"]}
+    succeeded_bytes = sum(
+        local["size"] for relative, local, _ in uploads if posixpath.join(dbfs_path, relative) not in failed_paths
+    )
+    report["seconds"] = {
+        "scan": round(scanned - started, 3),
+        "upload": round(transfer_seconds, 3),
+        "total": round(finished - started, 3),
+    }
+    report["throughput_mb_per_second"] = (
+        round(succeeded_bytes / 1024 / 1024 / transfer_seconds, 2) if succeeded_bytes and transfer_seconds else None
+    )
+    logger.info(
+        f"Synchronized {local_path} to {dbfs_path}: {len(uploads)} to upload, "
+        f"{report['unchanged']} unchanged, {report['delete']['count']} to delete"
+    )
+    return report
@@ -0,0 +1,328 @@
+"""
+Recursive traversal of DBFS directory trees: walk, find and disk usage.
+
+dbfs/list returns one directory level; the walker lists the directories of a
+tree in parallel with a bounded pool of workers, streaming entries to the
+caller as listings arrive. Traversal can be limited in depth, pruned with
+glob patterns and stopped early by the caller.
+"""
+
+import asyncio
+import fnmatch
+import logging
+import posixpath
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+from src.api import dbfs
+from src.core.config import settings
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Entry types the walker can be restricted to
+ENTRY_TYPES = ("file", "dir")
+
+
+def matches(entry: Dict[str, Any], patterns: Sequence[str]) -> bool:
+    """
+    Check whether an entry matches any of the glob patterns.
+
+    Patterns containing a slash are matched against the full path, others
+    against the name of the entry.
+
+    Args:
+        entry: File information entry (path, is_dir, file_size, modification_time)
+        patterns: Glob patterns
+
+    Returns:
+        True if any pattern matches
+    """
+    path = entry["path"]
+    name = posixpath.basename(path.rstrip("/"))
+    return any(fnmatch.fnmatchcase(path if "/" in pattern else name, pattern) for pattern in patterns)
+
+
+class DbfsWalker:
+    """
+    Parallel walker over a DBFS directory tree.
+
+    Directories are listed by a bounded pool of workers. entries() yields the
+    entries below the root as their listings arrive; closing it early (aclose)
+    stops the traversal and cancels the listings in flight.
+
+    Args:
+        root: DBFS path to walk
+        max_depth: Deepest level to report, where the root's children are at depth 1 (default unlimited)
+        include: Glob patterns an entry must match to be yielded; directories are still descended into
+        exclude: Glob patterns of entries to skip; excluded directories are not descended into
+        entry_type: Yield only "file" or "dir" entries (default both)
+        concurrency: Maximum number of directories listed at once (default DBFS_WALK_CONCURRENCY)
+
+    Raises:
+        ValueError: If the entry type or maximum depth is invalid
+    """
+
+    def __init__(
+        self,
+        root: str,
+        max_depth: Optional[int] = None,
+        include: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        entry_type: Optional[str] = None,
+        concurrency: Optional[int] = None,
+    ):
+        if entry_type is not None and entry_type not in ENTRY_TYPES:
+            raise ValueError(f"Invalid entry type: {entry_type}. Must be one of {ENTRY_TYPES}")
+        if max_depth is not None and max_depth < 1:
+            raise ValueError("max_depth must be at least 1")
+        self.root = root.rstrip("/") or "/"
+        self.max_depth = max_depth
+        self.include = list(include or [])
+        self.exclude = list(exclude or [])
+        self.entry_type = entry_type
+        self.concurrency = max(1, concurrency or settings.DBFS_WALK_CONCURRENCY)
+        self.directories_listed = 0
+        self.entries_seen = 0
+        self.errors: List[Dict[str, str]] = []
+        self._started: Optional[float] = None
+
+    def _wanted(self, entry: Dict[str, Any]) -> bool:
+        """Whether an entry passes the type and include filters."""
+        if self.entry_type is not None and entry.get("is_dir", False) != (self.entry_type == "dir"):
+            return False
+        return not self.include or matches(entry, self.include)
+
+    async def _list(self, path: str, depth: int) -> Tuple[List[Dict[str, Any]], List[Tuple[str, int]]]:
+        """List one directory: the entries to yield and the subdirectories to descend into."""
+        entries = []
+        subdirectories = []
+        # Streamed: entries are filtered as the listing arrives instead of after buffering it whole
+        async for file in dbfs.iter_files(path):
+            entry = {**file, "depth": depth + 1}
+            if self.exclude and matches(entry, self.exclude):
+                continue
+            if entry.get("is_dir") and (self.max_depth is None or depth + 1 < self.max_depth):
+                subdirectories.append((entry["path"], depth + 1))
+            entries.append(entry)
+        return entries, subdirectories
+
+    async def entries(self) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Walk the tree.
+
+        Yields:
+            File information entries (path, is_dir, file_size, modification_time, depth),
+            in no particular order
+
+        Raises:
+            DatabricksAPIError: If the root cannot be listed; failures below the root are
+                recorded in errors and their subtrees skipped
+        """
+        self._started = time.monotonic()
+        directories: asyncio.Queue = asyncio.Queue()
+        # Bounded, so workers pause while the caller is busy with the entries already listed
+        listings: asyncio.Queue = asyncio.Queue(self.concurrency)
+
+        async def worker() -> None:
+            while True:
+                path, depth = await directories.get()
+                try:
+                    listing = await self._list(path, depth)
+                    await listings.put((path, depth, listing, None))
+                except Exception as e:
+                    await listings.put((path, depth, ([], []), e))
+
+        directories.put_nowait((self.root, 0))
+        workers = [asyncio.ensure_future(worker()) for _ in range(self.concurrency)]
+        # Directories queued or being listed whose listing has not been received yet
+        pending = 1
+        try:
+            while pending:
+                path, depth, (entries, subdirectories), error = await listings.get()
+                pending -= 1
+                self.directories_listed += 1
+                if error is not None:
+                    if depth == 0:
+                        raise error
+                    logger.warning(f"Failed to list DBFS path {path}: {str(error)}")
+                    self.errors.append({"path": path, "error": str(error)})
+                    continue
+
+                for subdirectory in subdirectories:
+                    directories.put_nowait(subdirectory)
+                pending += len(subdirectories)
+
+                for entry in entries:
+                    self.entries_seen += 1
+                    if self._wanted(entry):
+                        yield entry
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get traversal statistics."""
+        seconds = time.monotonic() - self._started if self._started is not None else 0.0
+        return {
+            "directories_listed": self.directories_listed,
+            "entries_seen": self.entries_seen,
+            "errors": self.errors[:20],
+            "error_count": len(self.errors),
+            "seconds": round(seconds, 3),
+        }
+
+
+async def walk(
+    dbfs_path: str,
+    max_depth: Optional[int] = None,
+    pattern: Optional[str] = None,
+    exclude: Optional[List[str]] = None,
+    entry_type: Optional[str] = None,
+    max_results: int = 1000,
+) -> Dict[str, Any]:
+    """
+    List a DBFS tree recursively.
+
+    Args:
+        dbfs_path: DBFS path to walk
+        max_depth: Deepest level to list, where the root's children are at depth 1 (default unlimited)
+        pattern: Optional glob pattern the entries must match
+        exclude: Optional glob patterns of entries (and subtrees) to skip
+        entry_type: Optional "file" or "dir", to list only files or directories
+        max_results: Stop after this many entries
+
+    Returns:
+        Response containing the entries sorted by path, whether the walk was truncated,
+        and traversal statistics
+
+    Raises:
+        DatabricksAPIError: If the root cannot be listed
+        ValueError: If the entry type or maximum depth is invalid
+    """
+    logger.info(f"Walking DBFS path: {dbfs_path}")
+    walker = DbfsWalker(dbfs_path, max_depth, [pattern] if pattern else None, exclude, entry_type)
+    entries = []
+    truncated = False
+    stream = walker.entries()
+    try:
+        async for entry in stream:
+            if len(entries) >= max_results:
+                truncated = True
+                break
+            entries.append(entry)
+    finally:
+        await stream.aclose()
+    entries.sort(key=lambda entry: entry["path"])
+    return {"path": walker.root, "entries": entries, "truncated": truncated, "stats": walker.get_stats()}
+
+
+async def find(
+    dbfs_path: str,
+    pattern: str,
+    max_depth: Optional[int] = None,
+    exclude: Optional[List[str]] = None,
+    entry_type: Optional[str] = None,
+    max_results: int = 100,
+) -> Dict[str, Any]:
+    """
+    Find the entries of a DBFS tree matching a glob pattern, stopping once more than max_results match.
+
+    Args:
+        dbfs_path: DBFS path to search
+        pattern: Glob pattern matched against entry names (or full paths if it contains a slash)
+        max_depth: Deepest level to search, where the root's children are at depth 1 (default unlimited)
+        exclude: Optional glob patterns of entries (and subtrees) to skip
+        entry_type: Optional "file" or "dir", to find only files or directories
+        max_results: Maximum number of matches returned
+
+    Returns:
+        Response containing the matching paths, whether further matches were left out,
+        and traversal statistics
+
+    Raises:
+        DatabricksAPIError: If the root cannot be listed
+        ValueError: If the entry type or maximum depth is invalid
+    """
+    logger.info(f"Searching DBFS path {dbfs_path} for {pattern}")
+    walker = DbfsWalker(dbfs_path, max_depth, [pattern], exclude, entry_type)
+    found = []
+    truncated = False
+    stream = walker.entries()
+    try:
+        async for entry in stream:
+            if len(found) >= max_results:
+                # Only truncated if a match beyond max_results exists
+                truncated = True
+                break
+            found.append(entry)
+    finally:
+        # Stop the listings still in flight as soon as the search stops
+        await stream.aclose()
+    found.sort(key=lambda entry: entry["path"])
+    return {
+        "path": walker.root,
+        "pattern": pattern,
+        "matches": found,
+        "truncated": truncated,
+        "stats": walker.get_stats(),
+    }
+
+
+async def disk_usage(
+    dbfs_path: str,
+    max_depth: Optional[int] = None,
+    exclude: Optional[List[str]] = None,
+    top: int = 20,
+) -> Dict[str, Any]:
+    """
+    Sum the size of the files in a DBFS tree, in total and per child of the root.
+
+    Args:
+        dbfs_path: DBFS path to measure
+        max_depth: Deepest level to count, where the root's children are at depth 1 (default unlimited)
+        exclude: Optional glob patterns of entries (and subtrees) to skip
+        top: Number of largest children of the root to report
+
+    Returns:
+        Response containing the total bytes, file and directory counts, the largest
+        children of the root, and traversal statistics
+
+    Raises:
+        DatabricksAPIError: If the root cannot be listed
+        ValueError: If the maximum depth is invalid
+    """
+    logger.info(f"Measuring disk usage of DBFS path: {dbfs_path}")
+    walker = DbfsWalker(dbfs_path, max_depth, exclude=exclude)
+    prefix = walker.root.rstrip("/") + "/"
+    total_bytes = 0
+    files = 0
+    directories = 0
+    children: Dict[str, Dict[str, Any]] = {}
+    async for entry in walker.entries():
+        # Attribute the entry to the child of the root it lies under
+        path = entry["path"]
+        child_path = prefix + path[len(prefix):].split("/", 1)[0] if path.startswith(prefix) else path
+        child = children.setdefault(child_path, {"path": child_path, "bytes": 0, "files": 0})
+        if entry.get("is_dir"):
+            directories += 1
+            if entry["depth"] == 1:
+                child["is_dir"] = True
+            continue
+        size = entry.get("file_size", 0)
+        total_bytes += size
+        files += 1
+        child["bytes"] += size
+        child["files"] += 1
+
+    largest = sorted(children.values(), key=lambda child: child["bytes"], reverse=True)[:top]
+    return {
+        "path": walker.root,
+        "bytes": total_bytes,
+        "files": files,
+        "directories": directories,
+        "children": largest,
+        "child_count": len(children),
+        "stats": walker.get_stats(),
+    }
@@ -0,0 +1,241 @@
+"""
+In-memory index of Databricks jobs, searchable by name, tag, creator and schedule state.
+
+The index is built from the paginated job listing and then kept up to date
+incrementally: jobs changed through this server are re-fetched individually,
+and a periodic background refresh reconciles the index with the workspace.
+Searches are answered from memory without waiting for a refresh.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional, Set
+
+from src.api import jobs
+from src.core.config import settings
+from src.core.utils import DatabricksAPIError
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Schedule states a job can be in
+SCHEDULE_STATES = ("UNPAUSED", "PAUSED", "NONE")
+
+
+def _schedule_state(job_settings: Dict[str, Any]) -> str:
+    """Get the schedule state of a job from its schedule, trigger or continuous settings."""
+    for key in ("schedule", "trigger", "continuous"):
+        if key in job_settings:
+            return job_settings[key].get("pause_status", "UNPAUSED")
+    return "NONE"
+
+
+def _summarize(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract the searchable fields of a job."""
+    job_settings = job.get("settings", {})
+    return {
+        "job_id": job.get("job_id"),
+        "name": job_settings.get("name", ""),
+        "creator_user_name": job.get("creator_user_name", ""),
+        "tags": job_settings.get("tags", {}),
+        "schedule_state": _schedule_state(job_settings),
+        "created_time": job.get("created_time"),
+    }
+
+
+class JobIndex:
+    """Searchable in-memory index of the jobs in the workspace."""
+
+    def __init__(self, refresh_seconds: float):
+        self.refresh_seconds = refresh_seconds
+        self._jobs: Dict[int, Dict[str, Any]] = {}
+        self._by_tag: Dict[str, Set[int]] = {}
+        self._by_creator: Dict[str, Set[int]] = {}
+        self._by_schedule: Dict[str, Set[int]] = {}
+        self._dirty: Set[int] = set()
+        self._refreshed_at: Optional[float] = None
+        self._refresh_lock = asyncio.Lock()
+        # IDs re-fetched individually while a refresh runs, which take precedence over its listing
+        self._refetched: Optional[Set[int]] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    def mark_dirty(self, job_id: int) -> None:
+        """Mark a job as changed, so it is re-fetched before the next search."""
+        self._dirty.add(int(job_id))
+
+    def _add(self, summary: Dict[str, Any]) -> None:
+        job_id = summary["job_id"]
+        self._remove(job_id)
+        self._jobs[job_id] = summary
+        for key, value in summary["tags"].items():
+            self._by_tag.setdefault(key.lower(), set()).add(job_id)
+            self._by_tag.setdefault(f"{key}:{value}".lower(), set()).add(job_id)
+        self._by_creator.setdefault(summary["creator_user_name"].lower(), set()).add(job_id)
+        self._by_schedule.setdefault(summary["schedule_state"], set()).add(job_id)
+
+    def _remove(self, job_id: int) -> None:
+        summary = self._jobs.pop(job_id, None)
+        if summary is None:
+            return
+        for key, value in summary["tags"].items():
+            self._by_tag.get(key.lower(), set()).discard(job_id)
+            self._by_tag.get(f"{key}:{value}".lower(), set()).discard(job_id)
+        self._by_creator.get(summary["creator_user_name"].lower(), set()).discard(job_id)
+        self._by_schedule.get(summary["schedule_state"], set()).discard(job_id)
+
+    async def refresh(self) -> None:
+        """Reconcile the index with the full job listing of the workspace."""
+        async with self._refresh_lock:
+            logger.info("Refreshing job index")
+            # Only changes made before the listing started are covered by it: jobs
+            # marked dirty while it runs stay dirty and are re-fetched individually
+            dirty = set(self._dirty)
+            seen: Set[int] = set()
+            added = updated = 0
+            self._refetched = set()
+            try:
+                async for job in jobs.iter_jobs():
+                    summary = _summarize(job)
+                    job_id = summary["job_id"]
+                    seen.add(job_id)
+                    if job_id in self._refetched:
+                        # Fetched since the listing started: the listed state may be older
+                        continue
+                    current = self._jobs.get(job_id)
+                    if current != summary:
+                        added += current is None
+                        updated += current is not None
+                        self._add(summary)
+                # Jobs created through this server during the listing may be missing from it
+                removed = [job_id for job_id in self._jobs if job_id not in seen and job_id not in self._refetched]
+            finally:
+                self._refetched = None
+            for job_id in removed:
+                self._remove(job_id)
+            self._dirty -= dirty & seen
+            self._refreshed_at = time.monotonic()
+            logger.info(f"Job index refreshed: {len(self._jobs)} jobs ({added} added, {updated} updated, {len(removed)} removed)")
+
+    async def _refresh_dirty(self) -> None:
+        """Re-fetch the jobs changed through this server since the last search."""
+        while self._dirty:
+            job_id = self._dirty.pop()
+            try:
+                self._add(_summarize(await jobs.get_job(job_id)))
+                if self._refetched is not None:
+                    self._refetched.add(job_id)
+            except DatabricksAPIError as e:
+                if e.status_code in (400, 404):
+                    self._remove(job_id)
+                    if self._refetched is not None:
+                        self._refetched.add(job_id)
+                else:
+                    # Keep answering from the index; the job is retried on the next search
+                    self._dirty.add(job_id)
+                    logger.warning(f"Could not refresh job {job_id} in the index: {str(e)}")
+                    return
+
+    async def _refresh_in_background(self) -> None:
+        try:
+            await self.refresh()
+        except Exception as e:
+            logger.warning(f"Background job index refresh failed: {str(e)}")
+
+    async def ensure_fresh(self) -> None:
+        """
+        Make the index usable for a search.
+
+        Builds the index on first use. Afterwards, stale indexes are refreshed in
+        the background while searches keep being answered from memory.
+        """
+        if self._refreshed_at is None:
+            await self.refresh()
+        elif time.monotonic() - self._refreshed_at > self.refresh_seconds:
+            if self._refresh_task is None or self._refresh_task.done():
+                self._refresh_task = asyncio.create_task(self._refresh_in_background())
+        await self._refresh_dirty()
+
+    async def search(
+        self,
+        name: Optional[str] = None,
+        tag: Optional[str] = None,
+        creator: Optional[str] = None,
+        schedule_state: Optional[str] = None,
+        limit: int = 50,
+    ) -> Dict[str, Any]:
+        """
+        Search the indexed jobs. All given criteria must match.
+
+        Args:
+            name: Case-insensitive substring of the job name
+            tag: Tag key, or "key:value" to match a tag value (case-insensitive)
+            creator: Creator user name (case-insensitive, exact)
+            schedule_state: One of UNPAUSED, PAUSED or NONE (no schedule or trigger)
+            limit: Maximum number of jobs to return
+
+        Returns:
+            Response containing the matching jobs, the total match count and the index age
+
+        Raises:
+            DatabricksAPIError: If building the index fails
+            ValueError: If the schedule state is invalid
+        """
+        if schedule_state and schedule_state.upper() not in SCHEDULE_STATES:
+            raise ValueError(f"schedule_state must be one of {', '.join(SCHEDULE_STATES)}")
+
+        await self.ensure_fresh()
+
+        candidates: Optional[Set[int]] = None
+        for ids in (
+            self._by_tag.get(tag.lower(), set()) if tag else None,
+            self._by_creator.get(creator.lower(), set()) if creator else None,
+            self._by_schedule.get(schedule_state.upper(), set()) if schedule_state else None,
+        ):
+            if ids is not None:
+                candidates = set(ids) if candidates is None else candidates & ids
+
+        pool = (self._jobs[job_id] for job_id in candidates) if candidates is not None else self._jobs.values()
+        needle = name.lower() if name else None
+        matches = [job for job in pool if not needle or needle in job["name"].lower()]
+        matches.sort(key=lambda job: (job["name"].lower(), job["job_id"]))
+
+        return {
+            "jobs": matches[:limit],
+            "total": len(matches),
+            "indexed_jobs": len(self._jobs),
+            "index_age_seconds": round(time.monotonic() - self._refreshed_at, 1),
+        }
+
+
+# Global job index instance, kept informed of jobs changed through the jobs API
+job_index = JobIndex(settings.JOB_INDEX_REFRESH_SECONDS)
+jobs.add_job_change_listener(job_index.mark_dirty)
+
+
+async def search_jobs(
+    name: Optional[str] = None,
+    tag: Optional[str] = None,
+    creator: Optional[str] = None,
+    schedule_state: Optional[str] = None,
+    limit: int = 50,
+) -> Dict[str, Any]:
+    """
+    Search jobs by name, tag, creator and schedule state using the in-memory job index.
+
+    Args:
+        name: Case-insensitive substring of the job name
+        tag: Tag key, or "key:value" to match a tag value
+        creator: Creator user name
+        schedule_state: One of UNPAUSED, PAUSED or NONE
+        limit: Maximum number of jobs to return
+
+    Returns:
+        Response containing the matching jobs
+
+    Raises:
+        DatabricksAPIError: If building the index fails
+        ValueError: If the schedule state is invalid
+    """
+    logger.info(f"Searching jobs: name={name}, tag={tag}, creator={creator}, schedule_state={schedule_state}")
+    return await job_index.search(name, tag, creator, schedule_state, limit)
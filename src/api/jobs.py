@@ -2,14 +2,52 @@
 API for managing Databricks jobs.
 """
 
+import asyncio
+import base64
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, Union
 
+from src.core import serialization
+from src.core.polling import BatchPoller, check_each
+from src.core.serialization import RawJSON
 from src.core.utils import DatabricksAPIError, make_api_request
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Maximum page size of the jobs/list API
+JOBS_PAGE_SIZE = 100
+
+# Maximum page size of the jobs/runs/list API
+RUNS_PAGE_SIZE = 25
+
+# Number of pending runs from which their status is checked by listing the active runs
+RUNS_LIST_BATCH_THRESHOLD = 5
+
+# Life cycle states of a run that has finished
+TERMINAL_LIFE_CYCLE_STATES = ("TERMINATED", "SKIPPED", "INTERNAL_ERROR")
+
+# Callbacks notified with the job ID whenever a job is created, updated or deleted through this module
+_job_change_listeners: List[Callable[[int], None]] = []
+
+
+def add_job_change_listener(listener: Callable[[int], None]) -> None:
+    """
+    Register a callback notified whenever a job is created, updated or deleted.
+    
+    Args:
+        listener: Callable receiving the ID of the changed job
+    """
+    _job_change_listeners.append(listener)
+
+
+def _notify_job_changed(job_id: Optional[int]) -> None:
+    """Notify the registered listeners that a job changed."""
+    if job_id is None:
+        return
+    for listener in _job_change_listeners:
+        listener(job_id)
+
 
 async def create_job(job_config: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -25,16 +63,24 @@ async def create_job(job_config: Dict[str, Any]) -> Dict[str, Any]:
         DatabricksAPIError: If the API request fails
     """
     logger.info("Creating new job")
-    return make_api_request("POST", "/api/2.0/jobs/create", data=job_config)
+    response = await make_api_request("POST", "/api/2.0/jobs/create", data=job_config)
+    _notify_job_changed(response.get("job_id"))
+    return response
 
 
-async def run_job(job_id: int, job_parameters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+async def run_job(
+    job_id: int,
+    job_parameters: Optional[Dict[str, Any]] = None,
+    idempotency_token: Optional[str] = None,
+) -> Dict[str, Any]:
     """
     Run a job now.
     
     Args:
         job_id: ID of the job to run
         job_parameters: Job-level parameters used in the run, e.g., {"param": "overriding_val"}
+        idempotency_token: Optional token guaranteeing the run is only triggered once; also allows
+            the request to be retried safely on transient failures
         
     Returns:
         Response containing the run ID
@@ -47,30 +93,174 @@ async def run_job(job_id: int, job_parameters: Optional[Dict[str, Any]] = None)
     run_params = {"job_id": job_id}
     if job_parameters:
         run_params["job_parameters"] = job_parameters
+    
+    if idempotency_token:
+        run_params["idempotency_token"] = idempotency_token
+        
+    return await make_api_request("POST", "/api/2.2/jobs/run-now", data=run_params)
+
+
+async def _list_jobs_page(
+    page_token: Optional[str] = None,
+    expand_tasks: bool = False,
+    page_size: int = JOBS_PAGE_SIZE,
+) -> Dict[str, Any]:
+    """
+    Fetch a single page of jobs.
+    
+    Args:
+        page_token: Token of the page to fetch, or None for the first page
+        expand_tasks: Whether to include task and cluster details
+        page_size: Number of jobs per page (at most 100)
         
-    return make_api_request("POST", "/api/2.2/jobs/run-now", data=run_params)
+    Returns:
+        Response containing the jobs of the page and the next page token, if any
+        
+    Raises:
+        DatabricksAPIError: If the API request fails
+    """
+    params = {"limit": page_size, "expand_tasks": "true" if expand_tasks else "false"}
+    if page_token:
+        params["page_token"] = page_token
+    return await make_api_request("GET", "/api/2.2/jobs/list", params=params)
+
+
+async def iter_job_pages(
+    page_token: Optional[str] = None,
+    expand_tasks: bool = False,
+    page_size: int = JOBS_PAGE_SIZE,
+) -> AsyncIterator[Tuple[Optional[str], List[Dict[str, Any]]]]:
+    """
+    Iterate over all pages of jobs, prefetching the next page while the current one is consumed.
+    
+    Args:
+        page_token: Token of the page to start from, or None for the first page
+        expand_tasks: Whether to include task and cluster details
+        page_size: Number of jobs per page (at most 100)
+        
+    Yields:
+        Tuples of the page token the page was fetched with and the jobs of the page
+        
+    Raises:
+        DatabricksAPIError: If the API request fails
+    """
+    next_page = asyncio.ensure_future(_list_jobs_page(page_token, expand_tasks, page_size))
+    try:
+        while next_page is not None:
+            page = await next_page
+            current_token = page_token
+            page_token = page.get("next_page_token")
+            next_page = (
+                asyncio.ensure_future(_list_jobs_page(page_token, expand_tasks, page_size))
+                if page_token
+                else None
+            )
+            yield current_token, page.get("jobs", [])
+    finally:
+        # The consumer stopped early: drop the prefetched page
+        if next_page is not None and not next_page.done():
+            next_page.cancel()
+
+
+async def iter_jobs(expand_tasks: bool = False, page_size: int = JOBS_PAGE_SIZE) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Iterate over all jobs in the workspace, page by page.
+    
+    Args:
+        expand_tasks: Whether to include task and cluster details
+        page_size: Number of jobs per page (at most 100)
+        
+    Yields:
+        Job objects
+        
+    Raises:
+        DatabricksAPIError: If the API request fails
+    """
+    async for _, page_jobs in iter_job_pages(expand_tasks=expand_tasks, page_size=page_size):
+        for job in page_jobs:
+            yield job
+
+
+def _encode_cursor(page_token: Optional[str], offset: int) -> str:
+    """Encode a position in the job listing as an opaque cursor."""
+    payload = serialization.dumps_bytes({"page_token": page_token, "offset": offset})
+    return base64.urlsafe_b64encode(payload).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> Tuple[Optional[str], int]:
+    """Decode a cursor produced by _encode_cursor."""
+    try:
+        payload = serialization.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return payload.get("page_token"), int(payload.get("offset", 0))
+    except (ValueError, TypeError, AttributeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
 
 
-async def list_jobs() -> Dict[str, Any]:
+def _project_job(job: Dict[str, Any], fields: List[str]) -> Dict[str, Any]:
+    """Keep only the requested settings fields of a job, plus its identifying fields."""
+    projected = {key: job[key] for key in ("job_id", "creator_user_name", "created_time") if key in job}
+    job_settings = job.get("settings", {})
+    projected["settings"] = {key: job_settings[key] for key in fields if key in job_settings}
+    return projected
+
+
+async def list_jobs(
+    limit: Optional[int] = None,
+    name_filter: Optional[str] = None,
+    cursor: Optional[str] = None,
+    expand_tasks: bool = False,
+    fields: Optional[List[str]] = None,
+) -> Dict[str, Any]:
     """
-    List all jobs.
+    List jobs, following pagination.
     
+    Args:
+        limit: Maximum number of jobs to return; all jobs if not set
+        name_filter: Only return jobs whose name contains this string (case-insensitive)
+        cursor: Cursor returned by a previous call, to continue where it stopped
+        expand_tasks: Whether to include task and cluster details
+        fields: Only return these job settings fields (e.g. ["name", "tags"]); all if not set
+        
     Returns:
-        Response containing a list of jobs
+        Response containing the list of jobs, and a next_cursor if more jobs are available
         
     Raises:
         DatabricksAPIError: If the API request fails
+        ValueError: If the cursor is invalid
     """
-    logger.info("Listing all jobs")
-    return make_api_request("GET", "/api/2.0/jobs/list")
+    logger.info(f"Listing jobs: limit={limit}, name_filter={name_filter}, cursor={cursor}")
+    
+    page_token, skip = _decode_cursor(cursor) if cursor else (None, 0)
+    needle = name_filter.lower() if name_filter else None
+    result: List[Dict[str, Any]] = []
+    next_cursor = None
+    
+    async for token, page_jobs in iter_job_pages(page_token, expand_tasks):
+        for offset in range(skip, len(page_jobs)):
+            if limit is not None and len(result) >= limit:
+                next_cursor = _encode_cursor(token, offset)
+                break
+            job = page_jobs[offset]
+            if needle and needle not in job.get("settings", {}).get("name", "").lower():
+                continue
+            result.append(_project_job(job, fields) if fields else job)
+        skip = 0
+        if next_cursor:
+            break
+    
+    response: Dict[str, Any] = {"jobs": result}
+    if next_cursor:
+        response["next_cursor"] = next_cursor
+    return response
 
 
-async def get_job(job_id: int) -> Dict[str, Any]:
+async def get_job(job_id: int, raw: bool = False) -> Union[Dict[str, Any], RawJSON]:
     """
     Get information about a specific job.
     
     Args:
         job_id: ID of the job
+        raw: Return the unparsed response body as RawJSON instead of a dictionary
         
     Returns:
         Response containing job information
@@ -79,7 +269,7 @@ async def get_job(job_id: int) -> Dict[str, Any]:
         DatabricksAPIError: If the API request fails
     """
     logger.info(f"Getting information for job: {job_id}")
-    return make_api_request("GET", "/api/2.0/jobs/get", params={"job_id": job_id})
+    return await make_api_request("GET", "/api/2.0/jobs/get", params={"job_id": job_id}, raw=raw)
 
 
 async def update_job(job_id: int, new_settings: Dict[str, Any]) -> Dict[str, Any]:
@@ -103,7 +293,10 @@ async def update_job(job_id: int, new_settings: Dict[str, Any]) -> Dict[str, Any
         "new_settings": new_settings
     }
     
-    return make_api_request("POST", "/api/2.0/jobs/update", data=update_data)
+    try:
+        return await make_api_request("POST", "/api/2.0/jobs/update", data=update_data)
+    finally:
+        _notify_job_changed(job_id)
 
 
 async def delete_job(job_id: int) -> Dict[str, Any]:
@@ -120,16 +313,20 @@ async def delete_job(job_id: int) -> Dict[str, Any]:
         DatabricksAPIError: If the API request fails
     """
     logger.info(f"Deleting job: {job_id}")
-    return make_api_request("POST", "/api/2.0/jobs/delete", data={"job_id": job_id})
+    try:
+        return await make_api_request("POST", "/api/2.0/jobs/delete", data={"job_id": job_id})
+    finally:
+        _notify_job_changed(job_id)
 
 
-async def get_run(run_id: int, include_history: bool = False) -> Dict[str, Any]:
+async def get_run(run_id: int, include_history: bool = False, raw: bool = False) -> Union[Dict[str, Any], RawJSON]:
     """
     Get information about a specific job run.
     
     Args:
         run_id: ID of the run
         include_history: Whether to include the run's history in the response
+        raw: Return the unparsed response body as RawJSON instead of a dictionary
         
     Returns:
         Response containing run information
@@ -141,7 +338,7 @@ async def get_run(run_id: int, include_history: bool = False) -> Dict[str, Any]:
     params = {"run_id": run_id}
     if include_history:
         params["include_history"] = "true"
-    return make_api_request("GET", "/api/2.2/jobs/runs/get", params=params)
+    return await make_api_request("GET", "/api/2.2/jobs/runs/get", params=params, raw=raw)
 
 
 async def cancel_run(run_id: int) -> Dict[str, Any]:
@@ -158,10 +355,91 @@ async def cancel_run(run_id: int) -> Dict[str, Any]:
         DatabricksAPIError: If the API request fails
     """
     logger.info(f"Cancelling run: {run_id}")
-    return make_api_request("POST", "/api/2.0/jobs/runs/cancel", data={"run_id": run_id})
+    return await make_api_request("POST", "/api/2.0/jobs/runs/cancel", data={"run_id": run_id})
+
+
+async def _list_active_runs(max_pages: int) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    List the active runs of the workspace, newest first.
+    
+    Returns:
+        Tuple of the runs listed and whether the listing is complete
+    """
+    runs: List[Dict[str, Any]] = []
+    params: Dict[str, Any] = {"active_only": "true", "limit": RUNS_PAGE_SIZE}
+    for _ in range(max_pages):
+        page = await make_api_request("GET", "/api/2.2/jobs/runs/list", params=params)
+        runs.extend(page.get("runs", []))
+        if not page.get("has_more") or not page.get("next_page_token"):
+            return runs, True
+        params["page_token"] = page["next_page_token"]
+    return runs, False
+
+
+def _run_done(run: Dict[str, Any]) -> bool:
+    """Whether a run has finished."""
+    if "status" in run:
+        return run["status"].get("state") == "TERMINATED"
+    return run.get("state", {}).get("life_cycle_state") in TERMINAL_LIFE_CYCLE_STATES
+
+
+_check_each_run = check_each(get_run)
+
+
+async def _check_runs(run_ids: List[int]) -> Dict[int, Any]:
+    """
+    Check the status of many runs at once.
+    
+    Many runs are checked through one listing of the active runs; only runs that
+    are no longer active (or beyond the listed pages) are fetched individually.
+    """
+    statuses: Dict[int, Any] = {}
+    if len(run_ids) >= RUNS_LIST_BATCH_THRESHOLD:
+        wanted = set(run_ids)
+        try:
+            active, _ = await _list_active_runs(len(run_ids) // RUNS_PAGE_SIZE + 2)
+            statuses.update({run["run_id"]: run for run in active if run.get("run_id") in wanted})
+        except DatabricksAPIError as e:
+            logger.warning(f"Could not list active runs, checking runs individually: {str(e)}")
+    remaining = [run_id for run_id in run_ids if run_id not in statuses]
+    if remaining:
+        statuses.update(await _check_each_run(remaining))
+    return statuses
+
+
+# Central poller for the runs waited on through wait_for_run
+run_poller = BatchPoller("Job run", _check_runs, _run_done)
+
+
+async def wait_for_run(
+    run_id: int,
+    timeout_seconds: float = 3600,
+    poll_interval_seconds: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Wait for a job run to finish.
+    
+    Runs are polled centrally: concurrent waits on the same run share their
+    status checks, and many pending runs are checked in one batch.
+    
+    Args:
+        run_id: ID of the run
+        timeout_seconds: Maximum time to wait
+        poll_interval_seconds: First interval between status checks; intervals then grow
+            up to POLL_MAX_INTERVAL_SECONDS
+        
+    Returns:
+        Response containing the finished run
+        
+    Raises:
+        DatabricksAPIError: If the API request fails
+        TimeoutError: If the run does not finish within the timeout
+    """
+    logger.info(f"Waiting for run: {run_id}")
+    return await run_poller.wait(int(run_id), timeout_seconds, poll_interval_seconds)
 
 
-async def get_run_output(run_id: int) -> Dict[str, Any]:
+async def get_run_output(run_id: int, raw: bool = False) -> Union[Dict[str, Any], RawJSON]:
     """
     Retrieve the output and metadata of a single task run.
     
@@ -171,6 +449,7 @@ async def get_run_output(run_id: int) -> Dict[str, Any]:
     
     Args:
         run_id: The canonical identifier for the run
+        raw: Return the unparsed response body as RawJSON instead of a dictionary
         
     Returns:
         Response containing the run output and metadata
@@ -179,7 +458,7 @@ async def get_run_output(run_id: int) -> Dict[str, Any]:
         DatabricksAPIError: If the API request fails
     """
     logger.info(f"Getting output for run: {run_id}")
-    return make_api_request("GET", "/api/2.2/jobs/runs/get-output", params={"run_id": run_id})
+    return await make_api_request("GET", "/api/2.2/jobs/runs/get-output", params={"run_id": run_id}, raw=raw)
 
 
 async def repair_run(
@@ -236,4 +515,4 @@ async def repair_run(
     if performance_target is not None:
         repair_data["performance_target"] = performance_target
     
-    return make_api_request("POST", "/api/2.2/jobs/runs/repair", data=repair_data) 
\ No newline at end of file
+    return await make_api_request("POST", "/api/2.2/jobs/runs/repair", data=repair_data) 
\ No newline at end of file
@@ -0,0 +1,432 @@
+"""
+In-memory index of Unity Catalog metadata: catalogs, schemas, tables and columns.
+
+Schemas are loaded on first use through the Unity Catalog API and kept in
+memory, indexed by table and column name. Stale schemas are refreshed
+incrementally: the table listing is re-read without columns and only tables
+whose updated_at changed are fetched again. Write statements executed through
+the SQL API mark the affected schemas stale.
+"""
+
+import asyncio
+import logging
+import re
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from src.api import sql
+from src.core.config import settings
+from src.core.utils import make_api_request
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Base path of the Unity Catalog API
+UNITY_CATALOG_API = "/api/2.1/unity-catalog"
+
+# Page sizes of the Unity Catalog list APIs
+SCHEMAS_PAGE_SIZE = 1000
+TABLES_PAGE_SIZE = 50
+
+# Maximum number of tables fetched at once during an incremental refresh
+TABLE_FETCH_CONCURRENCY = 8
+
+SchemaKey = Tuple[str, str]
+
+# Qualified object names (schema.table or catalog.schema.table) in a SQL statement
+_QUALIFIED_NAME_RE = re.compile(r"(`[^`]+`|\b[A-Za-z_]\w*)\.(`[^`]+`|[A-Za-z_]\w*)(?:\.(`[^`]+`|[A-Za-z_]\w*))?")
+
+# Unqualified object names following the keywords that introduce a table or view,
+# which resolve against the default catalog and schema of the statement
+_UNQUALIFIED_NAME_RE = re.compile(
+    r"\b(?:table|into|update|from|join|using|view|exists|optimize|vacuum)\s+(`[^`]+`|[A-Za-z_]\w*)(?![\w`]|\s*[.(])",
+    re.IGNORECASE,
+)
+
+# Words after those keywords that are not object names
+_NOT_OBJECT_NAMES = {"if", "select", "with", "values", "delta", "parquet", "csv", "json", "orc", "avro", "text"}
+
+
+async def _list_all(endpoint: str, key: str, params: Dict[str, Any], page_size: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Read every page of a Unity Catalog list API."""
+    params = dict(params)
+    if page_size:
+        params["max_results"] = page_size
+    items: List[Dict[str, Any]] = []
+    while True:
+        page = await make_api_request("GET", endpoint, params=params)
+        items.extend(page.get(key, []))
+        page_token = page.get("next_page_token")
+        if not page_token:
+            return items
+        params["page_token"] = page_token
+
+
+def _summarize_table(table: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract the indexed fields of a table."""
+    return {
+        "full_name": table.get("full_name", "").lower(),
+        "catalog_name": table.get("catalog_name"),
+        "schema_name": table.get("schema_name"),
+        "name": table.get("name"),
+        "table_type": table.get("table_type"),
+        "data_source_format": table.get("data_source_format"),
+        "comment": table.get("comment"),
+        "updated_at": table.get("updated_at"),
+        "columns": [
+            {
+                "name": column.get("name"),
+                "type_text": column.get("type_text"),
+                "nullable": column.get("nullable"),
+                "comment": column.get("comment"),
+            }
+            for column in sorted(table.get("columns", []), key=lambda column: column.get("position", 0))
+        ],
+    }
+
+
+class MetadataIndex:
+    """Searchable in-memory index of Unity Catalog metadata, loaded schema by schema."""
+
+    def __init__(self, refresh_seconds: float):
+        self.refresh_seconds = refresh_seconds
+        self._catalogs: Optional[List[Dict[str, Any]]] = None
+        self._catalogs_loaded_at: Optional[float] = None
+        self._schemas: Dict[str, List[Dict[str, Any]]] = {}
+        self._schemas_loaded_at: Dict[str, float] = {}
+        self._tables: Dict[str, Dict[str, Any]] = {}
+        self._schema_tables: Dict[SchemaKey, Set[str]] = {}
+        self._schema_loaded_at: Dict[SchemaKey, float] = {}
+        self._by_column: Dict[str, Set[str]] = {}
+        self._stale: Set[SchemaKey] = set()
+        self._locks: Dict[SchemaKey, asyncio.Lock] = {}
+
+    def _expired(self, loaded_at: Optional[float]) -> bool:
+        return loaded_at is None or time.monotonic() - loaded_at > self.refresh_seconds
+
+    def mark_stale(self, catalog: Optional[str] = None, schema: Optional[str] = None) -> None:
+        """
+        Mark metadata as possibly changed, so it is revalidated on next use.
+
+        Args:
+            catalog: Catalog that changed, or None for every catalog
+            schema: Schema that changed, or None for every schema of the catalog
+        """
+        if catalog and schema:
+            self._stale.add((catalog.lower(), schema.lower()))
+            return
+        self._stale.update(
+            key for key in self._schema_loaded_at if not catalog or key[0] == catalog.lower()
+        )
+        if catalog:
+            self._schemas_loaded_at.pop(catalog.lower(), None)
+        else:
+            self._schemas_loaded_at.clear()
+            self._catalogs_loaded_at = None
+
+    def on_write_statement(self, statement: str, catalog: Optional[str], schema: Optional[str]) -> None:
+        """
+        Mark the schemas a write statement may have changed as stale.
+
+        Schemas are taken from the qualified names in the statement. Unqualified
+        names resolve against the statement's default catalog and schema, which
+        are marked stale too, as they are when the statement names no objects.
+        """
+        names = _QUALIFIED_NAME_RE.findall(statement)
+        unqualified = any(
+            name.strip("`").lower() not in _NOT_OBJECT_NAMES for name in _UNQUALIFIED_NAME_RE.findall(statement)
+        )
+        if not names or unqualified:
+            self.mark_stale(catalog, schema)
+        for first, second, third in names:
+            first, second = first.strip("`").lower(), second.strip("`").lower()
+            if third:
+                self._stale.add((first, second))
+            else:
+                # schema.table: the schema of the default catalog, or of any catalog if unknown
+                self._stale.update(
+                    key for key in self._schema_loaded_at
+                    if key[1] == first and (not catalog or key[0] == catalog.lower())
+                )
+                if catalog:
+                    self._stale.add((catalog.lower(), first))
+
+    def _add(self, summary: Dict[str, Any]) -> None:
+        full_name = summary["full_name"]
+        self._remove(full_name)
+        self._tables[full_name] = summary
+        key = (summary["catalog_name"].lower(), summary["schema_name"].lower())
+        self._schema_tables.setdefault(key, set()).add(full_name)
+        for column in summary["columns"]:
+            self._by_column.setdefault((column["name"] or "").lower(), set()).add(full_name)
+
+    def _remove(self, full_name: str) -> None:
+        summary = self._tables.pop(full_name, None)
+        if summary is None:
+            return
+        key = (summary["catalog_name"].lower(), summary["schema_name"].lower())
+        self._schema_tables.get(key, set()).discard(full_name)
+        for column in summary["columns"]:
+            names = self._by_column.get((column["name"] or "").lower())
+            if names is not None:
+                names.discard(full_name)
+                if not names:
+                    del self._by_column[(column["name"] or "").lower()]
+
+    async def catalogs(self) -> List[Dict[str, Any]]:
+        """Get the catalogs of the metastore."""
+        if self._catalogs is None or self._expired(self._catalogs_loaded_at):
+            self._catalogs = await _list_all(f"{UNITY_CATALOG_API}/catalogs", "catalogs", {})
+            self._catalogs_loaded_at = time.monotonic()
+        return self._catalogs
+
+    async def schemas(self, catalog: str) -> List[Dict[str, Any]]:
+        """Get the schemas of a catalog."""
+        catalog = catalog.lower()
+        if catalog not in self._schemas or self._expired(self._schemas_loaded_at.get(catalog)):
+            self._schemas[catalog] = await _list_all(
+                f"{UNITY_CATALOG_API}/schemas", "schemas", {"catalog_name": catalog}, SCHEMAS_PAGE_SIZE
+            )
+            self._schemas_loaded_at[catalog] = time.monotonic()
+        return self._schemas[catalog]
+
+    async def tables(self, catalog: str, schema: str) -> List[Dict[str, Any]]:
+        """Get the tables of a schema, loading or refreshing the schema if needed."""
+        key = (catalog.lower(), schema.lower())
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            if key not in self._schema_loaded_at:
+                await self._load_schema(key)
+            elif key in self._stale or self._expired(self._schema_loaded_at[key]):
+                await self._refresh_schema(key)
+        return [self._tables[full_name] for full_name in sorted(self._schema_tables.get(key, ()))]
+
+    async def _load_schema(self, key: SchemaKey) -> None:
+        """Load every table of a schema, with columns."""
+        catalog, schema = key
+        logger.info(f"Loading metadata of schema {catalog}.{schema}")
+        tables = await _list_all(
+            f"{UNITY_CATALOG_API}/tables", "tables", {"catalog_name": catalog, "schema_name": schema}, TABLES_PAGE_SIZE
+        )
+        for full_name in list(self._schema_tables.get(key, ())):
+            self._remove(full_name)
+        for table in tables:
+            self._add(_summarize_table(table))
+        self._schema_loaded_at[key] = time.monotonic()
+        self._stale.discard(key)
+
+    async def _refresh_schema(self, key: SchemaKey) -> None:
+        """Reconcile a loaded schema, fetching only the tables that changed."""
+        catalog, schema = key
+        listing = await _list_all(
+            f"{UNITY_CATALOG_API}/tables",
+            "tables",
+            {"catalog_name": catalog, "schema_name": schema, "omit_columns": "true"},
+            TABLES_PAGE_SIZE,
+        )
+        seen = {table.get("full_name", "").lower(): table.get("updated_at") for table in listing}
+        changed = [
+            full_name
+            for full_name, updated_at in seen.items()
+            if full_name not in self._tables or self._tables[full_name]["updated_at"] != updated_at
+        ]
+        removed = [full_name for full_name in self._schema_tables.get(key, ()) if full_name not in seen]
+
+        semaphore = asyncio.Semaphore(TABLE_FETCH_CONCURRENCY)
+
+        async def fetch(full_name: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await make_api_request("GET", f"{UNITY_CATALOG_API}/tables/{full_name}")
+
+        for table in await asyncio.gather(*(fetch(full_name) for full_name in changed)):
+            self._add(_summarize_table(table))
+        for full_name in removed:
+            self._remove(full_name)
+        self._schema_loaded_at[key] = time.monotonic()
+        self._stale.discard(key)
+        logger.info(f"Metadata of schema {catalog}.{schema} refreshed: {len(changed)} changed, {len(removed)} removed")
+
+    async def _scope(self, catalog: Optional[str], schema: Optional[str]) -> List[SchemaKey]:
+        """Get the schemas within a scope, loading their tables."""
+        if catalog and schema:
+            keys = [(catalog.lower(), schema.lower())]
+        else:
+            catalogs = [catalog] if catalog else [entry["name"] for entry in await self.catalogs()]
+            keys = [
+                (name.lower(), entry["name"].lower())
+                for name in catalogs
+                for entry in await self.schemas(name)
+                if entry.get("name", "").lower() != "information_schema"
+            ]
+        await asyncio.gather(*(self.tables(*key) for key in keys))
+        return keys
+
+    async def list_tables(
+        self,
+        catalog: str,
+        schema: Optional[str] = None,
+        name_filter: Optional[str] = None,
+        limit: int = 200,
+    ) -> Dict[str, Any]:
+        """
+        List the tables of a catalog or schema.
+
+        Args:
+            catalog: Catalog name
+            schema: Schema name; all schemas of the catalog if not set
+            name_filter: Case-insensitive substring of the table name
+            limit: Maximum number of tables to return
+
+        Returns:
+            Response containing the tables (without columns) and the total match count
+
+        Raises:
+            DatabricksAPIError: If loading the metadata fails
+        """
+        keys = await self._scope(catalog, schema)
+        needle = name_filter.lower() if name_filter else None
+        matches = [
+            {
+                "full_name": table["full_name"],
+                "table_type": table["table_type"],
+                "comment": table["comment"],
+                "column_count": len(table["columns"]),
+            }
+            for key in keys
+            for table in (self._tables[full_name] for full_name in sorted(self._schema_tables.get(key, ())))
+            if not needle or needle in (table["name"] or "").lower()
+        ]
+        return {"tables": matches[:limit], "total": len(matches)}
+
+    async def describe_table(self, full_name: str) -> Dict[str, Any]:
+        """
+        Describe a table and its columns.
+
+        Args:
+            full_name: Full table name (catalog.schema.table)
+
+        Returns:
+            Table metadata, including its columns
+
+        Raises:
+            DatabricksAPIError: If loading the metadata fails
+            ValueError: If the name is not a full table name
+        """
+        parts = full_name.lower().split(".")
+        if len(parts) != 3:
+            raise ValueError(f"Expected a full table name (catalog.schema.table): {full_name}")
+        await self.tables(parts[0], parts[1])
+        table = self._tables.get(".".join(parts))
+        if table is None:
+            # Created since the schema was loaded; fetch it directly
+            table = _summarize_table(await make_api_request("GET", f"{UNITY_CATALOG_API}/tables/{full_name}"))
+            self._add(table)
+        return table
+
+    async def search_columns(
+        self,
+        query: str,
+        catalog: Optional[str] = None,
+        schema: Optional[str] = None,
+        limit: int = 100,
+    ) -> Dict[str, Any]:
+        """
+        Search columns by name across tables.
+
+        Args:
+            query: Case-insensitive substring of the column name
+            catalog: Catalog to search; every catalog if not set
+            schema: Schema to search; every schema of the catalog if not set
+            limit: Maximum number of columns to return
+
+        Returns:
+            Response containing the matching columns with their tables, and the total match count
+
+        Raises:
+            DatabricksAPIError: If loading the metadata fails
+        """
+        keys = set(await self._scope(catalog, schema))
+        needle = query.lower()
+        matches = []
+        for column_name in sorted(name for name in self._by_column if needle in name):
+            for full_name in sorted(self._by_column[column_name]):
+                table = self._tables[full_name]
+                if (table["catalog_name"].lower(), table["schema_name"].lower()) not in keys:
+                    continue
+                for column in table["columns"]:
+                    if (column["name"] or "").lower() == column_name:
+                        matches.append({"table": full_name, **column})
+        return {"columns": matches[:limit], "total": len(matches)}
+
+
+# Global metadata index instance, kept informed of write statements executed through the SQL API
+metadata_index = MetadataIndex(settings.METADATA_REFRESH_SECONDS)
+sql.add_write_listener(metadata_index.on_write_statement)
+
+
+async def list_tables(
+    catalog: str,
+    schema: Optional[str] = None,
+    name_filter: Optional[str] = None,
+    limit: int = 200,
+) -> Dict[str, Any]:
+    """
+    List tables from the in-memory metadata index.
+
+    Args:
+        catalog: Catalog name
+        schema: Schema name; all schemas of the catalog if not set
+        name_filter: Case-insensitive substring of the table name
+        limit: Maximum number of tables to return
+
+    Returns:
+        Response containing the tables
+
+    Raises:
+        DatabricksAPIError: If loading the metadata fails
+    """
+    logger.info(f"Listing tables: catalog={catalog}, schema={schema}, name_filter={name_filter}")
+    return await metadata_index.list_tables(catalog, schema, name_filter, limit)
+
+
+async def describe_table(full_name: str) -> Dict[str, Any]:
+    """
+    Describe a table from the in-memory metadata index.
+
+    Args:
+        full_name: Full table name (catalog.schema.table)
+
+    Returns:
+        Table metadata, including its columns
+
+    Raises:
+        DatabricksAPIError: If loading the metadata fails
+        ValueError: If the name is not a full table name
+    """
+    logger.info(f"Describing table: {full_name}")
+    return await metadata_index.describe_table(full_name)
+
+
+async def search_columns(
+    query: str,
+    catalog: Optional[str] = None,
+    schema: Optional[str] = None,
+    limit: int = 100,
+) -> Dict[str, Any]:
+    """
+    Search columns by name using the in-memory metadata index.
+
+    Args:
+        query: Case-insensitive substring of the column name
+        catalog: Catalog to search; every catalog if not set
+        schema: Schema to search; every schema of the catalog if not set
+        limit: Maximum number of columns to return
+
+    Returns:
+        Response containing the matching columns
+
+    Raises:
+        DatabricksAPIError: If loading the metadata fails
+    """
+    logger.info(f"Searching columns: query={query}, catalog={catalog}, schema={schema}")
+    return await metadata_index.search_columns(query, catalog, schema, limit)
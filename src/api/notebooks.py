@@ -4,13 +4,18 @@ API for managing Databricks notebooks.
 
 import base64
 import logging
-from typing import Any, Dict, List, Optional
+import re
+from typing import Any, Dict, List, Optional, Union
 
+from src.core.serialization import RawJSON, base64_json_body
 from src.core.utils import DatabricksAPIError, make_api_request
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Shape of a base64 string: checked before the decoding round trip, which copies the content
+_BASE64_RE = re.compile(r"[A-Za-z0-9+/]*={0,2}")
+
 
 async def import_notebook(
     path: str,
@@ -37,21 +42,22 @@ async def import_notebook(
     """
     logger.info(f"Importing notebook to path: {path}")
     
-    # Ensure content is base64 encoded
-    if not is_base64(content):
-        content = base64.b64encode(content.encode("utf-8")).decode("utf-8")
-    
     import_data = {
         "path": path,
         "format": format,
-        "content": content,
         "overwrite": overwrite,
     }
     
     if language:
         import_data["language"] = language
-        
-    return make_api_request("POST", "/api/2.0/workspace/import", data=import_data)
+    
+    # Ensure content is base64 encoded, encoding plain sources straight into the request body
+    if not is_base64(content):
+        body = base64_json_body(import_data, "content", content.encode("utf-8"))
+        return await make_api_request("POST", "/api/2.0/workspace/import", body=body)
+    
+    import_data["content"] = content
+    return await make_api_request("POST", "/api/2.0/workspace/import", data=import_data)
 
 
 async def export_notebook(
@@ -78,7 +84,7 @@ async def export_notebook(
         "format": format,
     }
     
-    response = make_api_request("GET", "/api/2.0/workspace/export", params=params)
+    response = await make_api_request("GET", "/api/2.0/workspace/export", params=params)
     
     # Optionally decode base64 content
     if "content" in response and format in ["SOURCE", "JUPYTER"]:
@@ -90,12 +96,13 @@ async def export_notebook(
     return response
 
 
-async def list_notebooks(path: str) -> Dict[str, Any]:
+async def list_notebooks(path: str, raw: bool = False) -> Union[Dict[str, Any], RawJSON]:
     """
     List notebooks in a workspace directory.
     
     Args:
         path: The path to list
+        raw: Return the unparsed response body as RawJSON instead of a dictionary
         
     Returns:
         Response containing the directory listing
@@ -104,7 +111,7 @@ async def list_notebooks(path: str) -> Dict[str, Any]:
         DatabricksAPIError: If the API request fails
     """
     logger.info(f"Listing notebooks in path: {path}")
-    return make_api_request("GET", "/api/2.0/workspace/list", params={"path": path})
+    return await make_api_request("GET", "/api/2.0/workspace/list", params={"path": path}, raw=raw)
 
 
 async def delete_notebook(path: str, recursive: bool = False) -> Dict[str, Any]:
@@ -122,7 +129,7 @@ async def delete_notebook(path: str, recursive: bool = False) -> Dict[str, Any]:
         DatabricksAPIError: If the API request fails
     """
     logger.info(f"Deleting path: {path}")
-    return make_api_request(
+    return await make_api_request(
         "POST", 
         "/api/2.0/workspace/delete", 
         data={"path": path, "recursive": recursive}
@@ -143,7 +150,7 @@ async def create_directory(path: str) -> Dict[str, Any]:
         DatabricksAPIError: If the API request fails
     """
     logger.info(f"Creating directory: {path}")
-    return make_api_request("POST", "/api/2.0/workspace/mkdirs", data={"path": path})
+    return await make_api_request("POST", "/api/2.0/workspace/mkdirs", data={"path": path})
 
 
 def is_base64(content: str) -> bool:
@@ -156,6 +163,8 @@ def is_base64(content: str) -> bool:
     Returns:
         True if the string is base64 encoded, False otherwise
     """
+    if len(content) % 4 or not _BASE64_RE.fullmatch(content):
+        return False
     try:
         return base64.b64encode(base64.b64decode(content)) == content.encode('utf-8')
     except Exception:
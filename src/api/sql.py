@@ -2,14 +2,201 @@
 API for executing SQL statements on Databricks.
 """
 
+import asyncio
+import base64
+import csv
+import hashlib
+import io
+import json
 import logging
-from typing import Any, Dict, List, Optional
+import re
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 
-from src.core.utils import DatabricksAPIError, make_api_request
+# Import pyarrow if available, but don't require it
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.ipc
+except ImportError:
+    pa = None
+
+from src.core import serialization
+from src.core.cache import ResponseCache
+from src.core.config import settings
+from src.core.polling import BatchPoller, check_each
+from src.core.utils import DatabricksAPIError, download_presigned_url, make_api_request
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Result dispositions and formats supported by the Statement Execution API
+DISPOSITIONS = ("INLINE", "EXTERNAL_LINKS")
+FORMATS = ("JSON_ARRAY", "ARROW_STREAM", "CSV")
+
+# Maximum size of an INLINE result
+INLINE_BYTE_LIMIT = 25 * 1024 * 1024
+
+# Bounds of the server-side wait_timeout long-poll, in seconds
+MIN_WAIT_TIMEOUT_SECONDS = 5
+MAX_WAIT_TIMEOUT_SECONDS = 50
+
+# Statement states in which the statement is still running
+PENDING_STATES = ("PENDING", "RUNNING")
+
+# Leading keywords of statements that only read data, and whose results may be cached.
+# Every other statement is treated as changing data or session state.
+READ_ONLY_KEYWORDS = {"select", "show", "describe", "desc", "explain", "values", "table", "list"}
+
+# Functions and clauses whose result changes between executions
+NON_DETERMINISTIC_KEYWORDS = {
+    "rand", "randn", "random", "uuid", "now", "current_timestamp", "current_date", "current_time",
+    "localtimestamp", "unix_timestamp", "curdate", "shuffle", "monotonically_increasing_id",
+    "spark_partition_id", "input_file_name", "reflect", "java_method", "try_reflect", "tablesample",
+    "current_user", "session_user", "user", "current_version", "event_log", "read_files", "read_kafka",
+    "stream", "history", "read_pubsub", "read_kinesis",
+}
+
+# Path under which cached statement results are invalidated together
+RESULT_CACHE_PATH = "sql/statements"
+
+# Tokens of a SQL statement: string literals, quoted identifiers, comments, words, whitespace
+_SQL_TOKEN_RE = re.compile(
+    r"""(?P<literal>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|`[^`]*`)"""
+    r"|(?P<comment>--[^\n]*|/\*.*?\*/)"
+    r"|(?P<space>\s+)"
+    r"|(?P<word>[A-Za-z_][A-Za-z0-9_]*)"
+    r"|(?P<other>.)",
+    re.DOTALL,
+)
+
+
+def _tokenize_statement(statement: str) -> List[Tuple[str, str]]:
+    """Split a statement into (kind, text) tokens, dropping comments and whitespace."""
+    return [
+        (match.lastgroup, match.group())
+        for match in _SQL_TOKEN_RE.finditer(statement)
+        if match.lastgroup not in ("comment", "space")
+    ]
+
+
+def normalize_statement(statement: str) -> str:
+    """
+    Normalize a SQL statement for use as a cache key.
+    
+    Comments and trailing semicolons are removed, whitespace is collapsed and
+    everything outside string literals and quoted identifiers is lowercased.
+    
+    Args:
+        statement: The SQL statement
+        
+    Returns:
+        The normalized statement
+    """
+    tokens = _tokenize_statement(statement)
+    while tokens and tokens[-1][1] == ";":
+        tokens.pop()
+    return " ".join(text if kind == "literal" else text.lower() for kind, text in tokens)
+
+
+def _statement_keywords(statement: str) -> List[str]:
+    """
+    Get the leading keyword of every statement in a SQL text.
+    
+    Comments are ignored, and the common table expressions of a WITH clause are
+    skipped, so "WITH t AS (...) INSERT ..." yields "insert".
+    """
+    keywords: List[str] = []
+    depth = 0
+    expect_keyword = True
+    in_with = expect_body = after_body = False
+    for kind, text in _tokenize_statement(statement):
+        if text == ";" and depth == 0:
+            expect_keyword, in_with = True, False
+            continue
+        if text == "(":
+            if depth == 0 and in_with and expect_body:
+                expect_body = False
+            depth += 1
+            continue
+        if text == ")":
+            depth = max(0, depth - 1)
+            if depth == 0 and in_with:
+                after_body = True
+            continue
+        if depth > 0 and not expect_keyword:
+            continue
+        if expect_keyword:
+            if kind != "word":
+                continue
+            if text.lower() == "with":
+                in_with, expect_body, after_body = True, False, False
+            else:
+                keywords.append(text.lower())
+            expect_keyword = False
+        elif in_with:
+            if text == ",":
+                after_body = False
+            elif kind == "word" and text.lower() == "as":
+                expect_body, after_body = True, False
+            elif kind == "word" and after_body:
+                # The statement the common table expressions belong to
+                keywords.append(text.lower())
+                in_with = False
+    return keywords
+
+
+def is_cacheable_statement(statement: str) -> bool:
+    """
+    Check whether the result of a SQL statement may be cached.
+    
+    Only statements that start with a read-only keyword and contain no
+    non-deterministic functions are cacheable.
+    
+    Args:
+        statement: The SQL statement
+        
+    Returns:
+        True if the result may be cached
+    """
+    keywords = _statement_keywords(statement)
+    if not keywords or any(keyword not in READ_ONLY_KEYWORDS for keyword in keywords):
+        return False
+    words = [text.lower() for kind, text in _tokenize_statement(statement) if kind == "word"]
+    return not any(word in NON_DETERMINISTIC_KEYWORDS for word in words)
+
+
+def _is_write_statement(statement: str) -> bool:
+    """Check whether a SQL statement may change data, so cached results must be dropped."""
+    return any(keyword not in READ_ONLY_KEYWORDS for keyword in _statement_keywords(statement))
+
+
+def _result_cache_key(request_data: Dict[str, Any]) -> str:
+    """Build the result cache key of a statement request."""
+    key_data = dict(request_data)
+    key_data["statement"] = normalize_statement(key_data["statement"])
+    key_data.pop("wait_timeout", None)
+    payload = json.dumps(key_data, sort_keys=True, default=str)
+    return "sql:" + hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# Global cache of statement results
+result_cache = ResponseCache(settings.SQL_RESULT_CACHE_MAX_BYTES)
+
+# Callbacks notified with every write statement executed through this module
+_write_listeners: List[Callable[[str, Optional[str], Optional[str]], None]] = []
+
+
+def add_write_listener(listener: Callable[[str, Optional[str], Optional[str]], None]) -> None:
+    """
+    Register a callback notified whenever a statement that may change data or metadata is executed.
+    
+    Args:
+        listener: Callable receiving the statement and its default catalog and schema (None if not set)
+    """
+    _write_listeners.append(listener)
+
 
 async def execute_statement(
     statement: str,
@@ -18,11 +205,20 @@ async def execute_statement(
     schema: Optional[str] = None,
     parameters: Optional[Dict[str, Any]] = None,
     row_limit: int = 10000,
-    byte_limit: int = 100000000,  # 100MB
+    byte_limit: Optional[int] = None,
+    disposition: str = "INLINE",
+    format: str = "JSON_ARRAY",
+    wait_timeout: str = "10s",
+    use_cache: Optional[bool] = None,
 ) -> Dict[str, Any]:
     """
     Execute a SQL statement.
     
+    With the result cache enabled, finished INLINE results of read-only,
+    deterministic statements are cached by normalized statement, warehouse,
+    catalog, schema and parameters. Cached responses are flagged with
+    cache_hit. Write statements executed through the server drop cached results.
+    
     Args:
         statement: The SQL statement to execute
         warehouse_id: ID of the SQL warehouse to use
@@ -30,25 +226,45 @@ async def execute_statement(
         schema: Optional schema to use
         parameters: Optional statement parameters
         row_limit: Maximum number of rows to return
-        byte_limit: Maximum number of bytes to return
+        byte_limit: Maximum number of bytes to return (capped at 25 MiB for INLINE results);
+            EXTERNAL_LINKS results are only limited by the server if not set
+        disposition: INLINE to return results in the response, or EXTERNAL_LINKS to return
+            presigned links to result chunks, which supports results of up to 100 GiB
+        format: Result format (JSON_ARRAY, ARROW_STREAM or CSV; INLINE only supports JSON_ARRAY)
+        wait_timeout: How long to wait for the statement to finish before returning its
+            state ("0s" to return immediately, or between "5s" and "50s")
+        use_cache: Whether to use the result cache (default SQL_RESULT_CACHE_ENABLED)
         
     Returns:
         Response containing query results
         
     Raises:
         DatabricksAPIError: If the API request fails
+        ImportError: If the format is ARROW_STREAM and pyarrow is not installed
+        ValueError: If the disposition or format is invalid
     """
     logger.info(f"Executing SQL statement: {statement[:100]}...")
     
+    if disposition not in DISPOSITIONS:
+        raise ValueError(f"disposition must be one of {', '.join(DISPOSITIONS)}")
+    if format not in FORMATS or (disposition == "INLINE" and format != "JSON_ARRAY"):
+        raise ValueError(f"Unsupported format for {disposition} results: {format}")
+    if format == "ARROW_STREAM" and pa is None:
+        # Checked before submitting, so that no statement runs whose result cannot be decoded
+        raise ImportError("pyarrow is required to decode ARROW_STREAM results")
+    
     request_data = {
         "statement": statement,
         "warehouse_id": warehouse_id,
-        "wait_timeout": "10s",
-        "format": "JSON_ARRAY",
-        "disposition": "INLINE",
+        "wait_timeout": wait_timeout,
+        "format": format,
+        "disposition": disposition,
         "row_limit": row_limit,
-        "byte_limit": 16777216,
     }
+    if disposition == "INLINE":
+        request_data["byte_limit"] = min(byte_limit or INLINE_BYTE_LIMIT, INLINE_BYTE_LIMIT)
+    elif byte_limit:
+        request_data["byte_limit"] = byte_limit
     
     if catalog:
         request_data["catalog"] = catalog
@@ -58,8 +274,35 @@ async def execute_statement(
         
     if parameters:
         request_data["parameters"] = parameters
-        
-    return make_api_request("POST", "/api/2.0/sql/statements", data=request_data)
+    
+    use_cache = settings.SQL_RESULT_CACHE_ENABLED if use_cache is None else use_cache
+    cache_key = None
+    if use_cache and disposition == "INLINE" and is_cacheable_statement(statement):
+        cache_key = _result_cache_key(request_data)
+        cached = result_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Returning cached SQL statement result")
+            response = serialization.loads(cached)
+            response["cache_hit"] = True
+            return response
+        generation = result_cache.generation(RESULT_CACHE_PATH)
+    
+    try:
+        response = await make_api_request("POST", "/api/2.0/sql/statements", data=request_data)
+    finally:
+        if _is_write_statement(statement):
+            result_cache.invalidate((RESULT_CACHE_PATH,))
+            for listener in _write_listeners:
+                listener(statement, catalog, schema)
+    
+    if cache_key is not None:
+        if response.get("status", {}).get("state") == "SUCCEEDED":
+            result_cache.set(
+                cache_key, RESULT_CACHE_PATH, serialization.dumps_bytes(response),
+                settings.SQL_RESULT_CACHE_TTL_SECONDS, generation,
+            )
+        response["cache_hit"] = False
+    return response
 
 
 async def execute_and_wait(
@@ -69,11 +312,17 @@ async def execute_and_wait(
     schema: Optional[str] = None,
     parameters: Optional[Dict[str, Any]] = None,
     timeout_seconds: int = 300,  # 5 minutes
-    poll_interval_seconds: int = 1,
+    poll_interval_seconds: Optional[float] = None,
 ) -> Dict[str, Any]:
     """
     Execute a SQL statement and wait for completion.
     
+    The statement is first long-polled server-side through wait_timeout, so most
+    statements finish within the execute call. Longer statements are then polled
+    with adaptive intervals by the central statement poller.
+    
+    INLINE results split into several chunks are returned with the rows of all chunks.
+    
     Args:
         statement: The SQL statement to execute
         warehouse_id: ID of the SQL warehouse to use
@@ -81,56 +330,46 @@ async def execute_and_wait(
         schema: Optional schema to use
         parameters: Optional statement parameters
         timeout_seconds: Maximum time to wait for completion
-        poll_interval_seconds: How often to poll for status
+        poll_interval_seconds: First interval between status checks; intervals then grow
+            up to POLL_MAX_INTERVAL_SECONDS
         
     Returns:
         Response containing query results
         
     Raises:
-        DatabricksAPIError: If the API request fails
+        DatabricksAPIError: If the API request fails or the statement does not succeed
         TimeoutError: If query execution times out
     """
-    import asyncio
-    import time
-    
     logger.info(f"Executing SQL statement with waiting: {statement[:100]}...")
+    deadline = time.monotonic() + timeout_seconds
     
-    # Start execution
+    # Start execution, letting the server hold the request until the statement finishes
+    long_poll_seconds = int(min(MAX_WAIT_TIMEOUT_SECONDS, timeout_seconds))
     response = await execute_statement(
         statement=statement,
         warehouse_id=warehouse_id,
         catalog=catalog,
         schema=schema,
         parameters=parameters,
+        wait_timeout=f"{long_poll_seconds}s" if long_poll_seconds >= MIN_WAIT_TIMEOUT_SECONDS else "0s",
     )
     
     statement_id = response.get("statement_id")
     if not statement_id:
         raise ValueError("No statement_id returned from execution")
     
-    # Poll for completion
-    start_time = time.time()
-    status = response.get("status", {}).get("state", "")
-    
-    while status in ["PENDING", "RUNNING"]:
-        # Check timeout
-        if time.time() - start_time > timeout_seconds:
-            raise TimeoutError(f"Query execution timed out after {timeout_seconds} seconds")
-        
-        # Wait before polling again
-        await asyncio.sleep(poll_interval_seconds)
-        
-        # Check status
-        status_response = await get_statement_status(statement_id)
-        status = status_response.get("status", {}).get("state", "")
-        
-        if status == "SUCCEEDED":
-            return status_response
-        elif status in ["FAILED", "CANCELED", "CLOSED"]:
-            error_message = status_response.get("status", {}).get("error", {}).get("message", "Unknown error")
-            raise DatabricksAPIError(f"Query execution failed: {error_message}", response=status_response)
+    if response.get("status", {}).get("state") in PENDING_STATES:
+        response = await statement_poller.wait(
+            statement_id,
+            max(0.0, deadline - time.monotonic()),
+            poll_interval_seconds,
+        )
     
-    return response
+    status = response.get("status", {})
+    if status.get("state") != "SUCCEEDED":
+        error_message = status.get("error", {}).get("message", "Unknown error")
+        raise DatabricksAPIError(f"Query execution failed: {error_message}", response=response)
+    return await _with_all_chunks(response)
 
 
 async def get_statement_status(statement_id: str) -> Dict[str, Any]:
@@ -147,7 +386,16 @@ async def get_statement_status(statement_id: str) -> Dict[str, Any]:
         DatabricksAPIError: If the API request fails
     """
     logger.info(f"Getting status of SQL statement: {statement_id}")
-    return make_api_request("GET", f"/api/2.0/sql/statements/{statement_id}", params={})
+    return await make_api_request("GET", f"/api/2.0/sql/statements/{statement_id}", params={})
+
+
+def _statement_done(response: Dict[str, Any]) -> bool:
+    """Whether a statement has finished."""
+    return response.get("status", {}).get("state") not in PENDING_STATES
+
+
+# Central poller for the statements waited on through execute_and_wait
+statement_poller = BatchPoller("SQL statement", check_each(get_statement_status), _statement_done)
 
 
 async def cancel_statement(statement_id: str) -> Dict[str, Any]:
@@ -164,4 +412,492 @@ async def cancel_statement(statement_id: str) -> Dict[str, Any]:
         DatabricksAPIError: If the API request fails
     """
     logger.info(f"Cancelling SQL statement: {statement_id}")
-    return make_api_request("POST", f"/api/2.0/sql/statements/{statement_id}/cancel", data={}) 
\ No newline at end of file
+    return await make_api_request("POST", f"/api/2.0/sql/statements/{statement_id}/cancel", data={})
+
+
+async def get_result_chunk(statement_id: str, chunk_index: int) -> Dict[str, Any]:
+    """
+    Get a chunk of a statement result.
+    
+    For INLINE results the chunk contains the rows; for EXTERNAL_LINKS results it
+    contains fresh presigned links to download the chunk.
+    
+    Args:
+        statement_id: ID of the statement
+        chunk_index: Index of the result chunk
+        
+    Returns:
+        Response containing the result chunk
+        
+    Raises:
+        DatabricksAPIError: If the API request fails
+    """
+    logger.debug(f"Getting result chunk {chunk_index} of SQL statement: {statement_id}")
+    return await make_api_request("GET", f"/api/2.0/sql/statements/{statement_id}/result/chunks/{chunk_index}")
+
+
+# Result chunks fetched ahead for the next page of a paginated result, by statement and chunk index
+_PREFETCHED_CHUNKS_MAX = 4
+_prefetched_chunks: "OrderedDict[Tuple[str, int], asyncio.Future]" = OrderedDict()
+
+
+def _fetch_inline_chunk(statement_id: str, chunk_index: int, internal_link: Optional[str] = None) -> asyncio.Future:
+    """Start fetching an INLINE result chunk, reusing a chunk prefetched by an earlier page."""
+    prefetched = _prefetched_chunks.pop((statement_id, chunk_index), None)
+    if prefetched is not None:
+        return prefetched
+    if internal_link:
+        return asyncio.ensure_future(make_api_request("GET", internal_link))
+    return asyncio.ensure_future(get_result_chunk(statement_id, chunk_index))
+
+
+def _keep_prefetched_chunk(statement_id: str, chunk_index: int, chunk: asyncio.Future) -> None:
+    """Keep a (pending) chunk for the next page, dropping the oldest kept chunks."""
+    _prefetched_chunks[(statement_id, chunk_index)] = chunk
+    while len(_prefetched_chunks) > _PREFETCHED_CHUNKS_MAX:
+        _, dropped = _prefetched_chunks.popitem(last=False)
+        dropped.cancel()
+
+
+async def iter_result_chunks(
+    statement_id: str,
+    first_chunk: Optional[Dict[str, Any]] = None,
+    start_chunk_index: int = 0,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Iterate over the chunks of an INLINE statement result, prefetching the next chunk
+    while the current one is consumed.
+    
+    Chunks are followed through their next_chunk_internal_link (or next_chunk_index)
+    until the last chunk.
+    
+    Args:
+        statement_id: ID of the statement
+        first_chunk: The first chunk if already at hand, e.g. the "result" of the statement response
+        start_chunk_index: Index of the first chunk to fetch if first_chunk is not given
+        
+    Yields:
+        Result chunks, each containing chunk_index, row_offset and data_array
+        
+    Raises:
+        DatabricksAPIError: If the API request fails
+    """
+    if first_chunk is not None:
+        next_chunk: Optional[asyncio.Future] = asyncio.get_running_loop().create_future()
+        next_chunk.set_result(first_chunk)
+    else:
+        next_chunk = _fetch_inline_chunk(statement_id, start_chunk_index)
+    next_index = start_chunk_index
+    try:
+        while next_chunk is not None:
+            chunk = await next_chunk
+            next_index = chunk.get("next_chunk_index")
+            next_chunk = (
+                _fetch_inline_chunk(statement_id, next_index, chunk.get("next_chunk_internal_link"))
+                if next_index is not None
+                else None
+            )
+            yield chunk
+    except GeneratorExit:
+        # The consumer stopped early: keep the prefetched chunk for the next page
+        if next_chunk is not None:
+            _keep_prefetched_chunk(statement_id, next_index, next_chunk)
+        raise
+
+
+async def _with_all_chunks(response: Dict[str, Any]) -> Dict[str, Any]:
+    """Inline the rows of all chunks of a finished INLINE result into the statement response."""
+    result = response.get("result", {})
+    if "external_links" in result or result.get("next_chunk_index") is None:
+        return response
+    return await read_result_page(response)
+
+
+def _encode_result_cursor(statement_id: str, chunk_index: int, offset: int) -> str:
+    """Encode a position in a statement result as an opaque cursor."""
+    payload = serialization.dumps_bytes({"statement_id": statement_id, "chunk_index": chunk_index, "offset": offset})
+    return base64.urlsafe_b64encode(payload).decode("ascii")
+
+
+def _decode_result_cursor(cursor: str) -> Tuple[str, int, int]:
+    """Decode a cursor produced by _encode_result_cursor."""
+    try:
+        payload = serialization.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return payload["statement_id"], int(payload.get("chunk_index", 0)), int(payload.get("offset", 0))
+    except (ValueError, TypeError, AttributeError, KeyError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def cursor_statement_id(cursor: str) -> str:
+    """
+    Get the ID of the statement a result cursor belongs to.
+    
+    Args:
+        cursor: Cursor returned with a result page
+        
+    Returns:
+        ID of the statement
+        
+    Raises:
+        ValueError: If the cursor is invalid
+    """
+    return _decode_result_cursor(cursor)[0]
+
+
+async def read_result_page(
+    response: Optional[Dict[str, Any]] = None,
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Read a page of rows of a finished INLINE statement result, across result chunks.
+    
+    Args:
+        response: Statement response of a statement that has SUCCEEDED, to read the first page
+        cursor: Cursor returned with a previous page, to read the page after it
+        page_size: Maximum number of rows in the page; all remaining rows if not set
+        
+    Returns:
+        Response with the rows of the page as result, and a next_cursor if more rows remain
+        
+    Raises:
+        DatabricksAPIError: If the API request fails
+        ValueError: If neither a response nor a valid cursor is given
+    """
+    if cursor:
+        statement_id, chunk_index, offset = _decode_result_cursor(cursor)
+        page: Dict[str, Any] = {"statement_id": statement_id}
+        chunks = iter_result_chunks(statement_id, start_chunk_index=chunk_index)
+    elif response is not None:
+        statement_id, offset = response["statement_id"], 0
+        page = dict(response)
+        chunks = iter_result_chunks(statement_id, first_chunk=response.get("result", {}))
+    else:
+        raise ValueError("Either a statement response or a cursor is required")
+    
+    rows: List[Any] = []
+    row_offset = None
+    next_cursor = None
+    try:
+        async for chunk in chunks:
+            data = chunk.get("data_array", [])
+            if row_offset is None:
+                row_offset = chunk.get("row_offset", 0) + offset
+            end = len(data) if page_size is None else min(len(data), offset + page_size - len(rows))
+            rows.extend(data[offset:end])
+            offset = 0
+            if page_size is not None and len(rows) >= page_size:
+                if end < len(data):
+                    chunk_index = chunk.get("chunk_index", 0)
+                    next_cursor = _encode_result_cursor(statement_id, chunk_index, end)
+                    # The next page starts inside this chunk
+                    current = asyncio.get_running_loop().create_future()
+                    current.set_result(chunk)
+                    _keep_prefetched_chunk(statement_id, chunk_index, current)
+                elif chunk.get("next_chunk_index") is not None:
+                    next_cursor = _encode_result_cursor(statement_id, chunk["next_chunk_index"], 0)
+                break
+    finally:
+        await chunks.aclose()
+    
+    page["result"] = {"row_offset": row_offset or 0, "row_count": len(rows), "data_array": rows}
+    if next_cursor:
+        page["next_cursor"] = next_cursor
+    return page
+
+
+def _decode_chunk(result_format: str, body: bytes) -> Any:
+    """Decode a downloaded result chunk into rows, or into an Arrow table for ARROW_STREAM."""
+    if result_format == "JSON_ARRAY":
+        return serialization.loads(body) if body else []
+    if result_format == "CSV":
+        return list(csv.reader(io.StringIO(body.decode("utf-8"))))
+    if result_format == "ARROW_STREAM":
+        if pa is None:
+            raise ImportError("pyarrow is required to decode ARROW_STREAM results")
+        return pa.ipc.open_stream(body).read_all()
+    raise ValueError(f"Unsupported result format: {result_format}")
+
+
+def _chunk_row_count(chunk: Any) -> int:
+    """Get the number of rows of a decoded chunk."""
+    return chunk.num_rows if pa is not None and isinstance(chunk, pa.Table) else len(chunk)
+
+
+async def _download_chunk(
+    statement_id: str,
+    chunk_index: int,
+    links: Dict[int, Dict[str, Any]],
+    result_format: str,
+) -> Tuple[Dict[str, Any], Any]:
+    """
+    Download and decode one external result chunk.
+    
+    Links that are unknown, about to expire or rejected by the storage service
+    are (re-)resolved through the chunks API.
+    """
+    link = links.pop(chunk_index, None)
+    for attempt in range(2):
+        if link is None:
+            chunk = await get_result_chunk(statement_id, chunk_index)
+            link = next(
+                (l for l in chunk.get("external_links", []) if l.get("chunk_index") == chunk_index),
+                None,
+            )
+            if link is None:
+                raise DatabricksAPIError(f"No external link returned for chunk {chunk_index} of statement {statement_id}")
+        try:
+            body = await download_presigned_url(link["external_link"], link.get("http_headers"))
+            break
+        except DatabricksAPIError as e:
+            # Presigned links expire; fetch a fresh one once
+            if attempt or e.status_code not in (401, 403):
+                raise
+            link = None
+
+    # Decoding large chunks is CPU-bound, keep it off the event loop
+    decoded = await asyncio.to_thread(_decode_chunk, result_format, body)
+    return link, decoded
+
+
+async def _iter_external_chunks(
+    response: Dict[str, Any],
+    concurrency: Optional[int] = None,
+) -> AsyncIterator[Any]:
+    """
+    Download the chunks of a finished EXTERNAL_LINKS result in parallel and yield them in order.
+    
+    At most `concurrency` chunks are downloaded or held in memory at a time.
+    Chunk indexes, row offsets and row counts are verified against the links.
+    """
+    statement_id = response["statement_id"]
+    manifest = response.get("manifest", {})
+    result_format = manifest.get("format", "JSON_ARRAY")
+    total_chunks = manifest.get("total_chunk_count", 0)
+    concurrency = max(1, concurrency or settings.SQL_DOWNLOAD_CONCURRENCY)
+    links = {
+        link["chunk_index"]: link
+        for link in response.get("result", {}).get("external_links", [])
+    }
+    logger.info(f"Downloading {total_chunks} result chunks of SQL statement {statement_id} ({concurrency} at a time)")
+
+    pending: Dict[int, asyncio.Task] = {}
+    next_to_schedule = 0
+    expected_offset = 0
+    try:
+        for chunk_index in range(total_chunks):
+            while next_to_schedule < total_chunks and len(pending) < concurrency:
+                pending[next_to_schedule] = asyncio.ensure_future(
+                    _download_chunk(statement_id, next_to_schedule, links, result_format)
+                )
+                next_to_schedule += 1
+
+            link, chunk = await pending.pop(chunk_index)
+            row_count = _chunk_row_count(chunk)
+            if link.get("chunk_index") != chunk_index or link.get("row_offset", expected_offset) != expected_offset:
+                raise DatabricksAPIError(
+                    f"Out-of-order result chunk for statement {statement_id}: expected chunk {chunk_index} "
+                    f"at row {expected_offset}, got chunk {link.get('chunk_index')} at row {link.get('row_offset')}"
+                )
+            if "row_count" in link and link["row_count"] != row_count:
+                raise DatabricksAPIError(
+                    f"Incomplete result chunk {chunk_index} for statement {statement_id}: "
+                    f"expected {link['row_count']} rows, got {row_count}"
+                )
+            expected_offset += row_count
+            yield chunk
+    finally:
+        for task in pending.values():
+            task.cancel()
+
+
+async def iter_external_link_rows(
+    response: Dict[str, Any],
+    concurrency: Optional[int] = None,
+) -> AsyncIterator[List[Any]]:
+    """
+    Stream the rows of a finished EXTERNAL_LINKS statement result.
+    
+    Chunks are downloaded in parallel with bounded concurrency and yielded in
+    chunk order, so at most `concurrency` chunks are held in memory at a time.
+    Chunk indexes and row offsets are verified against the result manifest.
+    
+    Args:
+        response: Statement response (from execute_statement or get_statement_status)
+            of a statement that has SUCCEEDED
+        concurrency: Maximum number of chunks downloaded at once
+        
+    Yields:
+        Result rows, in order
+        
+    Raises:
+        DatabricksAPIError: If a download fails or chunks are inconsistent
+    """
+    chunks = _iter_external_chunks(response, concurrency)
+    try:
+        async for chunk in chunks:
+            if pa is not None and isinstance(chunk, pa.Table):
+                columns = [column.to_pylist() for column in chunk.columns]
+                for row in zip(*columns):
+                    yield list(row)
+            else:
+                for row in chunk:
+                    yield row
+    finally:
+        await chunks.aclose()
+
+
+async def iter_arrow_batches(
+    response: Dict[str, Any],
+    concurrency: Optional[int] = None,
+) -> AsyncIterator["pa.RecordBatch"]:
+    """
+    Stream the columnar record batches of a finished ARROW_STREAM statement result.
+    
+    Args:
+        response: Statement response of an EXTERNAL_LINKS statement in ARROW_STREAM
+            format that has SUCCEEDED
+        concurrency: Maximum number of chunks downloaded at once
+        
+    Yields:
+        Arrow record batches, in order
+        
+    Raises:
+        DatabricksAPIError: If a download fails or chunks are inconsistent
+        ImportError: If pyarrow is not installed
+        ValueError: If the result is not in ARROW_STREAM format
+    """
+    if pa is None:
+        raise ImportError("pyarrow is required to decode ARROW_STREAM results")
+    if response.get("manifest", {}).get("format") != "ARROW_STREAM":
+        raise ValueError("Statement result is not in ARROW_STREAM format")
+    chunks = _iter_external_chunks(response, concurrency)
+    try:
+        async for table in chunks:
+            for batch in table.to_batches():
+                yield batch
+    finally:
+        await chunks.aclose()
+
+
+def _jsonable_column(column: "pa.Array") -> List[Any]:
+    """Convert an Arrow column to a list of JSON-serializable values."""
+    if pa.types.is_integer(column.type) or pa.types.is_floating(column.type) \
+            or pa.types.is_boolean(column.type) or pa.types.is_string(column.type) or pa.types.is_null(column.type):
+        return column.to_pylist()
+    try:
+        return column.cast(pa.string()).to_pylist()
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        return [None if value is None else str(value) for value in column.to_pylist()]
+
+
+def _server_truncated(response: Dict[str, Any]) -> bool:
+    """Whether the server cut the result short at the row or byte limit of the statement."""
+    return bool(response.get("manifest", {}).get("truncated"))
+
+
+async def collect_arrow_result(
+    response: Dict[str, Any],
+    max_rows: Optional[int] = None,
+    output: str = "columns",
+) -> Dict[str, Any]:
+    """
+    Download a finished ARROW_STREAM result and inline it into the response in a compact form.
+    
+    Args:
+        response: Statement response of a statement that has SUCCEEDED
+        max_rows: Stop after this many rows; all rows if not set
+        output: "columns" for a mapping of column name to value list, or "csv" for CSV text
+        
+    Returns:
+        The response with the presigned links replaced by the downloaded result; truncated is
+        set if rows were left out by max_rows or by the server (server_truncated)
+        
+    Raises:
+        DatabricksAPIError: If a download fails or chunks are inconsistent
+        ImportError: If pyarrow is not installed
+        ValueError: If the output or result format is invalid
+    """
+    if output not in ("columns", "csv"):
+        raise ValueError("output must be one of: columns, csv")
+    
+    batches: List[pa.RecordBatch] = []
+    row_count = 0
+    truncated = False
+    batch_iter = iter_arrow_batches(response)
+    try:
+        async for batch in batch_iter:
+            if max_rows is not None and row_count + batch.num_rows > max_rows:
+                batch = batch.slice(0, max_rows - row_count)
+                truncated = True
+            batches.append(batch)
+            row_count += batch.num_rows
+            if truncated:
+                break
+    finally:
+        await batch_iter.aclose()
+    
+    if batches:
+        table = pa.Table.from_batches(batches)
+    else:
+        columns = response.get("manifest", {}).get("schema", {}).get("columns", [])
+        table = pa.table({column["name"]: pa.array([], pa.null()) for column in columns})
+    
+    result_data: Dict[str, Any] = {
+        "row_count": row_count,
+        "truncated": truncated or _server_truncated(response),
+        "server_truncated": _server_truncated(response),
+    }
+    if output == "csv":
+        buffer = io.BytesIO()
+        pa_csv.write_csv(table, buffer)
+        result_data["csv"] = buffer.getvalue().decode("utf-8")
+    else:
+        result_data["columns"] = {
+            name: _jsonable_column(column.combine_chunks())
+            for name, column in zip(table.column_names, table.columns)
+        }
+    
+    result = dict(response)
+    result["result"] = result_data
+    return result
+
+
+async def collect_external_link_result(
+    response: Dict[str, Any],
+    max_rows: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Download a finished EXTERNAL_LINKS result and inline its rows into the response.
+    
+    Args:
+        response: Statement response of a statement that has SUCCEEDED
+        max_rows: Stop after this many rows; all rows if not set
+        
+    Returns:
+        The response with the presigned links replaced by the downloaded rows; truncated is
+        set if rows were left out by max_rows or by the server (server_truncated)
+        
+    Raises:
+        DatabricksAPIError: If a download fails or chunks are inconsistent
+    """
+    rows: List[Any] = []
+    truncated = False
+    rows_iter = iter_external_link_rows(response)
+    try:
+        async for row in rows_iter:
+            if max_rows is not None and len(rows) >= max_rows:
+                truncated = True
+                break
+            rows.append(row)
+    finally:
+        await rows_iter.aclose()
+    
+    result = dict(response)
+    result["result"] = {
+        "row_count": len(rows),
+        "data_array": rows,
+        "truncated": truncated or _server_truncated(response),
+        "server_truncated": _server_truncated(response),
+    }
+    return result
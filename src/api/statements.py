@@ -0,0 +1,272 @@
+"""
+Asynchronous execution of SQL statements: submit, poll, fetch results and cancel.
+
+Statements are submitted without waiting for them to finish and tracked in a
+server-side registry, so many long-running queries can be in flight at once
+without a tool call or connection being held open for each of them.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from src.api import sql
+from src.core.config import settings
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Statement states after which a statement no longer changes
+TERMINAL_STATES = ("SUCCEEDED", "FAILED", "CANCELED", "CLOSED")
+
+
+class StatementRegistry:
+    """Registry of the SQL statements submitted through this server."""
+
+    def __init__(self, max_entries: int, retention_seconds: float):
+        self.max_entries = max_entries
+        self.retention_seconds = retention_seconds
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def add(self, statement_id: str, statement: str, warehouse_id: str, state: str) -> Dict[str, Any]:
+        """Register a submitted statement."""
+        self._prune()
+        now = time.monotonic()
+        entry = {
+            "statement_id": statement_id,
+            "statement": statement[:200],
+            "warehouse_id": warehouse_id,
+            "state": state,
+            "submitted_at": now,
+            "finished_at": now if state in TERMINAL_STATES else None,
+        }
+        self._entries[statement_id] = entry
+        return entry
+
+    def update(self, statement_id: str, state: str) -> None:
+        """Record the latest known state of a statement."""
+        entry = self._entries.get(statement_id)
+        if entry is None:
+            return
+        entry["state"] = state
+        if state in TERMINAL_STATES and entry["finished_at"] is None:
+            entry["finished_at"] = time.monotonic()
+
+    def get(self, statement_id: str) -> Optional[Dict[str, Any]]:
+        """Get the registry entry of a statement, if it was submitted through this server."""
+        return self._entries.get(statement_id)
+
+    def pending(self) -> List[str]:
+        """Get the IDs of the statements that have not finished yet."""
+        return [statement_id for statement_id, entry in self._entries.items() if entry["finished_at"] is None]
+
+    def describe(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Summarize a registry entry for a tool response."""
+        now = time.monotonic()
+        end = entry["finished_at"] if entry["finished_at"] is not None else now
+        return {
+            "statement_id": entry["statement_id"],
+            "statement": entry["statement"],
+            "warehouse_id": entry["warehouse_id"],
+            "state": entry["state"],
+            "elapsed_seconds": round(end - entry["submitted_at"], 1),
+        }
+
+    def list_all(self) -> List[Dict[str, Any]]:
+        """Summarize all registered statements, most recent first."""
+        self._prune()
+        return [self.describe(entry) for entry in reversed(self._entries.values())]
+
+    def _prune(self) -> None:
+        """Drop finished statements past the retention period, and the oldest if the registry is full."""
+        now = time.monotonic()
+        expired = [
+            statement_id
+            for statement_id, entry in self._entries.items()
+            if entry["finished_at"] is not None and now - entry["finished_at"] > self.retention_seconds
+        ]
+        for statement_id in expired:
+            del self._entries[statement_id]
+        while len(self._entries) >= self.max_entries:
+            self._entries.popitem(last=False)
+
+
+# Global statement registry instance
+statement_registry = StatementRegistry(settings.SQL_STATEMENT_REGISTRY_MAX, settings.SQL_STATEMENT_RETENTION_SECONDS)
+
+
+def _status_summary(response: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract the state, error and result shape of a statement response, without the rows."""
+    status = response.get("status", {})
+    summary: Dict[str, Any] = {"statement_id": response.get("statement_id"), "state": status.get("state")}
+    if "error" in status:
+        summary["error"] = status["error"]
+    manifest = response.get("manifest")
+    if manifest:
+        summary["manifest"] = {
+            key: manifest[key]
+            for key in ("format", "total_row_count", "total_chunk_count", "truncated")
+            if key in manifest
+        }
+        summary["manifest"]["columns"] = [
+            {"name": column.get("name"), "type_name": column.get("type_name")}
+            for column in manifest.get("schema", {}).get("columns", [])
+        ]
+    return summary
+
+
+async def submit(
+    statement: str,
+    warehouse_id: str,
+    catalog: Optional[str] = None,
+    schema: Optional[str] = None,
+    parameters: Optional[Dict[str, Any]] = None,
+    row_limit: int = 10000,
+    disposition: str = "INLINE",
+    format: str = "JSON_ARRAY",
+) -> Dict[str, Any]:
+    """
+    Submit a SQL statement without waiting for it to finish.
+
+    Args:
+        statement: The SQL statement to execute
+        warehouse_id: ID of the SQL warehouse to use
+        catalog: Optional catalog to use
+        schema: Optional schema to use
+        parameters: Optional statement parameters
+        row_limit: Maximum number of rows to return
+        disposition: INLINE or EXTERNAL_LINKS
+        format: Result format (JSON_ARRAY, ARROW_STREAM or CSV)
+
+    Returns:
+        Response containing the statement ID and its initial state
+
+    Raises:
+        DatabricksAPIError: If the API request fails
+        ValueError: If the disposition or format is invalid
+    """
+    response = await sql.execute_statement(
+        statement=statement,
+        warehouse_id=warehouse_id,
+        catalog=catalog,
+        schema=schema,
+        parameters=parameters,
+        row_limit=row_limit,
+        disposition=disposition,
+        format=format,
+        wait_timeout="0s",
+    )
+    summary = _status_summary(response)
+    statement_registry.add(summary["statement_id"], statement, warehouse_id, summary["state"])
+    logger.info(f"Submitted SQL statement {summary['statement_id']} ({summary['state']})")
+    return summary
+
+
+async def poll(statement_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Get the state of a submitted SQL statement, or of all statements in the registry.
+
+    Args:
+        statement_id: ID of the statement; if not set, all registered statements are listed
+            and the unfinished ones are refreshed
+
+    Returns:
+        Response containing the state of the statement(s); a listed statement whose
+        state could not be refreshed keeps its last known state and carries the error
+
+    Raises:
+        DatabricksAPIError: If the API request fails
+    """
+    if statement_id:
+        summary = _status_summary(await sql.get_statement_status(statement_id))
+        statement_registry.update(statement_id, summary["state"])
+        entry = statement_registry.get(statement_id)
+        if entry is not None:
+            summary["elapsed_seconds"] = statement_registry.describe(entry)["elapsed_seconds"]
+        return summary
+
+    pending_ids = statement_registry.pending()
+    responses = await asyncio.gather(
+        *(sql.get_statement_status(pending_id) for pending_id in pending_ids),
+        return_exceptions=True,
+    )
+    errors: Dict[str, str] = {}
+    for pending_id, response in zip(pending_ids, responses):
+        if isinstance(response, Exception):
+            # One failed status check keeps its last known state and reports the error
+            logger.warning(f"Failed to refresh the state of SQL statement {pending_id}: {response}")
+            errors[pending_id] = str(response)
+            continue
+        statement_registry.update(pending_id, response.get("status", {}).get("state"))
+    statements = statement_registry.list_all()
+    for summary in statements:
+        if summary["statement_id"] in errors:
+            summary["error"] = errors[summary["statement_id"]]
+    return {"statements": statements}
+
+
+async def fetch_results(
+    statement_id: str,
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    max_rows: Optional[int] = None,
+    output: str = "columns",
+) -> Dict[str, Any]:
+    """
+    Fetch the results of a finished SQL statement.
+
+    INLINE results are returned one page at a time with a next_cursor;
+    EXTERNAL_LINKS results are downloaded and inlined up to max_rows.
+
+    Args:
+        statement_id: ID of the statement
+        cursor: Cursor returned with a previous page, to read the page after it
+        page_size: Rows per page of an INLINE result
+        max_rows: Maximum number of rows of an EXTERNAL_LINKS result
+        output: columns or csv, how ARROW_STREAM results are returned
+
+    Returns:
+        Response containing the result rows, or the statement state if it has not succeeded
+
+    Raises:
+        DatabricksAPIError: If the API request fails
+        ValueError: If the cursor is invalid or belongs to another statement
+    """
+    page_size = page_size or settings.SQL_PAGE_ROWS
+    if cursor:
+        cursor_statement_id = sql.cursor_statement_id(cursor)
+        if cursor_statement_id != statement_id:
+            raise ValueError(f"Cursor belongs to statement {cursor_statement_id}, not {statement_id}")
+        return await sql.read_result_page(cursor=cursor, page_size=page_size)
+
+    response = await sql.get_statement_status(statement_id)
+    state = response.get("status", {}).get("state")
+    statement_registry.update(statement_id, state)
+    if state != "SUCCEEDED":
+        return _status_summary(response)
+
+    if "external_links" in response.get("result", {}):
+        if response.get("manifest", {}).get("format") == "ARROW_STREAM":
+            return await sql.collect_arrow_result(response, max_rows, output)
+        return await sql.collect_external_link_result(response, max_rows)
+    return await sql.read_result_page(response, page_size=page_size)
+
+
+async def cancel(statement_id: str) -> Dict[str, Any]:
+    """
+    Cancel a submitted SQL statement.
+
+    Args:
+        statement_id: ID of the statement
+
+    Returns:
+        Response confirming the cancel request; the statement state is updated by the next poll
+
+    Raises:
+        DatabricksAPIError: If the API request fails
+    """
+    await sql.cancel_statement(statement_id)
+    logger.info(f"Requested cancellation of SQL statement {statement_id}")
+    return {"statement_id": statement_id, "cancel_requested": True}
@@ -0,0 +1,402 @@
+"""
+Response caching for read-only Databricks API endpoints.
+
+Responses are cached as raw bytes in a bounded in-memory LRU, evicted by total
+size, with a per-endpoint TTL. Slow-changing metadata is optionally also kept
+in a persistent SQLite tier behind the in-memory one, so a restarted server
+starts warm; entries that can change outside the server are revalidated in
+the background when they are served from disk. Mutations sent through the server invalidate the read endpoints
+they affect in both tiers, e.g. terminating a cluster evicts every cached
+clusters/get and clusters/list response.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from src.core.config import get_api_path, settings
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Cache TTL in seconds per read endpoint (path without the /api/<version>/ prefix).
+# Endpoints not listed here are never cached.
+CACHE_TTLS: Dict[str, float] = {
+    "clusters/get": 5,
+    "clusters/list": 5,
+    "clusters/spark-versions": 3600,
+    "clusters/list-node-types": 3600,
+    "jobs/get": 60,
+    "jobs/list": 30,
+    "workspace/list": 30,
+    "workspace/get-status": 30,
+    "dbfs/list": 15,
+    "dbfs/get-status": 15,
+}
+
+# TTL in seconds of the persistent tier per read endpoint. Endpoints not listed
+# here are only cached in memory.
+DISK_CACHE_TTLS: Dict[str, float] = {
+    "clusters/spark-versions": 86400,
+    "clusters/list-node-types": 86400,
+    "jobs/get": 86400,
+    "workspace/list": 86400,
+}
+
+# Persisted endpoints that can change outside the server. A response of these
+# read from disk is served once, then fetched again in the background, so it
+# is stale for at most one read after a restart.
+DISK_CACHE_REVALIDATE = {"jobs/get", "workspace/list"}
+
+# Bump when the layout of cached entries changes, so older entries are ignored
+DISK_CACHE_FORMAT_VERSION = 1
+
+# Read endpoints invalidated by each mutating endpoint
+INVALIDATIONS: Dict[str, Tuple[str, ...]] = {
+    "clusters/create": ("clusters/get", "clusters/list"),
+    "clusters/edit": ("clusters/get", "clusters/list"),
+    "clusters/delete": ("clusters/get", "clusters/list"),
+    "clusters/permanent-delete": ("clusters/get", "clusters/list"),
+    "clusters/start": ("clusters/get", "clusters/list"),
+    "clusters/restart": ("clusters/get", "clusters/list"),
+    "clusters/resize": ("clusters/get", "clusters/list"),
+    "jobs/create": ("jobs/get", "jobs/list"),
+    "jobs/update": ("jobs/get", "jobs/list"),
+    "jobs/reset": ("jobs/get", "jobs/list"),
+    "jobs/delete": ("jobs/get", "jobs/list"),
+    "workspace/import": ("workspace/list", "workspace/get-status"),
+    "workspace/delete": ("workspace/list", "workspace/get-status"),
+    "workspace/mkdirs": ("workspace/list", "workspace/get-status"),
+    "dbfs/put": ("dbfs/list", "dbfs/get-status"),
+    "dbfs/create": ("dbfs/list", "dbfs/get-status"),
+    "dbfs/close": ("dbfs/list", "dbfs/get-status"),
+    "dbfs/delete": ("dbfs/list", "dbfs/get-status"),
+    "dbfs/mkdirs": ("dbfs/list", "dbfs/get-status"),
+    "dbfs/move": ("dbfs/list", "dbfs/get-status"),
+}
+
+
+class ResponseCache:
+    """Thread-safe TTL cache with LRU eviction bounded by total byte size."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[str, float, bytes]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def generation(self, path: str) -> int:
+        """
+        Get the invalidation generation of a read endpoint.
+
+        A response fetched before an invalidation must not be stored after it;
+        callers capture the generation before fetching and pass it to set().
+        """
+        with self._lock:
+            return self._generations.get(path, 0)
+
+    def is_current(self, path: str, generation: int) -> bool:
+        """Check that a read endpoint has not been invalidated since the given generation."""
+        return self.generation(path) == generation
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Get a cached response body.
+
+        Args:
+            key: Request key
+
+        Returns:
+            The cached body, or None on a miss or expired entry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            path, expires_at, value = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, path: str, value: bytes, ttl: float, generation: int) -> None:
+        """
+        Store a response body.
+
+        Args:
+            key: Request key
+            path: Read endpoint the response belongs to
+            value: Raw response body
+            ttl: Time to live in seconds
+            generation: Generation of the endpoint captured before fetching
+        """
+        size = len(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if self._generations.get(path, 0) != generation:
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (path, time.monotonic() + ttl, value)
+            self._size += size
+            while self._size > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate(self, paths: Tuple[str, ...]) -> None:
+        """
+        Drop every cached response of the given read endpoints.
+
+        Args:
+            paths: Read endpoints to invalidate
+        """
+        with self._lock:
+            for path in paths:
+                self._generations[path] = self._generations.get(path, 0) + 1
+            stale = [key for key, (path, _, _) in self._entries.items() if path in paths]
+            for key in stale:
+                self._remove(key)
+            self.invalidations += len(stale)
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry; the lock must be held."""
+        _, _, value = self._entries.pop(key)
+        self._size -= len(value)
+
+    def stats(self) -> Dict[str, float]:
+        """Get cache metrics, including the hit rate."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+class DiskCache:
+    """Persistent, size-bounded SQLite cache tier for slow-changing responses."""
+
+    def __init__(self, directory: str, max_bytes: int, stamp: str):
+        self.max_bytes = max_bytes
+        self.stamp = stamp
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        self.path = os.path.join(directory, "responses.sqlite3")
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                path TEXT NOT NULL,
+                stamp TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                size INTEGER NOT NULL,
+                value BLOB NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_path ON entries (path)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)")
+
+        # Entries written for another workspace, token or format version are never served
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE stamp != ? OR expires_at <= ?", (stamp, time.time()))
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Tuple[bytes, float]]:
+        """
+        Get a cached response body.
+
+        Args:
+            key: Request key
+
+        Returns:
+            Tuple of the cached body and its remaining TTL in seconds, or None on a miss
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM entries WHERE key = ? AND stamp = ? AND expires_at > ?",
+                (key, self.stamp, now),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+            self.hits += 1
+        value, expires_at = row
+        return bytes(value), expires_at - now
+
+    def set(self, key: str, path: str, value: bytes, ttl: float) -> None:
+        """
+        Store a response body, evicting least recently used entries beyond the size cap.
+
+        Args:
+            key: Request key
+            path: Read endpoint the response belongs to
+            value: Raw response body
+            ttl: Time to live in seconds
+        """
+        size = len(value)
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, path, stamp, expires_at, accessed_at, size, value) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, path, self.stamp, now + ttl, now, size, value),
+                )
+                total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+                if total > self.max_bytes:
+                    rows = self._conn.execute("SELECT key, size FROM entries ORDER BY accessed_at").fetchall()
+                    evict = []
+                    for old_key, old_size in rows:
+                        if total <= self.max_bytes:
+                            break
+                        evict.append((old_key,))
+                        total -= old_size
+                    self._conn.executemany("DELETE FROM entries WHERE key = ?", evict)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def invalidate(self, paths: Tuple[str, ...]) -> None:
+        """
+        Drop every cached response of the given read endpoints.
+
+        Args:
+            paths: Read endpoints to invalidate
+        """
+        with self._lock:
+            self._conn.executemany("DELETE FROM entries WHERE path = ?", [(path,) for path in paths])
+
+    def stats(self) -> Dict[str, float]:
+        """Get persistent tier metrics."""
+        with self._lock:
+            entries, size = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "entries": entries,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+def cache_ttl(endpoint: str) -> Optional[float]:
+    """
+    Get the cache TTL of an endpoint.
+
+    Args:
+        endpoint: API endpoint path
+
+    Returns:
+        TTL in seconds, or None if responses of this endpoint are not cached
+    """
+    if not settings.CACHE_ENABLED:
+        return None
+    return CACHE_TTLS.get(get_api_path(endpoint))
+
+
+def needs_revalidation(endpoint: str) -> bool:
+    """Whether a response of an endpoint read from the persistent tier has to be fetched again."""
+    return get_api_path(endpoint) in DISK_CACHE_REVALIDATE
+
+
+def disk_cache_ttl(endpoint: str) -> Optional[float]:
+    """
+    Get the persistent tier TTL of an endpoint.
+
+    Args:
+        endpoint: API endpoint path
+
+    Returns:
+        TTL in seconds, or None if responses of this endpoint are not persisted
+    """
+    if disk_cache is None or not settings.CACHE_ENABLED:
+        return None
+    return DISK_CACHE_TTLS.get(get_api_path(endpoint))
+
+
+async def invalidate_for(endpoint: str) -> None:
+    """
+    Invalidate the cached reads affected by a mutating request in every tier.
+
+    Args:
+        endpoint: API endpoint path of the mutating request
+    """
+    paths = INVALIDATIONS.get(get_api_path(endpoint))
+    if paths:
+        logger.debug(f"Invalidating cached {', '.join(paths)} after {endpoint}")
+        response_cache.invalidate(paths)
+        if disk_cache is not None:
+            await asyncio.to_thread(disk_cache.invalidate, paths)
+
+
+def _build_disk_cache() -> Optional[DiskCache]:
+    """Build the persistent cache tier from the current settings, if configured."""
+    if not settings.DISK_CACHE_DIR:
+        return None
+    # Entries are stamped with the workspace and credentials they were fetched with
+    identity = hashlib.sha256(f"{settings.DATABRICKS_HOST}\n{settings.DATABRICKS_TOKEN}".encode("utf-8")).hexdigest()
+    stamp = f"v{DISK_CACHE_FORMAT_VERSION}:{identity[:16]}"
+    try:
+        return DiskCache(os.path.expanduser(settings.DISK_CACHE_DIR), settings.DISK_CACHE_MAX_BYTES, stamp)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"Persistent cache disabled, could not open {settings.DISK_CACHE_DIR}: {str(e)}")
+        return None
+
+
+# Global response cache instances
+response_cache = ResponseCache(settings.CACHE_MAX_BYTES)
+disk_cache = _build_disk_cache()
+
+
+def get_cache_stats() -> Dict[str, float]:
+    """Get response cache metrics, including the hit rate."""
+    stats = response_cache.stats()
+    if disk_cache is not None:
+        stats["disk"] = disk_cache.stats()
+    return stats
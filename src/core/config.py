@@ -3,6 +3,7 @@ Configuration settings for the Databricks MCP server.
 """
 
 import os
+import re
 from typing import Any, Dict, Optional
 
 # Import dotenv if available, but don't require it
@@ -40,6 +41,70 @@ class Settings(BaseSettings):
     SERVER_PORT: int = int(os.environ.get("SERVER_PORT", "8000"))
     DEBUG: bool = os.environ.get("DEBUG", "False").lower() == "true"
 
+    # HTTP connection pool
+    HTTP_MAX_CONNECTIONS: int = int(os.environ.get("HTTP_MAX_CONNECTIONS", "100"))
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = int(os.environ.get("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+    HTTP_KEEPALIVE_EXPIRY_SECONDS: float = float(os.environ.get("HTTP_KEEPALIVE_EXPIRY_SECONDS", "60"))
+    HTTP_TIMEOUT_SECONDS: float = float(os.environ.get("HTTP_TIMEOUT_SECONDS", "60"))
+    HTTP_CONNECT_TIMEOUT_SECONDS: float = float(os.environ.get("HTTP_CONNECT_TIMEOUT_SECONDS", "10"))
+    HTTP2_ENABLED: bool = os.environ.get("HTTP2_ENABLED", "True").lower() == "true"
+
+    # Retries
+    RETRY_MAX_ATTEMPTS: int = int(os.environ.get("RETRY_MAX_ATTEMPTS", "5"))
+    RETRY_BACKOFF_BASE_SECONDS: float = float(os.environ.get("RETRY_BACKOFF_BASE_SECONDS", "0.5"))
+    RETRY_BACKOFF_MAX_SECONDS: float = float(os.environ.get("RETRY_BACKOFF_MAX_SECONDS", "30"))
+    RETRY_TIME_BUDGET_SECONDS: float = float(os.environ.get("RETRY_TIME_BUDGET_SECONDS", "120"))
+
+    # Client-side rate limits (requests per second per API family, 0 disables the limit)
+    RATE_LIMIT_ENABLED: bool = os.environ.get("RATE_LIMIT_ENABLED", "True").lower() == "true"
+    RATE_LIMIT_BURST: float = float(os.environ.get("RATE_LIMIT_BURST", "10"))
+    RATE_LIMIT_CLUSTERS_PER_SECOND: float = float(os.environ.get("RATE_LIMIT_CLUSTERS_PER_SECOND", "20"))
+    RATE_LIMIT_JOBS_PER_SECOND: float = float(os.environ.get("RATE_LIMIT_JOBS_PER_SECOND", "20"))
+    RATE_LIMIT_WORKSPACE_PER_SECOND: float = float(os.environ.get("RATE_LIMIT_WORKSPACE_PER_SECOND", "20"))
+    RATE_LIMIT_DBFS_PER_SECOND: float = float(os.environ.get("RATE_LIMIT_DBFS_PER_SECOND", "30"))
+    RATE_LIMIT_SQL_PER_SECOND: float = float(os.environ.get("RATE_LIMIT_SQL_PER_SECOND", "20"))
+
+    # Response cache for read-only endpoints
+    CACHE_ENABLED: bool = os.environ.get("CACHE_ENABLED", "True").lower() == "true"
+    CACHE_MAX_BYTES: int = int(os.environ.get("CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+    # Persistent cache tier for slow-changing metadata (disabled when DISK_CACHE_DIR is empty)
+    DISK_CACHE_DIR: str = os.environ.get("DISK_CACHE_DIR", "")
+    DISK_CACHE_MAX_BYTES: int = int(os.environ.get("DISK_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+
+    # Job index used by the search_jobs tool
+    JOB_INDEX_REFRESH_SECONDS: float = float(os.environ.get("JOB_INDEX_REFRESH_SECONDS", "300"))
+
+    # DBFS transfers
+    DBFS_UPLOAD_QUEUE_BLOCKS: int = int(os.environ.get("DBFS_UPLOAD_QUEUE_BLOCKS", "4"))
+    DBFS_UPLOAD_CONCURRENCY: int = int(os.environ.get("DBFS_UPLOAD_CONCURRENCY", "4"))
+    DBFS_DOWNLOAD_CONCURRENCY: int = int(os.environ.get("DBFS_DOWNLOAD_CONCURRENCY", "8"))
+    DBFS_WALK_CONCURRENCY: int = int(os.environ.get("DBFS_WALK_CONCURRENCY", "8"))
+    # Directory of upload checkpoints, which make large uploads resumable (disabled when empty)
+    DBFS_CHECKPOINT_DIR: str = os.environ.get("DBFS_CHECKPOINT_DIR", "")
+
+    # Root of the server's local file system that tools may read and write (tools are disabled when empty)
+    LOCAL_FILE_ROOT: str = os.environ.get("LOCAL_FILE_ROOT", "")
+
+    # Unity Catalog metadata index
+    METADATA_REFRESH_SECONDS: float = float(os.environ.get("METADATA_REFRESH_SECONDS", "300"))
+
+    # SQL results
+    SQL_DOWNLOAD_CONCURRENCY: int = int(os.environ.get("SQL_DOWNLOAD_CONCURRENCY", "8"))
+    SQL_PAGE_ROWS: int = int(os.environ.get("SQL_PAGE_ROWS", "1000"))
+    SQL_STATEMENT_REGISTRY_MAX: int = int(os.environ.get("SQL_STATEMENT_REGISTRY_MAX", "1000"))
+    SQL_RESULT_CACHE_ENABLED: bool = os.environ.get("SQL_RESULT_CACHE_ENABLED", "False").lower() == "true"
+    SQL_RESULT_CACHE_TTL_SECONDS: float = float(os.environ.get("SQL_RESULT_CACHE_TTL_SECONDS", "300"))
+    SQL_RESULT_CACHE_MAX_BYTES: int = int(os.environ.get("SQL_RESULT_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+    SQL_STATEMENT_RETENTION_SECONDS: float = float(os.environ.get("SQL_STATEMENT_RETENTION_SECONDS", "3600"))
+
+    # Polling of long-running operations
+    POLL_INITIAL_INTERVAL_SECONDS: float = float(os.environ.get("POLL_INITIAL_INTERVAL_SECONDS", "0.25"))
+    POLL_MAX_INTERVAL_SECONDS: float = float(os.environ.get("POLL_MAX_INTERVAL_SECONDS", "10"))
+    POLL_BACKOFF_FACTOR: float = float(os.environ.get("POLL_BACKOFF_FACTOR", "1.5"))
+    POLL_TICK_SECONDS: float = float(os.environ.get("POLL_TICK_SECONDS", "0.05"))
+    POLL_CONCURRENCY: int = int(os.environ.get("POLL_CONCURRENCY", "10"))
+
     # Logging
     LOG_LEVEL: str = os.environ.get("LOG_LEVEL", "INFO")
     
@@ -89,4 +154,20 @@ def get_databricks_api_url(endpoint: str) -> str:
     # Remove trailing slash from host if present
     host = settings.DATABRICKS_HOST.rstrip("/")
     
-    return f"{host}{endpoint}" 
\ No newline at end of file
+    return f"{host}{endpoint}"
+
+
+_API_VERSION_PREFIX_RE = re.compile(r"^/?api/\d+\.\d+/")
+
+
+def get_api_path(endpoint: str) -> str:
+    """
+    Get the version-independent path of a Databricks API endpoint.
+    
+    Args:
+        endpoint: The API endpoint path, e.g., "/api/2.2/jobs/run-now"
+    
+    Returns:
+        The path without the /api/<version>/ prefix, e.g., "jobs/run-now"
+    """
+    return _API_VERSION_PREFIX_RE.sub("", endpoint).strip("/")
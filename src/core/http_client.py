@@ -0,0 +1,77 @@
+"""
+Connection management for the Databricks MCP server.
+
+All Databricks API traffic goes through a single process-wide pooled
+httpx.AsyncClient, so TCP and TLS connections to the workspace are reused
+across tool calls instead of being re-established for every request.
+"""
+
+import importlib.util
+import logging
+from typing import Optional
+
+import httpx
+
+from src.core.config import settings
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Shared async client, created lazily on first use so it binds to the running event loop
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _http2_available() -> bool:
+    """Check whether HTTP/2 support (the optional h2 package) is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def build_http_client() -> httpx.AsyncClient:
+    """
+    Build a pooled async HTTP client from the current settings.
+
+    Returns:
+        A new httpx.AsyncClient configured with the connection pool settings
+    """
+    limits = httpx.Limits(
+        max_connections=settings.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    )
+    timeout = httpx.Timeout(
+        settings.HTTP_TIMEOUT_SECONDS,
+        connect=settings.HTTP_CONNECT_TIMEOUT_SECONDS,
+    )
+
+    http2 = settings.HTTP2_ENABLED
+    if http2 and not _http2_available():
+        logger.warning("HTTP2_ENABLED is set but the 'h2' package is not installed, falling back to HTTP/1.1")
+        http2 = False
+
+    logger.info(
+        f"Creating HTTP connection pool: max_connections={settings.HTTP_MAX_CONNECTIONS}, "
+        f"max_keepalive={settings.HTTP_MAX_KEEPALIVE_CONNECTIONS}, "
+        f"keepalive_expiry={settings.HTTP_KEEPALIVE_EXPIRY_SECONDS}s, http2={http2}"
+    )
+    return httpx.AsyncClient(limits=limits, timeout=timeout, http2=http2)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared async HTTP client used for all Databricks API requests.
+
+    Returns:
+        The process-wide httpx.AsyncClient instance
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = build_http_client()
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared async HTTP client and release its pooled connections."""
+    global _http_client
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+    _http_client = None
@@ -0,0 +1,232 @@
+"""
+Adaptive polling of long-running Databricks operations.
+
+Status checks start with short intervals, so quick operations are noticed
+quickly, and back off exponentially up to a cap, so long operations don't
+flood the control plane. Deadlines use the monotonic clock and are rounded up
+to a tick, so wakeups that fall in the same tick are coalesced.
+
+A BatchPoller checks all pending operations of one kind centrally: every
+pending ID is checked once per round no matter how many callers wait on it,
+due IDs are checked together with bounded concurrency (or through a batch
+endpoint), and waiters are woken through futures.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+from src.core.config import settings
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+def poll_intervals(
+    initial: Optional[float] = None,
+    maximum: Optional[float] = None,
+    factor: Optional[float] = None,
+) -> Iterator[float]:
+    """
+    Generate the intervals between status checks: initial, then growing by factor up to maximum.
+
+    Args:
+        initial: First interval in seconds (default POLL_INITIAL_INTERVAL_SECONDS)
+        maximum: Largest interval in seconds (default POLL_MAX_INTERVAL_SECONDS)
+        factor: Growth factor per check (default POLL_BACKOFF_FACTOR)
+
+    Returns:
+        Infinite iterator over intervals in seconds
+    """
+    interval = initial if initial is not None else settings.POLL_INITIAL_INTERVAL_SECONDS
+    maximum = maximum if maximum is not None else settings.POLL_MAX_INTERVAL_SECONDS
+    factor = factor if factor is not None else settings.POLL_BACKOFF_FACTOR
+    while True:
+        yield min(interval, maximum)
+        interval = min(interval * factor, maximum)
+
+
+def _tick_deadline(delay: float, tick_seconds: float) -> float:
+    """Get the monotonic deadline after a delay, rounded up to the next tick so nearby deadlines coincide."""
+    deadline = time.monotonic() + max(0.0, delay)
+    if tick_seconds > 0:
+        deadline = math.ceil(deadline / tick_seconds) * tick_seconds
+    return deadline
+
+
+def check_each(
+    check_one: Callable[[Hashable], Awaitable[Any]],
+    concurrency: Optional[int] = None,
+) -> Callable[[List[Hashable]], Awaitable[Dict[Hashable, Any]]]:
+    """
+    Build a batch status check from a single-ID check, run with bounded concurrency.
+
+    Args:
+        check_one: Coroutine function returning the status of one ID
+        concurrency: Maximum number of checks in flight (default POLL_CONCURRENCY)
+
+    Returns:
+        Coroutine function mapping a list of IDs to their statuses (or the exception raised for them)
+    """
+    semaphore_holder: Dict[Any, asyncio.Semaphore] = {}
+
+    async def check_many(keys: List[Hashable]) -> Dict[Hashable, Any]:
+        loop = asyncio.get_running_loop()
+        if loop not in semaphore_holder:
+            semaphore_holder.clear()
+            semaphore_holder[loop] = asyncio.Semaphore(concurrency or settings.POLL_CONCURRENCY)
+        semaphore = semaphore_holder[loop]
+
+        async def bounded(key: Hashable) -> Any:
+            async with semaphore:
+                return await check_one(key)
+
+        results = await asyncio.gather(*(bounded(key) for key in keys), return_exceptions=True)
+        return dict(zip(keys, results))
+
+    return check_many
+
+
+class BatchPoller:
+    """
+    Central poller for many pending operations of one kind.
+
+    Callers await wait(); the poller keeps one adaptive schedule per ID, checks
+    all IDs that are due in one batch, and resolves the waiters' futures once
+    the status they wait for is reached.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        check_many: Callable[[List[Hashable]], Awaitable[Dict[Hashable, Any]]],
+        is_done: Callable[[Any], bool],
+        tick_seconds: Optional[float] = None,
+    ):
+        self.name = name
+        self.tick_seconds = tick_seconds if tick_seconds is not None else settings.POLL_TICK_SECONDS
+        self._check_many = check_many
+        self._is_done = is_done
+        self._waiters: Dict[Hashable, List[Tuple[asyncio.Future, Callable[[Any], bool]]]] = {}
+        self._schedule: Dict[Hashable, Tuple[float, Iterator[float]]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._rescheduled: Optional[asyncio.Event] = None
+        self.waits = 0
+        self.checks = 0
+        self.batches = 0
+
+    async def wait(
+        self,
+        key: Hashable,
+        timeout_seconds: float,
+        initial_interval: Optional[float] = None,
+        until: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """
+        Wait until an operation reaches a status.
+
+        Args:
+            key: ID of the operation
+            timeout_seconds: Maximum time to wait, measured on the monotonic clock
+            initial_interval: First interval between checks if the ID is not polled yet
+            until: Predicate on the status to wait for (default: the operation is done)
+
+        Returns:
+            The first status satisfying the predicate
+
+        Raises:
+            TimeoutError: If the status is not reached within the timeout
+            Exception: Whatever the status check raised for this ID
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._waiters.setdefault(key, []).append((future, until or self._is_done))
+        self.waits += 1
+
+        if key not in self._schedule:
+            intervals = poll_intervals(initial_interval)
+            due = _tick_deadline(next(intervals), self.tick_seconds)
+            is_earliest = all(due < scheduled for scheduled, _ in self._schedule.values())
+            self._schedule[key] = (due, intervals)
+            if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+                self._rescheduled = asyncio.Event()
+                self._task = loop.create_task(self._run())
+            elif is_earliest:
+                self._rescheduled.set()
+
+        try:
+            return await asyncio.wait_for(future, timeout_seconds)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"{self.name} {key} timed out after {round(timeout_seconds, 1)} seconds") from None
+        finally:
+            self._discard(key, future)
+
+    def _discard(self, key: Hashable, future: asyncio.Future) -> None:
+        """Forget a waiter; stop polling the ID once nobody waits for it."""
+        waiters = [waiter for waiter in self._waiters.get(key, []) if waiter[0] is not future]
+        if waiters:
+            self._waiters[key] = waiters
+        else:
+            self._waiters.pop(key, None)
+            self._schedule.pop(key, None)
+
+    async def _run(self) -> None:
+        """Check the due IDs in batches, until no IDs are left to poll."""
+        while self._schedule:
+            now = time.monotonic()
+            due = [key for key, (deadline, _) in self._schedule.items() if deadline <= now]
+            if not due:
+                # Sleep until the earliest deadline, or until an earlier one is added
+                delay = min(deadline for deadline, _ in self._schedule.values()) - now
+                self._rescheduled.clear()
+                try:
+                    await asyncio.wait_for(self._rescheduled.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            await self._check(due)
+
+    async def _check(self, keys: List[Hashable]) -> None:
+        """Check a batch of IDs, wake the waiters whose status is reached and reschedule the rest."""
+        self.batches += 1
+        self.checks += len(keys)
+        try:
+            statuses = await self._check_many(keys)
+        except Exception as e:
+            statuses = {key: e for key in keys}
+        logger.debug(f"{self.name} poller checked {len(keys)} IDs, {len(self._schedule)} pending")
+
+        for key in keys:
+            if key not in self._schedule:
+                continue
+            status = statuses.get(key)
+            pending = []
+            for future, until in self._waiters.get(key, []):
+                if future.done():
+                    continue
+                if isinstance(status, Exception):
+                    future.set_exception(status)
+                elif status is not None and until(status):
+                    future.set_result(status)
+                else:
+                    pending.append((future, until))
+
+            if pending:
+                self._waiters[key] = pending
+                _, intervals = self._schedule[key]
+                self._schedule[key] = (_tick_deadline(next(intervals), self.tick_seconds), intervals)
+            else:
+                self._waiters.pop(key, None)
+                self._schedule.pop(key, None)
+
+    def get_stats(self) -> dict:
+        """Get poller statistics."""
+        return {
+            "pending": len(self._schedule),
+            "waiters": sum(len(waiters) for waiters in self._waiters.values()),
+            "waits": self.waits,
+            "checks": self.checks,
+            "batches": self.batches,
+        }
@@ -0,0 +1,158 @@
+"""
+Client-side rate limiting for Databricks API requests.
+
+Databricks enforces separate rate limits per API family. Each family gets its
+own token bucket; callers that exceed the configured rate wait for a token
+instead of being rejected, so bursts are smoothed out before they turn into
+429 responses from the workspace.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, Optional
+
+from src.core.config import get_api_path, settings
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# API families, matched against the path after the /api/<version>/ prefix.
+# More specific prefixes must come first.
+API_FAMILIES = (
+    "sql/statements",
+    "clusters",
+    "jobs",
+    "workspace",
+    "dbfs",
+)
+
+
+class TokenBucket:
+    """Token bucket that makes callers wait for capacity instead of rejecting them."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+        # Metrics
+        self.requests = 0
+        self.throttled = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    async def acquire(self) -> float:
+        """
+        Take one token, waiting until it is available.
+
+        Tokens are reserved under the lock and the wait happens outside it, so
+        waiters are served in arrival order without blocking each other.
+
+        Returns:
+            Number of seconds the caller had to wait
+        """
+        async with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+            self.requests += 1
+            if wait > 0:
+                self.throttled += 1
+                self.total_wait_seconds += wait
+                self.max_wait_seconds = max(self.max_wait_seconds, wait)
+
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def stats(self) -> Dict[str, float]:
+        """Get the metrics collected by this bucket."""
+        return {
+            "rate_per_second": self.rate,
+            "requests": self.requests,
+            "throttled": self.throttled,
+            "total_wait_seconds": round(self.total_wait_seconds, 3),
+            "max_wait_seconds": round(self.max_wait_seconds, 3),
+            "avg_wait_seconds": round(self.total_wait_seconds / self.requests, 3) if self.requests else 0.0,
+        }
+
+
+class RateLimiter:
+    """Per-API-family rate limiter for Databricks API requests."""
+
+    def __init__(self, rates: Dict[str, float], burst: float):
+        self._buckets: Dict[str, TokenBucket] = {
+            family: TokenBucket(rate, max(1.0, burst))
+            for family, rate in rates.items()
+            if rate > 0
+        }
+
+    @staticmethod
+    def family_for(endpoint: str) -> Optional[str]:
+        """
+        Get the API family an endpoint belongs to.
+
+        Args:
+            endpoint: API endpoint path, e.g. "/api/2.2/jobs/run-now"
+
+        Returns:
+            Family name, or None if the endpoint is not rate limited
+        """
+        path = get_api_path(endpoint)
+        for family in API_FAMILIES:
+            if path == family or path.startswith(f"{family}/"):
+                return family
+        return None
+
+    async def acquire(self, endpoint: str) -> float:
+        """
+        Wait until a request to the given endpoint may be sent.
+
+        Args:
+            endpoint: API endpoint path
+
+        Returns:
+            Number of seconds spent waiting
+        """
+        bucket = self._buckets.get(self.family_for(endpoint) or "")
+        if bucket is None:
+            return 0.0
+        wait = await bucket.acquire()
+        if wait > 0:
+            logger.debug(f"Rate limited {endpoint}: waited {wait:.3f}s")
+        return wait
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Get rate limiting metrics per API family."""
+        return {family: bucket.stats() for family, bucket in self._buckets.items()}
+
+
+def _build_rate_limiter() -> RateLimiter:
+    """Build the rate limiter from the current settings."""
+    if not settings.RATE_LIMIT_ENABLED:
+        return RateLimiter({}, 0)
+    return RateLimiter(
+        {
+            "clusters": settings.RATE_LIMIT_CLUSTERS_PER_SECOND,
+            "jobs": settings.RATE_LIMIT_JOBS_PER_SECOND,
+            "workspace": settings.RATE_LIMIT_WORKSPACE_PER_SECOND,
+            "dbfs": settings.RATE_LIMIT_DBFS_PER_SECOND,
+            "sql/statements": settings.RATE_LIMIT_SQL_PER_SECOND,
+        },
+        settings.RATE_LIMIT_BURST,
+    )
+
+
+# Global rate limiter instance
+rate_limiter = _build_rate_limiter()
+
+
+def get_rate_limit_stats() -> Dict[str, Dict[str, float]]:
+    """Get rate limiting metrics, including time spent waiting, per API family."""
+    return rate_limiter.stats()
@@ -0,0 +1,179 @@
+"""
+Retry policy for Databricks API requests.
+
+Transient failures (rate limiting, unavailable control plane, dropped
+connections) are retried with exponential backoff and full jitter, honouring
+the Retry-After header, within a total time budget. Rate-limited requests were
+rejected before being processed and are retried for any request; other
+failures only for requests that are safe to repeat, see IDEMPOTENCY_RULES.
+"""
+
+import asyncio
+import email.utils
+import fnmatch
+import logging
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import httpx
+
+from src.core.config import get_api_path, settings
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# HTTP status codes that indicate a transient condition worth retrying
+RETRYABLE_STATUS_CODES = {429, 502, 503, 504}
+
+# Retryable status codes of requests the server rejected without processing them,
+# which are safe to repeat whatever the request
+REJECTED_STATUS_CODES = {429}
+
+# Idempotency classes
+ALWAYS = "always"   # Safe to repeat
+TOKEN = "token"     # Safe to repeat only when the request carries an idempotency_token
+NEVER = "never"     # Repeating could duplicate side effects
+
+# Idempotency of POST endpoints, matched against the path without the /api/<version>/ prefix.
+# GET requests are always considered idempotent. Unlisted POST endpoints are never retried.
+IDEMPOTENCY_RULES: Dict[str, str] = {
+    "clusters/get": ALWAYS,
+    "clusters/delete": ALWAYS,
+    "clusters/resize": ALWAYS,
+    "jobs/update": ALWAYS,
+    "jobs/reset": ALWAYS,
+    "jobs/runs/cancel": ALWAYS,
+    "jobs/run-now": TOKEN,
+    "jobs/runs/submit": TOKEN,
+    "workspace/mkdirs": ALWAYS,
+    "dbfs/mkdirs": ALWAYS,
+    "dbfs/put": ALWAYS,
+    "sql/statements/*/cancel": ALWAYS,
+}
+
+
+def is_idempotent(method: str, endpoint: str, data: Optional[Dict[str, Any]] = None) -> bool:
+    """
+    Decide whether a request can safely be sent more than once.
+
+    Args:
+        method: HTTP method
+        endpoint: API endpoint path
+        data: Request body data
+
+    Returns:
+        True if the request may be retried after the server has seen it
+    """
+    if method.upper() in ("GET", "HEAD", "OPTIONS"):
+        return True
+
+    key = get_api_path(endpoint)
+    for pattern, rule in IDEMPOTENCY_RULES.items():
+        if fnmatch.fnmatchcase(key, pattern):
+            if rule == ALWAYS:
+                return True
+            if rule == TOKEN:
+                return bool(data and data.get("idempotency_token"))
+            return False
+    return False
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Header value, either delta-seconds or an HTTP date
+
+    Returns:
+        Number of seconds to wait, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def backoff_delay(attempt: int) -> float:
+    """
+    Compute an exponential backoff delay with full jitter.
+
+    Args:
+        attempt: Zero-based number of the retry being scheduled
+
+    Returns:
+        Delay in seconds
+    """
+    ceiling = min(settings.RETRY_BACKOFF_MAX_SECONDS, settings.RETRY_BACKOFF_BASE_SECONDS * (2 ** attempt))
+    return random.uniform(0, ceiling)
+
+
+async def send_with_retry(
+    send: Callable[[], Awaitable[httpx.Response]],
+    method: str,
+    endpoint: str,
+    data: Optional[Dict[str, Any]] = None,
+) -> httpx.Response:
+    """
+    Send a request, retrying transient failures according to the retry policy.
+
+    Connection failures where the request never reached the server and
+    rate-limited (429) responses are retried for any request; other retryable
+    status codes and mid-flight transport errors are only retried for
+    idempotent requests.
+
+    Args:
+        send: Coroutine factory that performs one attempt of the request
+        method: HTTP method
+        endpoint: API endpoint path
+        data: Request body data
+
+    Returns:
+        The last response received (which may still carry an error status)
+
+    Raises:
+        httpx.TransportError: If the last attempt failed at the transport level
+    """
+    idempotent = is_idempotent(method, endpoint, data)
+    deadline = time.monotonic() + settings.RETRY_TIME_BUDGET_SECONDS
+    attempt = 0
+
+    while True:
+        retry_after = None
+        try:
+            response = await send()
+            if response.status_code not in RETRYABLE_STATUS_CODES:
+                return response
+            if not idempotent and response.status_code not in REJECTED_STATUS_CODES:
+                return response
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            reason = f"HTTP {response.status_code}"
+            error: Optional[httpx.TransportError] = None
+        except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout) as e:
+            response, error, reason = None, e, type(e).__name__
+        except httpx.TransportError as e:
+            if not idempotent:
+                raise
+            response, error, reason = None, e, type(e).__name__
+
+        delay = retry_after if retry_after is not None else backoff_delay(attempt)
+        attempt += 1
+        if attempt >= settings.RETRY_MAX_ATTEMPTS or time.monotonic() + delay > deadline:
+            logger.warning(f"Giving up on {method} {endpoint} after {attempt} attempt(s): {reason}")
+            if error is not None:
+                raise error
+            return response
+
+        logger.warning(f"Retrying {method} {endpoint} in {delay:.2f}s (attempt {attempt}): {reason}")
+        if response is not None:
+            # Release the connection of a discarded (possibly streamed) response
+            await response.aclose()
+        await asyncio.sleep(delay)
@@ -0,0 +1,180 @@
+"""
+JSON serialization for the Databricks MCP server.
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise. Responses that are passed through unchanged can be kept as raw
+bytes (RawJSON), which skips both parsing and re-serializing them.
+
+Bodies carrying large base64 payloads (DBFS blocks, notebook sources) are
+built and read straight from byte buffers, without str copies of the payload.
+"""
+
+import base64
+import binascii
+import json
+import logging
+import re
+from typing import Any, Dict, Optional, Tuple, Union
+
+# Import orjson if available, but don't require it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Name of the JSON backend in use, for diagnostics
+BACKEND = "orjson" if orjson is not None else "json"
+
+# Raw bytes encoded per step when building base64 bodies; a multiple of 3, so
+# the pieces concatenate into the encoding of the whole payload
+BASE64_PIECE_BYTES = 3 * 64 * 1024
+
+
+class RawJSON:
+    """An already-serialized JSON document that is passed through without parsing."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+    def parse(self) -> Any:
+        """Parse the document into Python objects."""
+        return loads(self.data) if self.data else {}
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __repr__(self) -> str:
+        return f"RawJSON({len(self.data)} bytes)"
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        The parsed Python object
+
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+
+    Args:
+        obj: Object to serialize; RawJSON documents are returned as-is
+
+    Returns:
+        The JSON document as bytes
+
+    Raises:
+        TypeError: If the object is not JSON serializable
+    """
+    if isinstance(obj, RawJSON):
+        return obj.data or b"{}"
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj).encode("utf-8")
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize an object to a JSON string.
+
+    Args:
+        obj: Object to serialize; RawJSON documents are decoded without re-serializing
+
+    Returns:
+        The JSON document as str
+
+    Raises:
+        TypeError: If the object is not JSON serializable
+    """
+    if isinstance(obj, RawJSON) or orjson is not None:
+        return dumps_bytes(obj).decode("utf-8")
+    return json.dumps(obj)
+
+
+def base64_json_body(
+    fields: Dict[str, Any],
+    key: str,
+    payload: Union[bytes, bytearray, memoryview],
+) -> bytearray:
+    """
+    Serialize a JSON object with one base64-encoded field straight into a buffer.
+
+    The payload is encoded piece by piece into a preallocated bytearray, so
+    neither a base64 nor a str copy of the whole payload is made on the way.
+
+    Args:
+        fields: The other fields of the object
+        key: Name of the base64 field, written last
+        payload: Raw bytes to encode
+
+    Returns:
+        The JSON document as a bytearray
+
+    Raises:
+        TypeError: If the fields are not JSON serializable
+    """
+    head = dumps_bytes(fields)[:-1]
+    prefix = head + (b"," if len(head) > 1 else b"") + dumps_bytes(key) + b':"'
+    source = memoryview(payload).cast("B")
+    encoded_size = 4 * ((len(source) + 2) // 3)
+
+    body = bytearray(len(prefix) + encoded_size + 2)
+    target = memoryview(body)
+    target[:len(prefix)] = prefix
+    position = len(prefix)
+    for start in range(0, len(source), BASE64_PIECE_BYTES):
+        encoded = binascii.b2a_base64(source[start:start + BASE64_PIECE_BYTES], newline=False)
+        target[position:position + len(encoded)] = encoded
+        position += len(encoded)
+    target[position:] = b'"}'
+    return body
+
+
+def loads_base64_field(document: Union[bytes, bytearray], key: str) -> Tuple[Any, Optional[bytes]]:
+    """
+    Parse a JSON object, decoding one base64 string field straight from the document bytes.
+
+    Only the rest of the document is parsed; the field's value is decoded from
+    a view of the document, so no str copy of it is made. Documents where the
+    value contains escapes fall back to a regular parse.
+
+    Args:
+        document: JSON document as bytes
+        key: Name of the base64 field
+
+    Returns:
+        Tuple of the object without the field and the decoded field (None if it is missing)
+
+    Raises:
+        ValueError: If the document is not valid JSON or the field is not valid base64
+    """
+    match = re.search(b'"' + re.escape(key.encode("utf-8")) + rb'"\s*:\s*"', document)
+    if match is not None:
+        start = match.end()
+        end = document.find(b'"', start)
+        if end != -1 and document.find(b"\\", start, end) == -1:
+            decoded = binascii.a2b_base64(memoryview(document)[start:end])
+            obj = loads(document[:start] + document[end:])
+            obj.pop(key, None)
+            return obj, decoded
+
+    obj = loads(document)
+    value = obj.pop(key, None)
+    return obj, base64.b64decode(value) if value is not None else None
@@ -0,0 +1,88 @@
+"""
+Request coalescing ("single-flight") for Databricks API reads.
+
+When several callers issue the same idempotent request while an identical one
+is already in flight, they wait for the in-flight call and share its result
+instead of sending duplicate requests to the workspace.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+def request_key(method: str, endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Build a key identifying a request by method, endpoint and query parameters.
+
+    Args:
+        method: HTTP method
+        endpoint: API endpoint path
+        params: Query parameters
+
+    Returns:
+        A string key that is identical for identical requests
+    """
+    return f"{method.upper()} {endpoint} {json.dumps(params or {}, sort_keys=True, default=str)}"
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key into a single execution."""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+
+        # Metrics
+        self.executed = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run fn, or join an in-flight run for the same key.
+
+        The call runs as its own task, so a cancelled caller does not cancel
+        the shared call for the others still waiting on it.
+
+        Args:
+            key: Key identifying identical calls
+            fn: Coroutine factory performing the call
+
+        Returns:
+            The result of the (shared) call
+
+        Raises:
+            Exception: Whatever the shared call raised
+        """
+        task = self._calls.get(key)
+        if task is None:
+            self.executed += 1
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda t: self._finish(key, t))
+        else:
+            self.coalesced += 1
+            logger.debug(f"Joining in-flight request: {key}")
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        """Forget a finished call and mark its exception as retrieved."""
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        """Get coalescing metrics."""
+        return {
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._calls),
+        }
+
+
+# Global single-flight group for API reads
+single_flight = SingleFlight()
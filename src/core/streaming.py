@@ -0,0 +1,127 @@
+"""
+Incremental JSON parsing of Databricks API responses.
+
+Uses the ijson event parser when it is installed, so the items of a large array
+can be consumed while the response is still arriving. Without ijson the body is
+buffered and parsed in one go, with the same interface.
+"""
+
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from src.core import serialization
+
+# Import ijson if available, but don't require it
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+_START_EVENTS = ("start_map", "start_array")
+_END_EVENTS = ("end_map", "end_array")
+_SCALAR_EVENTS = ("string", "number", "boolean", "null")
+
+
+class _AsyncByteReader:
+    """Adapts an async iterator of byte chunks to the async file interface ijson reads from."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks.__aiter__()
+        self._buffer = b""
+
+    async def read(self, size: int = -1) -> bytes:
+        while not self._buffer:
+            try:
+                self._buffer = await self._chunks.__anext__()
+            except StopAsyncIteration:
+                return b""
+        if size < 0 or size >= len(self._buffer):
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+def _item_path(prefix: str) -> List[str]:
+    """Split an item prefix such as "result.data_array.item" into the keys leading to the array."""
+    keys = prefix.split(".") if prefix else []
+    if not keys or keys[-1] != "item":
+        raise ValueError(f"Prefix must point at array items (end with '.item'): {prefix}")
+    return keys[:-1]
+
+
+async def _iter_buffered(
+    chunks: AsyncIterator[bytes],
+    prefix: str,
+    trailer: Optional[Dict[str, Any]],
+) -> AsyncIterator[Any]:
+    """Fallback without ijson: buffer the whole body, then yield the array items."""
+    keys = _item_path(prefix)
+    body = b"".join([chunk async for chunk in chunks])
+    document = serialization.loads(body) if body else {}
+
+    if trailer is not None and isinstance(document, dict):
+        trailer.update({k: v for k, v in document.items() if not isinstance(v, (dict, list))})
+
+    items: Any = document
+    for key in keys:
+        items = items.get(key) if isinstance(items, dict) else None
+    for item in items or []:
+        yield item
+
+
+async def _iter_events(
+    chunks: AsyncIterator[bytes],
+    prefix: str,
+    trailer: Optional[Dict[str, Any]],
+) -> AsyncIterator[Any]:
+    """Build and yield array items from the ijson event stream as they complete."""
+    _item_path(prefix)
+    builder = None
+    depth = 0
+
+    async for current, event, value in ijson.parse_async(_AsyncByteReader(chunks), use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if event in _START_EVENTS:
+                depth += 1
+            elif event in _END_EVENTS:
+                depth -= 1
+                if depth == 0:
+                    yield builder.value
+                    builder = None
+            continue
+
+        if current == prefix:
+            if event in _START_EVENTS:
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+                depth = 1
+            elif event in _SCALAR_EVENTS:
+                yield value
+        elif trailer is not None and current and "." not in current and event in _SCALAR_EVENTS:
+            trailer[current] = value
+
+
+def iter_json_items(
+    chunks: AsyncIterator[bytes],
+    prefix: str,
+    trailer: Optional[Dict[str, Any]] = None,
+) -> AsyncIterator[Any]:
+    """
+    Iterate over the items of an array inside a streamed JSON document.
+
+    Args:
+        chunks: Async iterator over the raw bytes of the document
+        prefix: Path of the array items, e.g. "objects.item" or "result.data_array.item"
+        trailer: Optional dictionary that receives the top-level scalar fields of the document
+
+    Returns:
+        Async iterator over the array items
+    """
+    if ijson is None:
+        return _iter_buffered(chunks, prefix, trailer)
+    return _iter_events(chunks, prefix, trailer)
@@ -2,14 +2,21 @@
 Utility functions for the Databricks MCP server.
 """
 
-import json
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional, Union
+import os
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Union
 
-import requests
-from requests.exceptions import RequestException
+import httpx
 
-from src.core.config import get_api_headers, get_databricks_api_url
+from src.core.cache import cache_ttl, disk_cache, disk_cache_ttl, invalidate_for, needs_revalidation, response_cache
+from src.core.config import get_api_headers, get_api_path, get_databricks_api_url, settings
+from src.core.http_client import get_http_client
+from src.core.ratelimit import rate_limiter
+from src.core.retry import send_with_retry
+from src.core.serialization import RawJSON, dumps_bytes, loads
+from src.core.singleflight import request_key, single_flight
+from src.core.streaming import iter_json_items
 
 # Configure logging
 logging.basicConfig(
@@ -29,15 +36,82 @@ class DatabricksAPIError(Exception):
         super().__init__(self.message)
 
 
-def make_api_request(
+def _to_api_error(e: httpx.HTTPError) -> DatabricksAPIError:
+    """
+    Convert an HTTP client error into a DatabricksAPIError.
+    
+    Args:
+        e: The error raised by the HTTP client
+        
+    Returns:
+        The corresponding DatabricksAPIError
+    """
+    # Handle request exceptions
+    error_response_obj = e.response if isinstance(e, httpx.HTTPStatusError) else None
+    status_code = error_response_obj.status_code if error_response_obj is not None else None
+    error_msg = f"API request failed: {str(e)}"
+    
+    # Try to extract error details from response
+    error_response = None
+    if error_response_obj is not None:
+        try:
+            error_response = error_response_obj.json()
+            error_msg = f"{error_msg} - {error_response.get('error', '')}"
+        except ValueError:
+            error_response = error_response_obj.text
+    
+    # Log the error
+    logger.error(f"API Error: {error_msg}", exc_info=True)
+    
+    return DatabricksAPIError(error_msg, status_code, error_response)
+
+
+def resolve_local_path(path: str) -> str:
+    """
+    Resolve a path of the server's local file system given by a tool caller, confined to LOCAL_FILE_ROOT.
+    
+    Relative paths are taken relative to the root. Symbolic links are resolved
+    before the check, so neither `..` nor a link can lead outside the root.
+    
+    Args:
+        path: Path given by the caller
+        
+    Returns:
+        The resolved absolute path
+        
+    Raises:
+        PermissionError: If no root is configured or the path lies outside it
+    """
+    if not settings.LOCAL_FILE_ROOT:
+        raise PermissionError("Access to the local file system is disabled; set LOCAL_FILE_ROOT to enable it")
+    root = os.path.realpath(settings.LOCAL_FILE_ROOT)
+    resolved = os.path.realpath(os.path.join(root, path))
+    if os.path.commonpath([root, resolved]) != root:
+        raise PermissionError(f"Local path is outside LOCAL_FILE_ROOT: {path}")
+    return resolved
+
+
+# Size of the slices in which prebuilt request bodies are handed to the HTTP client
+BODY_SLICE_BYTES = 256 * 1024
+
+
+async def _iter_buffer(buffer: Union[bytes, bytearray]) -> AsyncIterator[bytes]:
+    """Yield a request body buffer in slices; a fresh iterator is created for every attempt."""
+    view = memoryview(buffer)
+    for start in range(0, len(view), BODY_SLICE_BYTES):
+        yield bytes(view[start:start + BODY_SLICE_BYTES])
+
+
+async def _send_api_request(
     method: str,
     endpoint: str,
     data: Optional[Dict[str, Any]] = None,
     params: Optional[Dict[str, Any]] = None,
     files: Optional[Dict[str, Any]] = None,
-) -> Dict[str, Any]:
+    body: Optional[Union[bytes, bytearray]] = None,
+) -> bytes:
     """
-    Make a request to the Databricks API.
+    Send a request to the Databricks API and return the raw response body.
     
     Args:
         method: HTTP method ("GET", "POST", "PUT", "DELETE")
@@ -45,9 +119,10 @@ def make_api_request(
         data: Request body data
         params: Query parameters
         files: Files to upload
+        body: Already-serialized JSON request body, sent as-is instead of data
         
     Returns:
-        Response data as a dictionary
+        Raw response body
         
     Raises:
         DatabricksAPIError: If the API request fails
@@ -57,49 +132,271 @@ def make_api_request(
     
     try:
         # Log the request (omit sensitive information)
-        safe_data = "**REDACTED**" if data else None
+        safe_data = "**REDACTED**" if data or body is not None else None
         logger.debug(f"API Request: {method} {url} Params: {params} Data: {safe_data}")
         
         # Convert data to JSON string if provided
-        json_data = json.dumps(data) if data and not files else data
-        
-        # Make the request
-        response = requests.request(
-            method=method,
-            url=url,
-            headers=headers,
-            params=params,
-            data=json_data if not files else data,
-            files=files,
-        )
+        json_data = dumps_bytes(data) if data is not None and not files else None
+        if body is not None:
+            # Stream the buffer in slices rather than copying it into one bytes object
+            headers["Content-Length"] = str(len(body))
+        
+        async def send() -> httpx.Response:
+            # Every attempt, including retries, counts against the API family's rate limit
+            await rate_limiter.acquire(endpoint)
+            return await get_http_client().request(
+                method=method,
+                url=url,
+                headers=headers,
+                params=params,
+                content=_iter_buffer(body) if body is not None else json_data,
+                data=data if files else None,
+                files=files,
+            )
+        
+        # Make the request, retrying transient failures
+        response = await send_with_retry(send, method, endpoint, data)
         
         # Check for HTTP errors
         response.raise_for_status()
         
-        # Parse response
-        if response.content:
-            return response.json()
-        return {}
-        
-    except RequestException as e:
-        # Handle request exceptions
-        status_code = getattr(e.response, "status_code", None) if hasattr(e, "response") else None
-        error_msg = f"API request failed: {str(e)}"
-        
-        # Try to extract error details from response
-        error_response = None
-        if hasattr(e, "response") and e.response is not None:
-            try:
-                error_response = e.response.json()
-                error_msg = f"{error_msg} - {error_response.get('error', '')}"
-            except ValueError:
-                error_response = e.response.text
-        
-        # Log the error
-        logger.error(f"API Error: {error_msg}", exc_info=True)
-        
-        # Raise custom exception
-        raise DatabricksAPIError(error_msg, status_code, error_response) from e
+        return response.content
+        
+    except httpx.HTTPError as e:
+        raise _to_api_error(e) from e
+
+
+# Background revalidations of responses served from the persistent tier
+_revalidations: Set[asyncio.Task] = set()
+
+
+async def _fetch_upstream_and_cache(
+    key: str,
+    endpoint: str,
+    params: Optional[Dict[str, Any]],
+    ttl: float,
+) -> bytes:
+    """Fetch a GET response upstream and store it in every cache tier it belongs to."""
+    path = get_api_path(endpoint)
+    generation = response_cache.generation(path)
+    disk_ttl = disk_cache_ttl(endpoint)
+    content = await _send_api_request("GET", endpoint, params=params)
+    response_cache.set(key, path, content, ttl, generation)
+    if disk_ttl is not None and response_cache.is_current(path, generation):
+        await asyncio.to_thread(disk_cache.set, key, path, content, disk_ttl)
+    return content
+
+
+async def _revalidate(key: str, endpoint: str, params: Optional[Dict[str, Any]], ttl: float) -> None:
+    """Replace a response served from the persistent tier with a fresh one."""
+    try:
+        # Keyed apart from reads, so it never joins the read that served the stale entry
+        await single_flight.do(("revalidate", key), lambda: _fetch_upstream_and_cache(key, endpoint, params, ttl))
+    except Exception as e:
+        # The stale entry expires from memory with the endpoint's TTL
+        logger.warning(f"Failed to revalidate cached {endpoint}: {str(e)}")
+
+
+async def _fetch_and_cache(
+    key: str,
+    endpoint: str,
+    params: Optional[Dict[str, Any]],
+    ttl: Optional[float],
+) -> bytes:
+    """
+    Fetch a GET response through the cache tiers if the endpoint is cacheable.
+    
+    The persistent tier is consulted before the workspace, and fresh responses
+    are written to both tiers. Responses of endpoints that can change outside
+    the server are served from disk once and revalidated in the background.
+    
+    Args:
+        key: Request key
+        endpoint: API endpoint path
+        params: Query parameters
+        ttl: Cache TTL of the endpoint, or None if it is not cached
+        
+    Returns:
+        Raw response body
+    """
+    if ttl is None:
+        return await _send_api_request("GET", endpoint, params=params)
+    
+    # Fall back to the persistent tier before going upstream
+    if disk_cache_ttl(endpoint) is not None:
+        path = get_api_path(endpoint)
+        generation = response_cache.generation(path)
+        cached = await asyncio.to_thread(disk_cache.get, key)
+        if cached is not None:
+            content, remaining = cached
+            response_cache.set(key, path, content, min(ttl, remaining), generation)
+            if needs_revalidation(endpoint):
+                task = asyncio.ensure_future(_revalidate(key, endpoint, params, ttl))
+                _revalidations.add(task)
+                task.add_done_callback(_revalidations.discard)
+            return content
+    
+    return await _fetch_upstream_and_cache(key, endpoint, params, ttl)
+
+
+async def make_api_request(
+    method: str,
+    endpoint: str,
+    data: Optional[Dict[str, Any]] = None,
+    params: Optional[Dict[str, Any]] = None,
+    files: Optional[Dict[str, Any]] = None,
+    raw: bool = False,
+    body: Optional[Union[bytes, bytearray]] = None,
+    use_cache: bool = True,
+) -> Union[Dict[str, Any], RawJSON]:
+    """
+    Make a request to the Databricks API.
+    
+    Responses of read-only endpoints are served from the response cache when
+    possible, and concurrent identical GET requests are coalesced into a single
+    upstream call; every caller parses its own copy of the response body.
+    
+    Args:
+        method: HTTP method ("GET", "POST", "PUT", "DELETE")
+        endpoint: API endpoint path
+        data: Request body data
+        params: Query parameters
+        files: Files to upload
+        raw: Return the unparsed response body, for callers that pass it through unchanged
+        body: Already-serialized JSON request body, sent as-is instead of data
+            (see serialization.base64_json_body)
+        use_cache: Whether a GET request may be answered from the response cache;
+            if not set, the response is fetched upstream (and still cached for others)
+        
+    Returns:
+        Response data as a dictionary, or as RawJSON if raw is set
+        
+    Raises:
+        DatabricksAPIError: If the API request fails
+    """
+    if method.upper() == "GET" and data is None and body is None and not files:
+        key = request_key(method, endpoint, params)
+        ttl = cache_ttl(endpoint)
+        if not use_cache:
+            content = await (
+                _fetch_upstream_and_cache(key, endpoint, params, ttl) if ttl is not None
+                else _send_api_request("GET", endpoint, params=params)
+            )
+        else:
+            content = response_cache.get(key) if ttl is not None else None
+            if content is None:
+                content = await single_flight.do(
+                    key, lambda: _fetch_and_cache(key, endpoint, params, ttl)
+                )
+    else:
+        try:
+            content = await _send_api_request(method, endpoint, data, params, files, body)
+        finally:
+            # Drop cached reads affected by the mutation, even if it failed half-way
+            await invalidate_for(endpoint)
+    
+    if raw:
+        return RawJSON(content)
+    
+    # Parse response
+    if content:
+        return loads(content)
+    return {}
+
+
+async def stream_api_request(
+    method: str,
+    endpoint: str,
+    prefix: str,
+    data: Optional[Dict[str, Any]] = None,
+    params: Optional[Dict[str, Any]] = None,
+    trailer: Optional[Dict[str, Any]] = None,
+) -> AsyncIterator[Any]:
+    """
+    Make a request to the Databricks API and stream the items of an array in the response.
+    
+    The body is parsed incrementally as it arrives, so memory stays bounded by the
+    size of a single item rather than the whole response. Streamed requests bypass
+    the response cache and request coalescing.
+    
+    Args:
+        method: HTTP method ("GET", "POST", "PUT", "DELETE")
+        endpoint: API endpoint path
+        prefix: Path of the array items to stream, e.g. "objects.item" or "data_array.item"
+        data: Request body data
+        params: Query parameters
+        trailer: Optional dictionary that receives the top-level scalar fields of the
+            response (e.g. next_page_token); complete once iteration has finished
+        
+    Yields:
+        Items of the array, one at a time
+        
+    Raises:
+        DatabricksAPIError: If the API request fails
+    """
+    url = get_databricks_api_url(endpoint)
+    headers = get_api_headers()
+    json_data = dumps_bytes(data) if data is not None else None
+    client = get_http_client()
+    logger.debug(f"API Stream Request: {method} {url} Params: {params}")
+    
+    async def send() -> httpx.Response:
+        await rate_limiter.acquire(endpoint)
+        request = client.build_request(method, url, headers=headers, params=params, content=json_data)
+        return await client.send(request, stream=True)
+    
+    try:
+        response = await send_with_retry(send, method, endpoint, data)
+    except httpx.HTTPError as e:
+        raise _to_api_error(e) from e
+    
+    try:
+        if response.is_error:
+            await response.aread()
+            response.raise_for_status()
+        async for item in iter_json_items(response.aiter_bytes(), prefix, trailer):
+            yield item
+    except httpx.HTTPError as e:
+        raise _to_api_error(e) from e
+    finally:
+        await response.aclose()
+
+
+async def download_presigned_url(url: str, headers: Optional[Dict[str, str]] = None) -> bytes:
+    """
+    Download a presigned cloud storage URL handed out by the Databricks API.
+    
+    The workspace token is not sent, and the request is not rate limited as it
+    does not hit the workspace. Transient failures are retried. The URL embeds
+    temporary credentials, so it is kept out of logs and error messages.
+    
+    Args:
+        url: The presigned URL
+        headers: Additional headers required by the storage service
+        
+    Returns:
+        Raw response body
+        
+    Raises:
+        DatabricksAPIError: If the download fails
+    """
+    client = get_http_client()
+    safe_url = url.split("?", 1)[0]
+    
+    try:
+        response = await send_with_retry(lambda: client.get(url, headers=headers or {}), "GET", safe_url)
+    except httpx.HTTPError as e:
+        logger.error(f"Download failed: {safe_url}: {type(e).__name__}")
+        raise DatabricksAPIError(f"Download failed: {safe_url}: {type(e).__name__}") from e
+    
+    if response.is_error:
+        logger.error(f"Download failed: {safe_url}: HTTP {response.status_code}")
+        raise DatabricksAPIError(
+            f"Download failed: {safe_url}: HTTP {response.status_code}",
+            response.status_code,
+            response.text,
+        )
+    return response.content
 
 
 def format_response(
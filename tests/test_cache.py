@@ -0,0 +1,136 @@
+"""
+Tests of the response cache tiers in front of the Databricks API.
+"""
+
+import asyncio
+
+from src.core import cache, utils
+from src.core.config import settings
+
+
+class FakeClock:
+    """Stands in for the time module of the cache, advanced by hand."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+def _count_upstream(monkeypatch):
+    """Replace the upstream request with a counter, returning the list of calls."""
+    calls = []
+
+    async def send(method, endpoint, data=None, params=None, files=None, body=None):
+        calls.append((method, endpoint, params))
+        return b'{"call": %d}' % len(calls)
+
+    monkeypatch.setattr(utils, "_send_api_request", send)
+    return calls
+
+
+def _use_tiers(monkeypatch, disk):
+    """Use a fresh in-memory tier and the given persistent tier, as a newly started server would."""
+    memory = cache.ResponseCache(1024 * 1024)
+    monkeypatch.setattr(cache, "response_cache", memory)
+    monkeypatch.setattr(utils, "response_cache", memory)
+    monkeypatch.setattr(cache, "disk_cache", disk)
+    monkeypatch.setattr(utils, "disk_cache", disk)
+
+
+def test_memory_expired_entry_is_refetched_upstream(monkeypatch, tmp_path):
+    """Once its memory TTL has passed, a response is fetched upstream again, even with a disk tier."""
+    clock = FakeClock()
+    monkeypatch.setattr(cache, "time", clock)
+    monkeypatch.setattr(settings, "CACHE_ENABLED", True)
+    _use_tiers(monkeypatch, cache.DiskCache(str(tmp_path), 1024 * 1024, "test"))
+    calls = _count_upstream(monkeypatch)
+
+    async def scenario():
+        params = {"limit": 25}
+        first = await utils.make_api_request("GET", "/api/2.1/jobs/list", params=params)
+        cached = await utils.make_api_request("GET", "/api/2.1/jobs/list", params=params)
+        clock.advance(cache.CACHE_TTLS["jobs/list"] + 1)
+        refetched = await utils.make_api_request("GET", "/api/2.1/jobs/list", params=params)
+        return first, cached, refetched
+
+    first, cached, refetched = asyncio.run(scenario())
+    assert cached == first
+    assert refetched["call"] == 2
+    assert len(calls) == 2
+
+
+def test_restarted_server_serves_disk_entry_then_revalidates(monkeypatch, tmp_path):
+    """After a restart, a persisted job is served from disk once and then fetched again in the background."""
+    clock = FakeClock()
+    monkeypatch.setattr(cache, "time", clock)
+    monkeypatch.setattr(settings, "CACHE_ENABLED", True)
+    calls = _count_upstream(monkeypatch)
+    params = {"job_id": 1}
+
+    async def read():
+        return await utils.make_api_request("GET", "/api/2.2/jobs/get", params=params)
+
+    async def before_restart():
+        _use_tiers(monkeypatch, cache.DiskCache(str(tmp_path), 1024 * 1024, "test"))
+        return await read()
+
+    async def after_restart():
+        # A new process: empty memory, the same SQLite file
+        _use_tiers(monkeypatch, cache.DiskCache(str(tmp_path), 1024 * 1024, "test"))
+        warm = await read()
+        await asyncio.gather(*utils._revalidations)
+        clock.advance(1)
+        return warm, await read()
+
+    first = asyncio.run(before_restart())
+    warm, revalidated = asyncio.run(after_restart())
+    assert warm == first
+    assert revalidated["call"] == 2
+    assert len(calls) == 2
+
+
+def test_static_disk_entry_is_served_without_revalidation(monkeypatch, tmp_path):
+    """Static metadata persisted on disk is not fetched again after a restart."""
+    clock = FakeClock()
+    monkeypatch.setattr(cache, "time", clock)
+    monkeypatch.setattr(settings, "CACHE_ENABLED", True)
+    calls = _count_upstream(monkeypatch)
+
+    async def read():
+        _use_tiers(monkeypatch, cache.DiskCache(str(tmp_path), 1024 * 1024, "test"))
+        content = await utils.make_api_request("GET", "/api/2.0/clusters/spark-versions")
+        await asyncio.gather(*utils._revalidations)
+        return content
+
+    first = asyncio.run(read())
+    warm = asyncio.run(read())
+    assert warm == first
+    assert len(calls) == 1
+
+
+def test_uncached_read_goes_upstream_and_refreshes_the_cache(monkeypatch):
+    """A read that must not be stale bypasses the cache and replaces the cached response."""
+    monkeypatch.setattr(cache, "time", FakeClock())
+    monkeypatch.setattr(settings, "CACHE_ENABLED", True)
+    _use_tiers(monkeypatch, None)
+    calls = _count_upstream(monkeypatch)
+    params = {"path": "/data/file.bin"}
+
+    async def scenario():
+        await utils.make_api_request("GET", "/api/2.0/dbfs/get-status", params=params)
+        fresh = await utils.make_api_request("GET", "/api/2.0/dbfs/get-status", params=params, use_cache=False)
+        cached = await utils.make_api_request("GET", "/api/2.0/dbfs/get-status", params=params)
+        return fresh, cached
+
+    fresh, cached = asyncio.run(scenario())
+    assert fresh["call"] == 2
+    assert cached == fresh
+    assert len(calls) == 2
@@ -0,0 +1,62 @@
+"""
+Tests of the in-memory job index.
+"""
+
+import asyncio
+
+from src.api import job_index, jobs
+
+
+def _job(job_id):
+    return {"job_id": job_id, "settings": {"name": f"job {job_id}"}, "creator_user_name": "someone"}
+
+
+def test_job_created_during_a_refresh_is_kept(monkeypatch):
+    """A job re-fetched while a refresh lists the workspace is not swept by that refresh."""
+    index = job_index.JobIndex(3600)
+
+    async def scenario():
+        listed = asyncio.Event()
+        resume = asyncio.Event()
+
+        async def iter_jobs():
+            yield _job(1)
+            listed.set()
+            # Job 2 is created after this page of the listing was read
+            await resume.wait()
+
+        async def get_job(job_id):
+            return _job(job_id)
+
+        monkeypatch.setattr(jobs, "iter_jobs", iter_jobs)
+        monkeypatch.setattr(jobs, "get_job", get_job)
+
+        refresh = asyncio.create_task(index.refresh())
+        await listed.wait()
+        index.mark_dirty(2)
+        await index._refresh_dirty()
+        resume.set()
+        await refresh
+
+    asyncio.run(scenario())
+    assert sorted(index._jobs) == [1, 2]
+    assert not index._dirty
+
+
+def test_refresh_removes_jobs_missing_from_the_listing(monkeypatch):
+    """Jobs deleted outside the server disappear from the index on the next refresh."""
+    index = job_index.JobIndex(3600)
+    listings = [[_job(1), _job(2)], [_job(1)]]
+
+    async def iter_jobs():
+        for job in listings.pop(0):
+            yield job
+
+    monkeypatch.setattr(jobs, "iter_jobs", iter_jobs)
+
+    async def scenario():
+        await index.refresh()
+        await index.refresh()
+
+    asyncio.run(scenario())
+    assert sorted(index._jobs) == [1]
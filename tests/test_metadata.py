@@ -0,0 +1,31 @@
+"""
+Tests of the invalidation of the Unity Catalog metadata index by write statements.
+"""
+
+from src.api.metadata import MetadataIndex
+
+
+def _index():
+    index = MetadataIndex(3600)
+    for key in (("main", "sales"), ("main", "ops"), ("other", "s")):
+        index._schema_loaded_at[key] = 0
+    return index
+
+
+def test_unqualified_target_marks_the_default_schema_stale():
+    index = _index()
+    index.on_write_statement("ALTER TABLE t ADD COLUMN c INT", "main", "ops")
+    assert index._stale == {("main", "ops")}
+
+
+def test_mixed_names_mark_qualified_and_default_schemas_stale():
+    """Unqualified names are not dropped when the statement also names qualified ones."""
+    index = _index()
+    index.on_write_statement("INSERT INTO main.sales.t SELECT * FROM u", "main", "ops")
+    assert index._stale == {("main", "sales"), ("main", "ops")}
+
+
+def test_qualified_names_only_leave_the_default_schema_alone():
+    index = _index()
+    index.on_write_statement("CREATE TABLE IF NOT EXISTS other.s.t (x INT) USING DELTA", "main", "ops")
+    assert index._stale == {("other", "s")}
@@ -0,0 +1,39 @@
+"""
+Tests of the classification of SQL statements for the result cache.
+"""
+
+import pytest
+
+from src.api import sql
+
+
+@pytest.mark.parametrize("statement", [
+    "SELECT replace(name, 'a', 'b') FROM t",
+    "select merge_col, update_time from t",
+    "-- drop the old rows later\nSELECT 1",
+    "WITH a AS (SELECT 1), b (x) AS (SELECT 2) SELECT * FROM a, b",
+    "(SELECT 1) UNION (SELECT 2)",
+    "SHOW TABLES IN main.default",
+])
+def test_read_statements_are_not_writes(statement):
+    """Write keywords in identifiers, functions or comments do not make a statement a write."""
+    assert not sql._is_write_statement(statement)
+
+
+@pytest.mark.parametrize("statement", [
+    "INSERT INTO t VALUES (1)",
+    "WITH a AS (SELECT 1) INSERT INTO t SELECT * FROM a",
+    "MERGE INTO t USING s ON t.id = s.id WHEN MATCHED THEN UPDATE SET *",
+    "/* nightly */ ALTER TABLE t ADD COLUMN c INT",
+    "SELECT 1; DROP TABLE t",
+    "USE CATALOG main",
+])
+def test_write_statements_are_detected(statement):
+    """Statements led by anything but a read-only keyword are writes."""
+    assert sql._is_write_statement(statement)
+    assert not sql.is_cacheable_statement(statement)
+
+
+def test_non_deterministic_reads_are_not_cacheable():
+    assert sql.is_cacheable_statement("SELECT replace(name, 'a', 'b') FROM t")
+    assert not sql.is_cacheable_statement("SELECT now()")